@@ -1,9 +1,4 @@
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath("../address-validation-international-python/REST"))
-
-from get_address_info_rest import get_address_info
+from address_validation_international import get_address_info
 
 def get_address_info_rest_sdk_go(is_live: bool, license_key: str) -> None:
    
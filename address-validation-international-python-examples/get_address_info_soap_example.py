@@ -1,9 +1,4 @@
-import sys
-import os
-
-sys.path.insert(0, os.path.abspath("../address-validation-international-python/SOAP"))
-
-from get_address_info_soap import GetAddressInfoSoap
+from address_validation_international import GetAddressInfoSoap
 
 def get_address_info_soap_sdk_go(is_live: bool, license_key: str) -> None:
    
@@ -0,0 +1,80 @@
+"""
+Service Objects Address Validation International (AVI) clients.
+
+Every public class and function of the REST, asyncio and SOAP clients is available from this
+package, e.g. ``from address_validation_international import AVIRestClient``. Names are
+resolved on first use: importing the package loads none of its modules, so requests, aiohttp,
+suds, pandas and pyarrow are only imported by the client or helper that needs them.
+"""
+from importlib import import_module
+
+__version__ = "1.0.0"
+
+# Public name -> module (relative to this package) that defines it
+_EXPORTS = {
+    # REST
+    "AVIRestClient": ".get_address_info_rest",
+    "get_address_info": ".get_address_info_rest",
+    "get_default_client": ".get_address_info_rest",
+    "validate_many": ".get_address_info_rest",
+    # asyncio
+    "AVIAsyncRestClient": ".get_address_info_rest_async",
+    "get_address_info_async": ".get_address_info_rest_async",
+    "get_default_async_client": ".get_address_info_rest_async",
+    # SOAP
+    "GetAddressInfoSoap": ".soap.get_address_info_soap",
+    "AVISoapLiteClient": ".soap.get_address_info_soap_lite",
+    # Models and parsing
+    "AddressInfo": ".avi_response",
+    "AddressInfoResponse": ".avi_response",
+    "Error": ".avi_response",
+    "GetAddressInfoInput": ".avi_response",
+    "InformationComponent": ".avi_response",
+    "loads": ".avi_response",
+    "parse_response": ".avi_response",
+    # Options and helpers
+    "BatchResult": ".avi_batch",
+    "DedupStats": ".avi_batch",
+    "ResponseCache": ".avi_cache",
+    "SQLiteCacheBackend": ".avi_cache",
+    "EndpointHealth": ".avi_health",
+    "default_endpoint_health": ".avi_health",
+    "HedgePolicy": ".avi_hedging",
+    "AdaptiveLimiter": ".avi_limiter",
+    "LimiterPolicy": ".avi_limiter",
+    "LimiterTimeout": ".avi_limiter",
+    "CallEvent": ".avi_metrics",
+    "MetricsCollector": ".avi_metrics",
+    "serve_metrics": ".avi_metrics",
+    "find_country": ".avi_countries",
+    "canonical_key": ".avi_canonical",
+    "CassetteMiss": ".avi_cassette",
+    "CassettePlayer": ".avi_cassette",
+    "CassetteRecorder": ".avi_cassette",
+    "CassetteStats": ".avi_cassette",
+    "ReplayLatency": ".avi_cassette",
+    "prevalidate": ".avi_prevalidation",
+    "prevalidate_many": ".avi_prevalidation",
+    "DeadlineExceeded": ".avi_retry",
+    "RetryPolicy": ".avi_retry",
+    "RetryableError": ".avi_retry",
+    "ShardConfig": ".avi_sharded",
+    "ShardedRunner": ".avi_sharded",
+    "validate_frame": ".avi_frame",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cache it on the package, so later lookups do not come back here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,157 @@
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional
+
+from .avi_response import GetAddressInfoInput
+
+# How many distinct keys a deduplicating batch remembers; older ones are validated again if they recur
+DEDUP_WINDOW = 10000
+
+
+@dataclass
+class BatchResult:
+    index: int
+    input: GetAddressInfoInput
+    response: Optional[Any] = None
+    exception: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+    def __str__(self) -> str:
+        outcome = f"exception={self.exception!r}" if self.exception is not None else f"response={self.response}"
+        return f"BatchResult: index={self.index}, {outcome}"
+
+
+def exception_text(exception: BaseException) -> str:
+    """How a failed input's exception is written in Exception columns: "TypeName: message"."""
+    return f"{type(exception).__name__}: {exception}"
+
+
+@dataclass
+class DedupStats:
+    # rows: inputs of deduplicated batches; duplicates: rows answered with an earlier row's result, without a call
+    rows: int = 0
+    duplicates: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Share of rows that were duplicates, from 0 to 1."""
+        return self.duplicates / self.rows if self.rows else 0.0
+
+    def __str__(self) -> str:
+        return f"DedupStats: rows={self.rows}, duplicates={self.duplicates}, ratio={self.ratio:.3f}"
+
+
+def _run_one(call: Callable[[GetAddressInfoInput], Any], index: int, item: GetAddressInfoInput) -> BatchResult:
+    try:
+        return BatchResult(index=index, input=item, response=call(item))
+    except Exception as exc:
+        return BatchResult(index=index, input=item, exception=exc)
+
+
+def _fan_out(source: Future, index: int, item: GetAddressInfoInput) -> Future:
+    # A future for a duplicate input, completed with the outcome of source, its first occurrence
+    future: Future = Future()
+
+    def copy(done: Future) -> None:
+        if done.cancelled():
+            future.cancel()
+        # False if the duplicate itself was cancelled, when the caller stopped iterating
+        elif future.set_running_or_notify_cancel():
+            result = done.result()
+            future.set_result(BatchResult(index=index, input=item, response=result.response,
+                                          exception=result.exception))
+
+    source.add_done_callback(copy)
+    return future
+
+
+def run_batch(
+    call: Callable[[GetAddressInfoInput], Any],
+    inputs: Iterable[GetAddressInfoInput],
+    max_workers: int = 8,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    key: Optional[Callable[[GetAddressInfoInput], Hashable]] = None,
+    dedup_window: int = DEDUP_WINDOW,
+    on_row: Optional[Callable[[bool], None]] = None,
+) -> Iterator[BatchResult]:
+    """
+    Run call over inputs on a bounded thread pool, yielding one BatchResult per input.
+
+    Inputs are pulled lazily, so at most max_in_flight items are submitted but not yet
+    yielded at any time, however long the input iterable is.
+
+    With a key function, call runs once per distinct key: an input whose key matches one of the
+    last dedup_window distinct keys gets a BatchResult with that earlier input's response (the same
+    object) or exception, as soon as it is available.
+
+    Parameters:
+        call: Validates a single input and returns its response.
+        inputs: The addresses to validate. May be a generator.
+        max_workers: Number of worker threads.
+        max_in_flight: Maximum number of submitted but not yet yielded inputs. Defaults to 2 * max_workers.
+        ordered: Yield results in input order when True, as they complete otherwise.
+        key: Optional function mapping an input to the key inputs are deduplicated on.
+        dedup_window: Number of distinct keys remembered, which bounds the results held for reuse.
+        on_row: Optional callable, called for every input with True if it was answered as a duplicate.
+
+    Returns:
+        Iterator[BatchResult]: One result per input. Exceptions raised by call are captured
+        on the result rather than raised.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if max_in_flight is None:
+        max_in_flight = 2 * max_workers
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="avi-batch")
+    in_flight: "deque[Future]" = deque()
+    # Distinct key -> future of its first input, least recently seen first
+    seen: "OrderedDict[Hashable, Future]" = OrderedDict()
+    try:
+        for index, item in enumerate(inputs):
+            if len(in_flight) >= max_in_flight:
+                if ordered:
+                    yield in_flight.popleft().result()
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight.remove(future)
+                        yield future.result()
+            if key is None:
+                in_flight.append(executor.submit(_run_one, call, index, item))
+                continue
+            item_key = key(item)
+            source = seen.get(item_key)
+            if source is None:
+                future = seen[item_key] = executor.submit(_run_one, call, index, item)
+                if len(seen) > dedup_window:
+                    seen.popitem(last=False)
+            else:
+                seen.move_to_end(item_key)
+                future = _fan_out(source, index, item)
+            if on_row is not None:
+                on_row(source is not None)
+            in_flight.append(future)
+
+        # Drain whatever is still running
+        if ordered:
+            while in_flight:
+                yield in_flight.popleft().result()
+        else:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    yield future.result()
+    finally:
+        # Reached early when the caller stops iterating; drop anything not yet started
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
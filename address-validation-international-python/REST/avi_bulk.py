@@ -0,0 +1,435 @@
+"""
+Stream a CSV or JSONL file of addresses through the AVI GetAddressInfo REST service.
+
+Each input row uses the GetAddressInfoInput field names as columns (Address1 ... Address5,
+Locality, AdministrativeArea, PostalCode, Country, OutputLanguage; LicenseKey optional).
+Rows are read lazily, validated concurrently and written in input order as they complete,
+one output row per input row: the flattened AddressInfo fields plus error columns. Rows that
+repeat an earlier address, up to case, spacing and country spelling, reuse its result.
+
+A checkpoint file records how many rows have been written, so an interrupted job picks up
+where it stopped when run again with the same arguments.
+
+--record-cassette saves every answer to a cassette file; --replay-cassette answers every row
+from one instead of the service, with optional synthetic latency, for offline load tests and
+regression runs that neither need the network nor pay for calls.
+
+Usage:
+    avi-bulk addresses.csv results.csv --license-key YOUR_KEY --workers 20
+    avi-bulk addresses.csv results.csv --processes 4 --workers 16 --cache-db avi_cache.db
+    avi-bulk addresses.csv results.csv --record-cassette addresses.avic
+    avi-bulk addresses.csv replayed.csv --replay-cassette addresses.avic --replay-latency-ms 80 --processes 4
+    python -m address_validation_international.avi_bulk addresses.csv results.csv
+"""
+import argparse
+import csv
+import dataclasses
+import json
+import os
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, Optional, Union
+
+from .avi_batch import BatchResult, exception_text
+from .avi_cache import ResponseCache, SQLiteCacheBackend
+from .avi_cassette import LATENCY_DISTRIBUTIONS, CassettePlayer, CassetteRecorder, ReplayLatency
+from .avi_limiter import AdaptiveLimiter, LimiterPolicy
+from .avi_response import AddressInfo, GetAddressInfoInput
+from .get_address_info_rest import AVIRestClient
+
+INPUT_FIELDS = [field.name for field in dataclasses.fields(GetAddressInfoInput)]
+
+ADDRESS_INFO_FIELDS = [field.name for field in dataclasses.fields(AddressInfo) if field.name != "InformationComponents"]
+
+OUTPUT_FIELDS = (
+    ["Row"] + ADDRESS_INFO_FIELDS
+    + ["InformationComponents", "ErrorType", "ErrorTypeCode", "ErrorDesc", "ErrorDescCode", "Exception"]
+)
+
+
+def _detect_format(path: str, explicit: Optional[str]) -> str:
+    if explicit:
+        return explicit
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+@dataclasses.dataclass
+class RejectedRow:
+    """An input row that could not be read; it is written out with its exception instead of being validated."""
+    exception: Exception
+
+
+def _to_input(record: dict, license_key: Optional[str], is_live: bool) -> GetAddressInfoInput:
+    values = {name: record.get(name) for name in INPUT_FIELDS if record.get(name) not in (None, "")}
+    values.setdefault("LicenseKey", license_key)
+    values["IsLive"] = is_live
+    # CSV values are all text, so typed fields are converted here rather than failing in every call
+    if "TimeoutSeconds" in values:
+        try:
+            values["TimeoutSeconds"] = float(values["TimeoutSeconds"])
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid TimeoutSeconds {values['TimeoutSeconds']!r}: {exc}") from exc
+    return GetAddressInfoInput(**values)
+
+
+def read_inputs(
+    handle: IO[str], file_format: str, license_key: Optional[str], is_live: bool
+) -> Iterator[Union[GetAddressInfoInput, RejectedRow]]:
+    """
+    Lazily yield one GetAddressInfoInput per row of a CSV or JSONL stream, or a RejectedRow for a
+    row that cannot be read, so one bad row fails on its own instead of stopping the job.
+    """
+    if file_format == "csv":
+        for record in csv.DictReader(handle):
+            yield _read_row(record, license_key, is_live)
+    else:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield RejectedRow(ValueError(f"Invalid JSON on line {line_number}: {exc}"))
+                continue
+            if not isinstance(record, dict):
+                yield RejectedRow(ValueError(f"Line {line_number} is not a JSON object"))
+                continue
+            yield _read_row(record, license_key, is_live)
+
+
+def _read_row(record: dict, license_key: Optional[str], is_live: bool) -> Union[GetAddressInfoInput, RejectedRow]:
+    try:
+        return _to_input(record, license_key, is_live)
+    except ValueError as exc:
+        return RejectedRow(exc)
+
+
+def validate_rows(
+    client: AVIRestClient, rows: Iterable[Union[GetAddressInfoInput, RejectedRow]], **options
+) -> Iterator[BatchResult]:
+    """
+    client.validate_many (with ordered=True and options) over rows from read_inputs. A RejectedRow is
+    not sent; its BatchResult carries its exception and keeps its place among the others.
+    """
+    # Rejected rows wait here until every row before them has been yielded
+    rejected: "deque[BatchResult]" = deque()
+    # Row index of each input handed to validate_many, which numbers only those
+    positions: "deque[int]" = deque()
+
+    def accepted() -> Iterator[GetAddressInfoInput]:
+        for index, row in enumerate(rows):
+            if isinstance(row, RejectedRow):
+                rejected.append(BatchResult(index=index, input=None, exception=row.exception))
+            else:
+                positions.append(index)
+                yield row
+
+    for result in client.validate_many(accepted(), ordered=True, **options):
+        index = positions.popleft()
+        while rejected and rejected[0].index < index:
+            yield rejected.popleft()
+        yield dataclasses.replace(result, index=index)
+    yield from rejected
+
+
+def flatten_result(row: int, result: BatchResult) -> dict:
+    """Flatten one BatchResult into an output record keyed by OUTPUT_FIELDS."""
+    record = dict.fromkeys(OUTPUT_FIELDS)
+    record["Row"] = row
+    response = result.response
+    if result.exception is not None:
+        record["Exception"] = exception_text(result.exception)
+    elif response is not None:
+        if response.AddressInfo:
+            for name in ADDRESS_INFO_FIELDS:
+                record[name] = getattr(response.AddressInfo, name)
+            record["InformationComponents"] = [
+                {"Name": component.Name, "Value": component.Value}
+                for component in response.AddressInfo.InformationComponents
+            ]
+        if response.Error:
+            record["ErrorType"] = response.Error.Type
+            record["ErrorTypeCode"] = response.Error.TypeCode
+            record["ErrorDesc"] = response.Error.Desc
+            record["ErrorDescCode"] = response.Error.DescCode
+    return record
+
+
+class ResultWriter:
+    def __init__(self, handle: IO[str], file_format: str, write_header: bool):
+        self._handle = handle
+        self._format = file_format
+        if file_format == "csv":
+            self._writer = csv.DictWriter(handle, fieldnames=OUTPUT_FIELDS)
+            if write_header:
+                self._writer.writeheader()
+
+    def write(self, record: dict) -> None:
+        if self._format == "csv":
+            components = record["InformationComponents"]
+            if components is not None:
+                record = dict(record, InformationComponents=json.dumps(components, ensure_ascii=False))
+            self._writer.writerow(record)
+        else:
+            self._handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def sync(self) -> int:
+        """Flush buffered rows to disk and return the resulting file size in bytes."""
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        return os.fstat(self._handle.fileno()).st_size
+
+
+class Checkpoint:
+    def __init__(self, path: str):
+        """
+        Progress record for one job: how many input rows have been written and the output
+        file size at that point. Written atomically, so a crash never leaves it half-written.
+        """
+        self.path = path
+        self.rows_done = 0
+        self.output_bytes = 0
+        self.completed = False
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as handle:
+                state = json.load(handle)
+            self.rows_done = state["rows_done"]
+            self.output_bytes = state["output_bytes"]
+            self.completed = state.get("completed", False)
+
+    def save(self, rows_done: int, output_bytes: int, completed: bool = False) -> None:
+        self.rows_done, self.output_bytes, self.completed = rows_done, output_bytes, completed
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"rows_done": rows_done, "output_bytes": output_bytes, "completed": completed}, handle)
+        os.replace(temp_path, self.path)
+
+
+def build_limiter(workers: int, max_qps: Optional[float], adaptive: bool) -> Optional[AdaptiveLimiter]:
+    """Return the limiter for --max-qps and --adaptive, or None when neither is set."""
+    if not max_qps and not adaptive:
+        return None
+    # Without adaptive the concurrency stays at workers and only the rate is capped
+    return AdaptiveLimiter(LimiterPolicy(
+        rate=max_qps,
+        initial_limit=max(1, workers // 4) if adaptive else workers,
+        min_limit=1 if adaptive else workers,
+        max_limit=workers,
+    ))
+
+
+def run(args: argparse.Namespace) -> int:
+    input_format = _detect_format(args.input, args.input_format)
+    output_format = _detect_format(args.output, args.output_format)
+    checkpoint = Checkpoint(args.checkpoint or os.path.normpath(args.output) + ".checkpoint")
+
+    if checkpoint.completed:
+        print(f"Already complete: {checkpoint.rows_done} rows in {args.output}. "
+              f"Delete {checkpoint.path} to run again.", file=sys.stderr)
+        return 0
+
+    if args.per_shard:
+        return _run_per_shard(args, input_format, output_format, checkpoint)
+
+    resuming = checkpoint.rows_done > 0 and os.path.exists(args.output)
+    if resuming:
+        # Drop any rows written after the last checkpoint; they are validated again below
+        with open(args.output, "r+b") as handle:
+            handle.truncate(checkpoint.output_bytes)
+        print(f"Resuming after row {checkpoint.rows_done}", file=sys.stderr)
+    else:
+        checkpoint.save(0, 0)
+
+    started = time.monotonic()
+    skipped = rows_done = checkpoint.rows_done
+    failures = 0
+    with open(args.input, "r", encoding="utf-8-sig", newline="") as input_handle, \
+            open(args.output, "a" if resuming else "w", encoding="utf-8", newline="") as output_handle:
+        writer = ResultWriter(output_handle, output_format, write_header=not resuming)
+        inputs = islice(read_inputs(input_handle, input_format, args.license_key, not args.trial), skipped, None)
+
+        if args.processes > 1:
+            from .avi_sharded import ShardedRunner
+            runner = ShardedRunner(_shard_config(args, output_format), args.processes, args.chunk_size)
+            saved = rows_done
+            for chunk in runner.run(inputs, first_row=skipped + 1):
+                output_handle.write(chunk.text)
+                rows_done += chunk.rows
+                failures += chunk.failures
+                if rows_done - saved >= args.checkpoint_every:
+                    checkpoint.save(rows_done, writer.sync())
+                    saved = rows_done
+                    _report(rows_done, failures, started)
+            checkpoint.save(rows_done, writer.sync(), completed=True)
+            _report(rows_done, failures, started)
+            print(runner.stats(), file=sys.stderr)
+            return 0
+
+        limiter = build_limiter(args.workers, args.max_qps, args.adaptive)
+        cassette = _cassette(args)
+        client = AVIRestClient(pool_size=args.workers, cache=_cache(args), prevalidate=args.prevalidate,
+                               limiter=limiter, cassette=cassette, **_endpoints(args))
+        try:
+            for result in validate_rows(client, inputs, max_workers=args.workers, dedup=not args.no_dedup):
+                row = skipped + result.index + 1
+                record = flatten_result(row, result)
+                if record["Exception"] or record["ErrorTypeCode"]:
+                    failures += 1
+                writer.write(record)
+                rows_done = row
+                if rows_done % args.checkpoint_every == 0:
+                    checkpoint.save(rows_done, writer.sync())
+                    _report(rows_done, failures, started)
+            checkpoint.save(rows_done, writer.sync(), completed=True)
+        finally:
+            client.close()
+            if cassette is not None:
+                cassette.close()
+
+    _report(rows_done, failures, started)
+    if not args.no_dedup:
+        print(client.dedup_stats(), file=sys.stderr)
+    if limiter is not None:
+        print(limiter.stats(), file=sys.stderr)
+    if isinstance(cassette, CassettePlayer):
+        print(cassette.stats(), file=sys.stderr)
+    elif cassette is not None:
+        print(f"{len(cassette)} answers recorded to {cassette.path}", file=sys.stderr)
+    return 0
+
+
+def _run_per_shard(args: argparse.Namespace, input_format: str, output_format: str, checkpoint: "Checkpoint") -> int:
+    # Workers write every chunk to its own part file; parts left by an interrupted run are skipped
+    from .avi_sharded import ShardedRunner
+    os.makedirs(args.output, exist_ok=True)
+    config = _shard_config(args, output_format)
+    config.parts_dir = args.output
+    runner = ShardedRunner(config, args.processes, args.chunk_size)
+    started = time.monotonic()
+    with open(args.input, "r", encoding="utf-8-sig", newline="") as input_handle:
+        inputs = read_inputs(input_handle, input_format, args.license_key, not args.trial)
+        reported = 0
+        for _ in runner.run(inputs, ordered=False, skip_parts=True):
+            stats = runner.stats()
+            if stats.rows - reported >= args.checkpoint_every:
+                reported = stats.rows
+                _report(stats.rows, stats.failures, started)
+    stats = runner.stats()
+    checkpoint.save(stats.rows, 0, completed=True)
+    _report(stats.rows, stats.failures, started)
+    print(stats, file=sys.stderr)
+    return 0
+
+
+def _cache(args: argparse.Namespace) -> Optional[ResponseCache]:
+    if not args.cache_db:
+        return None
+    return ResponseCache(maxsize=args.cache_size, backend=SQLiteCacheBackend(args.cache_db))
+
+
+def _replay_latency(args: argparse.Namespace) -> Optional[ReplayLatency]:
+    if not args.replay_latency_ms and args.replay_distribution != "recorded":
+        return None
+    return ReplayLatency(latency_ms=args.replay_latency_ms, distribution=args.replay_distribution,
+                         scale=args.replay_scale)
+
+
+def _cassette(args: argparse.Namespace):
+    if args.replay_cassette:
+        return CassettePlayer(args.replay_cassette, _replay_latency(args))
+    if args.record_cassette:
+        return CassetteRecorder(args.record_cassette)
+    return None
+
+
+def _endpoints(args: argparse.Namespace) -> dict:
+    return {name: getattr(args, name) for name in ("primary_url", "backup_url", "trial_url") if getattr(args, name)}
+
+
+def _shard_config(args: argparse.Namespace, output_format: str):
+    from .avi_sharded import ShardConfig
+    return ShardConfig(output_format=output_format, threads=args.workers, cache_db=args.cache_db,
+                       cache_size=args.cache_size, max_qps=args.max_qps, adaptive=args.adaptive,
+                       prevalidate=args.prevalidate, dedup=not args.no_dedup, endpoints=_endpoints(args),
+                       replay_cassette=args.replay_cassette, replay_latency=_replay_latency(args))
+
+
+def _report(rows_done: int, failures: int, started: float) -> None:
+    elapsed = max(time.monotonic() - started, 1e-9)
+    print(f"{rows_done} rows written, {failures} with errors, {elapsed:.1f}s elapsed", file=sys.stderr)
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="avi-bulk", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("input", help="CSV or JSONL file of addresses.")
+    parser.add_argument("output", help="CSV or JSONL file to write results to.")
+    parser.add_argument("--license-key", default=os.environ.get("AVI_LICENSE_KEY"),
+                        help="License key for rows without a LicenseKey column. Defaults to $AVI_LICENSE_KEY.")
+    parser.add_argument("--trial", action="store_true", help="Use the trial endpoint instead of the live ones.")
+    parser.add_argument("--workers", type=_positive_int, default=10,
+                        help="Concurrent validations (default 10), per process with --processes.")
+    parser.add_argument("--processes", type=_positive_int, default=1,
+                        help="Worker processes (default 1). Above 1, chunks of rows are validated and written "
+                             "in separate processes; share a --cache-db between them.")
+    parser.add_argument("--chunk-size", type=_positive_int, default=500, help="Rows per chunk with --processes (default 500).")
+    parser.add_argument("--per-shard", action="store_true",
+                        help="Treat OUTPUT as a directory and have workers write each chunk to its own part file, "
+                             "in no particular order. Keep --chunk-size the same when resuming.")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"), help="Defaults to the input file extension.")
+    parser.add_argument("--output-format", choices=("csv", "jsonl"), help="Defaults to the output file extension.")
+    parser.add_argument("--checkpoint", help="Checkpoint file. Defaults to OUTPUT.checkpoint.")
+    parser.add_argument("--checkpoint-every", type=_positive_int, default=1000,
+                        help="Rows between checkpoints (default 1000).")
+    parser.add_argument("--cache-db", help="Optional SQLite response cache shared across runs.")
+    parser.add_argument("--cache-size", type=int, default=100000, help="In-memory cache entries (default 100000).")
+    parser.add_argument("--prevalidate", action="store_true",
+                        help="Answer rows the service would reject with a local Error instead of a paid call.")
+    parser.add_argument("--no-dedup", action="store_true",
+                        help="Validate every row, even rows that repeat an earlier address with different case, "
+                             "spacing or country spelling.")
+    parser.add_argument("--max-qps", type=float,
+                        help="Cap on calls started per second, e.g. your license's QPS limit; per process with --processes.")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Adapt concurrency (up to --workers) to the service's latency, timeouts and errors.")
+    parser.add_argument("--primary-url", help="Override the primary endpoint URL, e.g. to point at a local stand-in.")
+    parser.add_argument("--backup-url", help="Override the backup endpoint URL.")
+    parser.add_argument("--trial-url", help="Override the trial endpoint URL.")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record-cassette", metavar="PATH",
+                          help="Record every answer the service gives to this cassette file, for --replay-cassette. "
+                               "Not supported with --processes.")
+    cassette.add_argument("--replay-cassette", metavar="PATH",
+                          help="Answer every row from this cassette file instead of calling the service. "
+                               "Rows it did not record fail with a CassetteMiss exception.")
+    parser.add_argument("--replay-latency-ms", type=float, default=0.0,
+                        help="Synthetic latency of each replayed call, in milliseconds (default 0).")
+    parser.add_argument("--replay-distribution", choices=LATENCY_DISTRIBUTIONS, default="fixed",
+                        help="How replayed latency is drawn around --replay-latency-ms (default fixed); "
+                             "recorded replays the latency each call had when it was recorded.")
+    parser.add_argument("--replay-scale", type=float, default=1.0,
+                        help="Multiplier for recorded latencies with --replay-distribution recorded (default 1).")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.record_cassette and (args.processes > 1 or args.per_shard):
+        # Every process would write its own file; record in one process, then replay in many
+        parser.error("--record-cassette records from a single process; drop --processes and --per-shard")
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
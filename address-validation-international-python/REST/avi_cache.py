@@ -0,0 +1,165 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .avi_canonical import address_key
+
+# Entries are keyed by the canonical address (see avi_canonical.address_key), so inputs that differ
+# only in spacing, case, Unicode form or country spelling share one
+cache_key = address_key
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    backend_hits: int = 0
+
+    def __str__(self) -> str:
+        return (f"CacheStats: hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+                f"expirations={self.expirations}, backend_hits={self.backend_hits}")
+
+
+class SQLiteCacheBackend:
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Persistent cache tier stored in a SQLite database. Safe to share between threads and
+        between processes pointing at the same file.
+
+        path: Database file; created if missing.
+        timeout: Seconds to wait for a lock held by another process.
+        """
+        self.path = os.path.abspath(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS avi_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections cannot be shared between threads, so each thread opens its own
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Tuple[dict, float]]:
+        """Return (value, expires_at) for key, or None if it is missing or expired."""
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM avi_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: dict, expires_at: float) -> None:
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO avi_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, separators=(",", ":")), expires_at),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._connection() as connection:
+            return connection.execute("DELETE FROM avi_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def clear(self) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM avi_cache")
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class ResponseCache:
+    def __init__(self, maxsize: int = 10000, ttl: float = 86400, backend: Optional[SQLiteCacheBackend] = None):
+        """
+        Opt-in cache of successful GetAddressInfo results: an in-memory LRU with a TTL, in
+        front of an optional persistent backend shared across processes.
+
+        Values are the JSON-shaped result payload (a dict), so the same cache can sit in
+        front of the REST and SOAP clients. Clients only store results without an Error;
+        error payloads and transport failures are never cached.
+
+        maxsize: Maximum number of entries held in memory.
+        ttl: Seconds an entry stays valid, in memory and in the backend.
+        backend: Optional persistent tier, consulted on a memory miss.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backend = backend
+        self._entries: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached payload for key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry[0]
+                del self._entries[key]
+                self._stats.expirations += 1
+
+        if self.backend is not None:
+            stored = self.backend.get(key)
+            if stored is not None:
+                with self._lock:
+                    self._store(key, stored[0], stored[1])
+                    self._stats.hits += 1
+                    self._stats.backend_hits += 1
+                return stored[0]
+
+        with self._lock:
+            self._stats.misses += 1
+        return None
+
+    def set(self, key: str, value: dict) -> None:
+        """Cache a successful result payload under key."""
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._store(key, value, expires_at)
+        if self.backend is not None:
+            self.backend.set(key, value, expires_at)
+
+    def _store(self, key: str, value: dict, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def clear(self) -> None:
+        """Drop every in-memory entry. The persistent backend is left untouched."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,77 @@
+import unicodedata
+from typing import Hashable, Optional
+
+from .avi_countries import find_country
+from .avi_response import GetAddressInfoInput
+
+# Separates fields in a key; cannot appear in a canonical field value, as it is whitespace to str.split
+KEY_SEPARATOR = "\x1f"
+
+
+def canonical_text(value: Optional[str]) -> str:
+    """
+    Reduce one input field to its canonical form: whitespace trimmed and collapsed to single spaces,
+    case folded and in Unicode NFC, so "27 E  Cota St" matches "27 e cota st", and an accented letter
+    typed with a combining mark matches its precomposed form. None and blank values become "".
+    """
+    if not value:
+        return ""
+    text = " ".join(str(value).split()).casefold()
+    return text if text.isascii() else unicodedata.normalize("NFC", text)
+
+
+def canonical_country(value: Optional[str]) -> str:
+    """
+    Canonical form of a Country: the ISO 3166-1 alpha-3 code of a recognized code, name or common
+    alternative name (so "US", "USA" and "United States" match), otherwise canonical_text(value).
+    """
+    text = canonical_text(value)
+    country = find_country(text)
+    return country.Alpha3 if country is not None else text
+
+
+def address_key(
+    address1: Optional[str],
+    address2: Optional[str],
+    address3: Optional[str],
+    address4: Optional[str],
+    address5: Optional[str],
+    locality: Optional[str],
+    administrative_area: Optional[str],
+    postal_code: Optional[str],
+    country: Optional[str],
+    output_language: Optional[str],
+) -> str:
+    """
+    Build the canonical key of a GetAddressInfo input from its fields.
+
+    Inputs with the same key get the same answer from the service: every field is compared in its
+    canonical_text form, Country with canonical_country, and a blank OutputLanguage as ENGLISH, the
+    service's default. The license key and live/trial setting are not part of the key.
+    """
+    return KEY_SEPARATOR.join((
+        canonical_text(address1),
+        canonical_text(address2),
+        canonical_text(address3),
+        canonical_text(address4),
+        canonical_text(address5),
+        canonical_text(locality),
+        canonical_text(administrative_area),
+        canonical_text(postal_code),
+        canonical_country(country),
+        canonical_text(output_language) or "english",
+    ))
+
+
+def canonical_key(item: GetAddressInfoInput) -> str:
+    """Return the canonical key of item's address fields (see address_key)."""
+    return address_key(item.Address1, item.Address2, item.Address3, item.Address4, item.Address5, item.Locality,
+                       item.AdministrativeArea, item.PostalCode, item.Country, item.OutputLanguage)
+
+
+def batch_key(item: GetAddressInfoInput) -> Hashable:
+    """
+    The key validate_many deduplicates inputs on: the canonical address plus the license key and
+    live/trial setting, which can change the outcome.
+    """
+    return canonical_key(item), item.LicenseKey, item.IsLive
@@ -0,0 +1,298 @@
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from .avi_canonical import KEY_SEPARATOR
+from .avi_response import loads
+
+# File layout, all integers little-endian:
+#   header   MAGIC, flags (u32), reserved (u32)
+#   records  key length (u32), payload length (u32), recorded latency in ms (f32), key, payload
+#   index    one (16-byte key digest, record offset (u64)) entry per record, sorted by digest
+#   fan-out  2 ** fan-out bits u32 counts: entry i holds how many digests have their top bits <= i
+#   footer   index offset (u64), entry count (u64), fan-out bits (u32), reserved (u32), INDEX_MAGIC
+MAGIC = b"AVICAS\x00\x01"
+INDEX_MAGIC = b"AVICAIDX"
+_HEADER = struct.Struct("<8sII")
+_RECORD = struct.Struct("<IIf")
+_ENTRY = struct.Struct("<16sQ")
+_COUNT = struct.Struct("<I")
+_FOOTER = struct.Struct("<QQII8s")
+_DIGEST_SIZE = 16
+# The fan-out table narrows a lookup to about this many index entries before the binary search
+_BUCKET_SIZE = 8
+_MAX_FAN_OUT_BITS = 20
+
+# Header flags
+COMPRESSED = 1
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal", "recorded")
+
+
+class CassetteMiss(RuntimeError):
+    """Raised when a replayed call's address was never recorded in the cassette."""
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+
+
+def _bucket(digest: bytes, bits: int) -> int:
+    return int.from_bytes(digest[:4], "big") >> (32 - bits) if bits else 0
+
+
+def _is_failover_error(payload: dict) -> bool:
+    error = payload.get("Error")
+    return bool(error) and error.get("TypeCode") == "3"
+
+
+class CassetteRecorder:
+    def __init__(self, path: str, compress: bool = True):
+        """
+        Records the answers a client gets from the service into a cassette file, for CassettePlayer
+        to replay. Pass it to a client as cassette=; one recorder can be shared by several clients
+        (REST, asyncio and SOAP) and threads.
+
+        Each distinct address (by avi_canonical key) is stored once, with the first answer the
+        service gave and how long the call took. Answers with an Error are recorded, as they are
+        the service's answer to that address, except TypeCode 3, which is a transient failure.
+        Transport failures are never recorded.
+
+        The file is written to path + ".tmp" and moved to path, with its index, by close(), so
+        an interrupted recording never leaves a truncated cassette behind.
+
+        path: Cassette file to create. An existing file is replaced on close().
+        compress: zlib-compress each payload, which makes typical GetAddressInfo answers about
+            three times smaller.
+        """
+        self.path = os.path.abspath(path)
+        self.compress = compress
+        self._handle = open(self.path + ".tmp", "wb")
+        self._handle.write(_HEADER.pack(MAGIC, COMPRESSED if compress else 0, 0))
+        # Digest -> record offset; written out, sorted, as the index
+        self._index: Dict[bytes, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def record(self, key: str, payload: dict, latency: Optional[float] = None) -> bool:
+        """
+        Store payload, the JSON-shaped GetAddressInfo answer, under key.
+
+        Parameters:
+            key: The canonical address key (avi_canonical.address_key).
+            payload: The answer, as the REST service returns it.
+            latency: Seconds the call took, replayed by ReplayLatency(distribution="recorded").
+
+        Returns:
+            bool: Whether it was stored: False for a key already recorded, a TypeCode 3 answer or
+            a closed recorder.
+        """
+        if _is_failover_error(payload):
+            return False
+        digest = _digest(key)
+        if digest in self._index:
+            return False
+        key_bytes = key.encode("utf-8")
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if self.compress:
+            data = zlib.compress(data)
+        record = _RECORD.pack(len(key_bytes), len(data), (latency or 0.0) * 1000.0) + key_bytes + data
+        with self._lock:
+            if self._closed or digest in self._index:
+                return False
+            self._index[digest] = self._handle.tell()
+            self._handle.write(record)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        """Write the index and move the finished cassette to path. Later record calls are ignored."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            index_offset = self._handle.tell()
+            bits = min(max(len(self._index) // _BUCKET_SIZE, 1).bit_length() - 1, _MAX_FAN_OUT_BITS)
+            fan_out = [0] * (1 << bits)
+            for digest in sorted(self._index):
+                self._handle.write(_ENTRY.pack(digest, self._index[digest]))
+                fan_out[_bucket(digest, bits)] += 1
+            total = 0
+            for bucket, count in enumerate(fan_out):
+                total += count
+                fan_out[bucket] = total
+            self._handle.write(struct.pack(f"<{len(fan_out)}I", *fan_out))
+            self._handle.write(_FOOTER.pack(index_offset, len(self._index), bits, 0, INDEX_MAGIC))
+            self._handle.close()
+            os.replace(self.path + ".tmp", self.path)
+
+    def __enter__(self) -> "CassetteRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+@dataclass
+class ReplayLatency:
+    """
+    Synthetic latency a CassettePlayer adds to every replayed call.
+
+    latency_ms: Median latency, in milliseconds.
+    distribution: How latency is drawn: "fixed", "uniform" (latency_ms +/- spread), "exponential"
+        (median latency_ms), "lognormal" (median latency_ms, sigma spread), or "recorded" (the
+        latency the call took when it was recorded, times scale).
+    spread: Width of the uniform and lognormal distributions (fraction of latency_ms, sigma).
+    scale: Multiplier applied to recorded latencies, e.g. 0.5 to replay twice as fast.
+    seed: Seed for the random draws, for repeatable runs.
+    """
+    latency_ms: float = 0.0
+    distribution: str = "fixed"
+    spread: float = 0.5
+    scale: float = 1.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+        self._rng = random.Random(self.seed)
+
+    def sample(self, recorded_ms: float) -> float:
+        """Draw one latency, in seconds, for an entry recorded with recorded_ms."""
+        if self.distribution == "recorded":
+            return max(recorded_ms * self.scale, 0.0) / 1000.0
+        median = self.latency_ms
+        if median <= 0 or self.distribution == "fixed":
+            return max(median, 0.0) / 1000.0
+        if self.distribution == "uniform":
+            latency = self._rng.uniform(median * (1 - self.spread), median * (1 + self.spread))
+        elif self.distribution == "exponential":
+            # Median of an exponential distribution is mean * ln 2
+            latency = self._rng.expovariate(0.6931471805599453 / median)
+        else:
+            latency = self._rng.lognormvariate(0.0, self.spread) * median
+        return max(latency, 0.0) / 1000.0
+
+
+@dataclass
+class CassetteStats:
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self) -> str:
+        return f"CassetteStats: entries={self.entries}, hits={self.hits}, misses={self.misses}"
+
+
+class CassettePlayer:
+    def __init__(self, path: str, latency: Optional[ReplayLatency] = None):
+        """
+        Answers a client's calls from a cassette written by CassetteRecorder, instead of the service.
+        Pass it to a client as cassette=; every get_address_info and validate_many call is then
+        looked up by its canonical address and answered after a synthetic latency, without any
+        network traffic. An address that was not recorded raises CassetteMiss. The cache,
+        single-flight, prevalidation, deadline and observers still apply; endpoints, health,
+        hedging, the limiter and retries do not, as no endpoint is called.
+
+        The file is memory-mapped and looked up by binary search over its sorted index, so opening
+        it is instant and memory use does not grow with the number of entries; the operating system
+        shares its pages between every process replaying the same file.
+
+        path: Cassette file written by CassetteRecorder.
+        latency: Synthetic latency added to each call. None answers at full speed.
+
+        Raises:
+            ValueError: If path is not a complete cassette file.
+        """
+        self.path = os.path.abspath(path)
+        self.latency = latency
+        with open(self.path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._map)
+        if size < _HEADER.size + _FOOTER.size:
+            self._map.close()
+            raise ValueError(f"{path} is not an AVI cassette")
+        magic, flags, _ = _HEADER.unpack_from(self._map, 0)
+        self._index_offset, self._count, self._bits, _, index_magic = _FOOTER.unpack_from(self._map, size - _FOOTER.size)
+        if magic != MAGIC or index_magic != INDEX_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not an AVI cassette, or its recording was not closed")
+        self._compressed = bool(flags & COMPRESSED)
+        self._fan_out_offset = self._index_offset + self._count * _ENTRY.size
+        self._stats = CassetteStats(entries=self._count)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _offset(self, digest: bytes) -> Optional[int]:
+        # The fan-out table gives the range of index entries sharing the digest's top bits, which is
+        # then binary-searched; both are read straight from the map
+        data, base = self._map, self._index_offset
+        bucket = _bucket(digest, self._bits)
+        low = _COUNT.unpack_from(data, self._fan_out_offset + (bucket - 1) * _COUNT.size)[0] if bucket else 0
+        high = _COUNT.unpack_from(data, self._fan_out_offset + bucket * _COUNT.size)[0]
+        while low < high:
+            middle = (low + high) // 2
+            position = base + middle * _ENTRY.size
+            if data[position:position + _DIGEST_SIZE] < digest:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            found, offset = _ENTRY.unpack_from(data, base + low * _ENTRY.size)
+            if found == digest:
+                return offset
+        return None
+
+    def lookup(self, key: str) -> Optional[Tuple[dict, float]]:
+        """Return the payload recorded for key and the latency it was recorded with (ms), or None."""
+        offset = self._offset(_digest(key))
+        if offset is not None:
+            key_length, data_length, recorded_ms = _RECORD.unpack_from(self._map, offset)
+            start = offset + _RECORD.size
+            # The full key is stored too, so a digest collision reads as a miss instead of a wrong answer
+            if self._map[start:start + key_length] == key.encode("utf-8"):
+                data = self._map[start + key_length:start + key_length + data_length]
+                return loads(zlib.decompress(data) if self._compressed else data), recorded_ms
+        return None
+
+    def play(self, key: str) -> Tuple[dict, float]:
+        """
+        Return the payload recorded for key and the seconds to wait before answering with it.
+
+        Raises:
+            CassetteMiss: If key was not recorded.
+        """
+        found = self.lookup(key)
+        with self._lock:
+            if found is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        if found is None:
+            raise CassetteMiss(f"Address not in cassette {self.path}: {key.replace(KEY_SEPARATOR, ' | ')}")
+        payload, recorded_ms = found
+        return payload, self.latency.sample(recorded_ms) if self.latency is not None else 0.0
+
+    def stats(self) -> CassetteStats:
+        with self._lock:
+            return CassetteStats(**vars(self._stats))
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "CassettePlayer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,315 @@
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# ISO 3166-1 countries: alpha-2|alpha-3|short name|other accepted names, separated by ";"
+_COUNTRY_TABLE = """
+AD|AND|Andorra|
+AE|ARE|United Arab Emirates|UAE;Emirates
+AF|AFG|Afghanistan|
+AG|ATG|Antigua and Barbuda|Antigua
+AI|AIA|Anguilla|
+AL|ALB|Albania|
+AM|ARM|Armenia|
+AO|AGO|Angola|
+AQ|ATA|Antarctica|
+AR|ARG|Argentina|
+AS|ASM|American Samoa|
+AT|AUT|Austria|
+AU|AUS|Australia|
+AW|ABW|Aruba|
+AX|ALA|Aland Islands|
+AZ|AZE|Azerbaijan|
+BA|BIH|Bosnia and Herzegovina|Bosnia
+BB|BRB|Barbados|
+BD|BGD|Bangladesh|
+BE|BEL|Belgium|
+BF|BFA|Burkina Faso|
+BG|BGR|Bulgaria|
+BH|BHR|Bahrain|
+BI|BDI|Burundi|
+BJ|BEN|Benin|
+BL|BLM|Saint Barthelemy|St Barthelemy
+BM|BMU|Bermuda|
+BN|BRN|Brunei Darussalam|Brunei
+BO|BOL|Bolivia|Plurinational State of Bolivia
+BQ|BES|Bonaire, Sint Eustatius and Saba|Caribbean Netherlands;Bonaire
+BR|BRA|Brazil|Brasil
+BS|BHS|Bahamas|The Bahamas
+BT|BTN|Bhutan|
+BV|BVT|Bouvet Island|
+BW|BWA|Botswana|
+BY|BLR|Belarus|
+BZ|BLZ|Belize|
+CA|CAN|Canada|
+CC|CCK|Cocos (Keeling) Islands|Cocos Islands
+CD|COD|Democratic Republic of the Congo|DR Congo;DRC;Congo-Kinshasa;Congo, Democratic Republic of the
+CF|CAF|Central African Republic|
+CG|COG|Congo|Republic of the Congo;Congo-Brazzaville
+CH|CHE|Switzerland|
+CI|CIV|Cote d'Ivoire|Ivory Coast
+CK|COK|Cook Islands|
+CL|CHL|Chile|
+CM|CMR|Cameroon|
+CN|CHN|China|People's Republic of China;PRC
+CO|COL|Colombia|
+CR|CRI|Costa Rica|
+CU|CUB|Cuba|
+CV|CPV|Cabo Verde|Cape Verde
+CW|CUW|Curacao|
+CX|CXR|Christmas Island|
+CY|CYP|Cyprus|
+CZ|CZE|Czechia|Czech Republic
+DE|DEU|Germany|Deutschland
+DJ|DJI|Djibouti|
+DK|DNK|Denmark|
+DM|DMA|Dominica|
+DO|DOM|Dominican Republic|
+DZ|DZA|Algeria|
+EC|ECU|Ecuador|
+EE|EST|Estonia|
+EG|EGY|Egypt|
+EH|ESH|Western Sahara|
+ER|ERI|Eritrea|
+ES|ESP|Spain|Espana
+ET|ETH|Ethiopia|
+FI|FIN|Finland|
+FJ|FJI|Fiji|
+FK|FLK|Falkland Islands (Malvinas)|Falkland Islands
+FM|FSM|Micronesia|Federated States of Micronesia
+FO|FRO|Faroe Islands|
+FR|FRA|France|
+GA|GAB|Gabon|
+GB|GBR|United Kingdom|UK;Great Britain;Britain;United Kingdom of Great Britain and Northern Ireland;England;Scotland;Wales;Northern Ireland
+GD|GRD|Grenada|
+GE|GEO|Georgia|
+GF|GUF|French Guiana|
+GG|GGY|Guernsey|
+GH|GHA|Ghana|
+GI|GIB|Gibraltar|
+GL|GRL|Greenland|
+GM|GMB|Gambia|The Gambia
+GN|GIN|Guinea|
+GP|GLP|Guadeloupe|
+GQ|GNQ|Equatorial Guinea|
+GR|GRC|Greece|
+GS|SGS|South Georgia and the South Sandwich Islands|
+GT|GTM|Guatemala|
+GU|GUM|Guam|
+GW|GNB|Guinea-Bissau|
+GY|GUY|Guyana|
+HK|HKG|Hong Kong|
+HM|HMD|Heard Island and McDonald Islands|
+HN|HND|Honduras|
+HR|HRV|Croatia|
+HT|HTI|Haiti|
+HU|HUN|Hungary|
+ID|IDN|Indonesia|
+IE|IRL|Ireland|Republic of Ireland;Eire
+IL|ISR|Israel|
+IM|IMN|Isle of Man|
+IN|IND|India|
+IO|IOT|British Indian Ocean Territory|
+IQ|IRQ|Iraq|
+IR|IRN|Iran|Islamic Republic of Iran
+IS|ISL|Iceland|
+IT|ITA|Italy|Italia
+JE|JEY|Jersey|
+JM|JAM|Jamaica|
+JO|JOR|Jordan|
+JP|JPN|Japan|
+KE|KEN|Kenya|
+KG|KGZ|Kyrgyzstan|
+KH|KHM|Cambodia|
+KI|KIR|Kiribati|
+KM|COM|Comoros|
+KN|KNA|Saint Kitts and Nevis|St Kitts and Nevis
+KP|PRK|North Korea|Democratic People's Republic of Korea;Korea, Democratic People's Republic of
+KR|KOR|South Korea|Republic of Korea;Korea, Republic of;Korea
+KW|KWT|Kuwait|
+KY|CYM|Cayman Islands|
+KZ|KAZ|Kazakhstan|
+LA|LAO|Laos|Lao People's Democratic Republic
+LB|LBN|Lebanon|
+LC|LCA|Saint Lucia|St Lucia
+LI|LIE|Liechtenstein|
+LK|LKA|Sri Lanka|
+LR|LBR|Liberia|
+LS|LSO|Lesotho|
+LT|LTU|Lithuania|
+LU|LUX|Luxembourg|
+LV|LVA|Latvia|
+LY|LBY|Libya|
+MA|MAR|Morocco|
+MC|MCO|Monaco|
+MD|MDA|Moldova|Republic of Moldova
+ME|MNE|Montenegro|
+MF|MAF|Saint Martin (French part)|Saint Martin;St Martin
+MG|MDG|Madagascar|
+MH|MHL|Marshall Islands|
+MK|MKD|North Macedonia|Macedonia
+ML|MLI|Mali|
+MM|MMR|Myanmar|Burma
+MN|MNG|Mongolia|
+MO|MAC|Macao|Macau
+MP|MNP|Northern Mariana Islands|
+MQ|MTQ|Martinique|
+MR|MRT|Mauritania|
+MS|MSR|Montserrat|
+MT|MLT|Malta|
+MU|MUS|Mauritius|
+MV|MDV|Maldives|
+MW|MWI|Malawi|
+MX|MEX|Mexico|
+MY|MYS|Malaysia|
+MZ|MOZ|Mozambique|
+NA|NAM|Namibia|
+NC|NCL|New Caledonia|
+NE|NER|Niger|
+NF|NFK|Norfolk Island|
+NG|NGA|Nigeria|
+NI|NIC|Nicaragua|
+NL|NLD|Netherlands|Holland;The Netherlands
+NO|NOR|Norway|
+NP|NPL|Nepal|
+NR|NRU|Nauru|
+NU|NIU|Niue|
+NZ|NZL|New Zealand|
+OM|OMN|Oman|
+PA|PAN|Panama|
+PE|PER|Peru|
+PF|PYF|French Polynesia|
+PG|PNG|Papua New Guinea|
+PH|PHL|Philippines|
+PK|PAK|Pakistan|
+PL|POL|Poland|
+PM|SPM|Saint Pierre and Miquelon|St Pierre and Miquelon
+PN|PCN|Pitcairn|Pitcairn Islands
+PR|PRI|Puerto Rico|
+PS|PSE|Palestine|State of Palestine;Palestinian Territories
+PT|PRT|Portugal|
+PW|PLW|Palau|
+PY|PRY|Paraguay|
+QA|QAT|Qatar|
+RE|REU|Reunion|
+RO|ROU|Romania|
+RS|SRB|Serbia|
+RU|RUS|Russia|Russian Federation
+RW|RWA|Rwanda|
+SA|SAU|Saudi Arabia|
+SB|SLB|Solomon Islands|
+SC|SYC|Seychelles|
+SD|SDN|Sudan|
+SE|SWE|Sweden|
+SG|SGP|Singapore|
+SH|SHN|Saint Helena, Ascension and Tristan da Cunha|Saint Helena;St Helena
+SI|SVN|Slovenia|
+SJ|SJM|Svalbard and Jan Mayen|
+SK|SVK|Slovakia|Slovak Republic
+SL|SLE|Sierra Leone|
+SM|SMR|San Marino|
+SN|SEN|Senegal|
+SO|SOM|Somalia|
+SR|SUR|Suriname|
+SS|SSD|South Sudan|
+ST|STP|Sao Tome and Principe|
+SV|SLV|El Salvador|
+SX|SXM|Sint Maarten (Dutch part)|Sint Maarten
+SY|SYR|Syria|Syrian Arab Republic
+SZ|SWZ|Eswatini|Swaziland
+TC|TCA|Turks and Caicos Islands|
+TD|TCD|Chad|
+TF|ATF|French Southern Territories|
+TG|TGO|Togo|
+TH|THA|Thailand|
+TJ|TJK|Tajikistan|
+TK|TKL|Tokelau|
+TL|TLS|Timor-Leste|East Timor
+TM|TKM|Turkmenistan|
+TN|TUN|Tunisia|
+TO|TON|Tonga|
+TR|TUR|Turkiye|Turkey
+TT|TTO|Trinidad and Tobago|Trinidad
+TV|TUV|Tuvalu|
+TW|TWN|Taiwan|Taiwan, Province of China
+TZ|TZA|Tanzania|United Republic of Tanzania
+UA|UKR|Ukraine|
+UG|UGA|Uganda|
+UM|UMI|United States Minor Outlying Islands|
+US|USA|United States|United States of America;America;U.S.;U.S.A.
+UY|URY|Uruguay|
+UZ|UZB|Uzbekistan|
+VA|VAT|Holy See|Vatican;Vatican City
+VC|VCT|Saint Vincent and the Grenadines|St Vincent and the Grenadines
+VE|VEN|Venezuela|Bolivarian Republic of Venezuela
+VG|VGB|British Virgin Islands|Virgin Islands, British
+VI|VIR|United States Virgin Islands|US Virgin Islands;Virgin Islands, U.S.
+VN|VNM|Viet Nam|Vietnam
+VU|VUT|Vanuatu|
+WF|WLF|Wallis and Futuna|
+WS|WSM|Samoa|
+YE|YEM|Yemen|
+YT|MYT|Mayotte|
+ZA|ZAF|South Africa|
+ZM|ZMB|Zambia|
+ZW|ZWE|Zimbabwe|
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Country:
+    Alpha2: str
+    Alpha3: str
+    Name: str
+
+    def __str__(self) -> str:
+        return f"Country: Alpha2={self.Alpha2}, Alpha3={self.Alpha3}, Name={self.Name}"
+
+
+def country_lookup_key(value: str) -> str:
+    """
+    Reduce a country name or code to the form used by the lookup index: accents removed,
+    case folded, punctuation dropped and whitespace collapsed, so "Côte d’Ivoire", "COTE D'IVOIRE"
+    and "cote divoire" share a key.
+    """
+    decomposed = unicodedata.normalize("NFKD", value)
+    letters = "".join(char for char in decomposed if not unicodedata.combining(char))
+    letters = re.sub(r"[^\w\s]", "", letters.casefold())
+    return " ".join(letters.replace("_", " ").split())
+
+
+def _build_index() -> Tuple[Dict[str, Country], Tuple[Country, ...]]:
+    index: Dict[str, Country] = {}
+    countries = []
+    for line in _COUNTRY_TABLE.strip().splitlines():
+        alpha2, alpha3, name, aliases = line.split("|")
+        country = Country(alpha2, alpha3, name)
+        countries.append(country)
+        names = [name] + [alias for alias in aliases.split(";") if alias]
+        for key in [alpha2, alpha3] + names:
+            index.setdefault(country_lookup_key(key), country)
+        # "Cocos (Keeling) Islands" is also written without the parenthesised part
+        for value in names:
+            if "(" in value:
+                index.setdefault(country_lookup_key(re.sub(r"\s*\(.*?\)", "", value)), country)
+    return index, tuple(countries)
+
+
+# Precomputed once at import: lookup key -> Country
+_INDEX, COUNTRIES = _build_index()
+
+
+def find_country(value: Optional[str]) -> Optional[Country]:
+    """
+    Look up a country by ISO 3166-1 alpha-2 or alpha-3 code, short name or common alternative name.
+
+    Parameters:
+        value: The country as entered, in any case, with or without accents and punctuation.
+
+    Returns:
+        Optional[Country]: The matching country, or None if value is blank or not recognized.
+    """
+    if not value:
+        return None
+    return _INDEX.get(country_lookup_key(value))
@@ -0,0 +1,183 @@
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .avi_batch import exception_text
+from .avi_response import GetAddressInfoInput, _ADDRESS_INFO_FIELDS, _ERROR_FIELDS
+
+# Input fields that can be read from a frame column
+INPUT_FIELDS = ("Address1", "Address2", "Address3", "Address4", "Address5", "Locality",
+                "AdministrativeArea", "PostalCode", "Country", "OutputLanguage")
+
+# Output columns: every AddressInfo field, the Error fields prefixed with "Error", the
+# InformationComponents as a list of {Name, Value} structs, and the exception text when the
+# call raised instead of returning a response.
+ERROR_COLUMNS = tuple("Error" + name for name in _ERROR_FIELDS)
+COMPONENT_TYPE = pa.list_(pa.struct([("Name", pa.string()), ("Value", pa.string())]))
+OUTPUT_COLUMNS = _ADDRESS_INFO_FIELDS + ERROR_COLUMNS + ("InformationComponents", "Exception")
+
+Frame = Union[pd.DataFrame, pa.Table]
+
+
+def validate_frame(
+    df: Frame,
+    license_key: str,
+    column_map: Optional[Dict[str, str]] = None,
+    is_live: bool = True,
+    client=None,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> Frame:
+    """
+    Validate every row of a pandas DataFrame or pyarrow Table and return the results as columns.
+
+    Rows with the same address are validated once: the distinct address tuples are found with a
+    vectorized group-by, sent through client.validate_many concurrently (which also merges
+    addresses that differ only in case, spacing or country spelling), and the results are
+    written straight into one array per output column, which is then expanded back to one entry
+    per input row with an Arrow take. No per-row response objects are built, so memory grows with
+    the number of distinct addresses rather than the number of rows.
+
+    Parameters:
+        df: The addresses, one per row.
+        license_key: Your license key for the AVI service.
+        column_map: Maps GetAddressInfoInput field names (Address1 to Address5, Locality,
+            AdministrativeArea, PostalCode, Country, OutputLanguage) to column names in df.
+            Defaults to every field whose name is also a column of df. Unmapped fields are sent empty.
+            Columns are sent as text; whole numbers in a float column (e.g. a numeric PostalCode column
+            with missing values) are sent without a fraction. Read postal codes as strings to keep
+            leading zeros.
+        is_live: True for the live (production) endpoints, False for the trial endpoint.
+        client: The AVIRestClient to validate with. Defaults to the shared client.
+        max_workers: Number of worker threads. Defaults to the client's pool_size.
+        max_in_flight: Maximum number of submitted but not yet finished addresses. Defaults to 2 * max_workers.
+
+    Returns:
+        A DataFrame (Arrow-backed dtypes, same index as df) or a pyarrow Table, matching the type
+        of df, with OUTPUT_COLUMNS in order and one row per input row. Nulls mark missing fields.
+
+    Raises:
+        ValueError: If column_map names an unknown field, or no input field is mapped.
+        KeyError: If column_map names a column df does not have.
+    """
+    column_map = _resolve_column_map(df, column_map)
+    codes, distinct = _distinct_addresses(df, column_map)
+
+    if client is None:
+        from .get_address_info_rest import get_default_client
+        client = get_default_client()
+
+    columns = _ResultColumns(len(distinct))
+    inputs = _inputs(distinct, column_map, license_key, is_live)
+    for result in client.validate_many(inputs, max_workers=max_workers, max_in_flight=max_in_flight):
+        columns.add(result.index, result.response, result.exception)
+
+    table = columns.to_table().take(pa.array(codes, type=pa.int64()))
+    if isinstance(df, pa.Table):
+        return table
+    return table.to_pandas(types_mapper=pd.ArrowDtype).set_axis(df.index)
+
+
+def _resolve_column_map(df: Frame, column_map: Optional[Dict[str, str]]) -> Dict[str, str]:
+    names = df.column_names if isinstance(df, pa.Table) else list(df.columns)
+    if column_map is None:
+        column_map = {field: field for field in INPUT_FIELDS if field in names}
+    unknown = [field for field in column_map if field not in INPUT_FIELDS]
+    if unknown:
+        raise ValueError(f"column_map has unknown input fields: {', '.join(unknown)}")
+    missing = [column for column in column_map.values() if column not in names]
+    if missing:
+        raise KeyError(f"column_map names columns not in the frame: {', '.join(missing)}")
+    if not column_map:
+        raise ValueError("No input fields are mapped to columns; pass column_map")
+    return dict(column_map)
+
+
+def _distinct_addresses(df: Frame, column_map: Dict[str, str]):
+    """
+    Return, for every row, the number of its distinct address (in order of first appearance),
+    and a DataFrame of the distinct addresses with one column per mapped field.
+    """
+    fields = list(column_map)
+    if isinstance(df, pa.Table):
+        addresses = df.select(list(column_map.values())).to_pandas()
+    else:
+        addresses = df[list(column_map.values())]
+    # Compare as text so null, NaN and "" are one value, as they are to the service
+    addresses = pd.DataFrame({field: _as_text(addresses.iloc[:, position]) for position, field in enumerate(fields)})
+    addresses = addresses.fillna("")
+    codes = addresses.groupby(fields, sort=False).ngroup().to_numpy(dtype=np.int64)
+    distinct = addresses.drop_duplicates(ignore_index=True)
+    return codes, distinct
+
+
+def _as_text(column: pd.Series) -> pd.Series:
+    # An integer column with missing values is read as float, so 93101 would be sent as "93101.0";
+    # whole numbers are rendered without the fraction instead
+    if not pd.api.types.is_float_dtype(column.dtype):
+        return column.astype("string")
+    numbers = column.astype("Float64")
+    whole = (numbers.notna() & (numbers % 1 == 0) & (numbers.abs() < 2 ** 53)).fillna(False).to_numpy(dtype=bool)
+    text = numbers.astype("string")
+    text[whole] = numbers[whole].astype("Int64").astype("string")
+    return text
+
+
+def _inputs(
+    distinct: pd.DataFrame, column_map: Dict[str, str], license_key: str, is_live: bool
+) -> Iterator[GetAddressInfoInput]:
+    fields = list(column_map)
+    for values in distinct.itertuples(index=False, name=None):
+        item = GetAddressInfoInput(LicenseKey=license_key, IsLive=is_live)
+        for field, value in zip(fields, values):
+            if value:
+                setattr(item, field, value)
+        if not item.OutputLanguage:
+            item.OutputLanguage = "ENGLISH"
+        yield item
+
+
+class _ResultColumns:
+    def __init__(self, size: int):
+        """One preallocated array per output column, indexed by distinct address number."""
+        self._values: Dict[str, List[Optional[str]]] = {name: [None] * size for name in
+                                                         _ADDRESS_INFO_FIELDS + ERROR_COLUMNS + ("Exception",)}
+        self._component_offsets = np.zeros(size + 1, dtype=np.int32)
+        self._component_names: List[List[Optional[str]]] = [[] for _ in range(size)]
+        self._component_values: List[List[Optional[str]]] = [[] for _ in range(size)]
+        self._has_components = np.zeros(size, dtype=bool)
+
+    def add(self, index: int, response, exception: Optional[BaseException]) -> None:
+        if exception is not None:
+            self._values["Exception"][index] = exception_text(exception)
+            return
+        error = response.Error
+        if error is not None:
+            for name, column in zip(_ERROR_FIELDS, ERROR_COLUMNS):
+                self._values[column][index] = getattr(error, name)
+        info = response.AddressInfo
+        if info is not None:
+            for name in _ADDRESS_INFO_FIELDS:
+                self._values[name][index] = getattr(info, name)
+            self._has_components[index] = True
+            components = info.InformationComponents or ()
+            self._component_names[index] = [component.Name for component in components]
+            self._component_values[index] = [component.Value for component in components]
+
+    def to_table(self) -> pa.Table:
+        arrays = {name: pa.array(values, type=pa.string()) for name, values in self._values.items()}
+        arrays["InformationComponents"] = self._components()
+        return pa.table({name: arrays[name] for name in OUTPUT_COLUMNS})
+
+    def _components(self) -> pa.Array:
+        lengths = np.fromiter((len(names) for names in self._component_names), dtype=np.int32,
+                              count=len(self._component_names))
+        np.cumsum(lengths, out=self._component_offsets[1:])
+        names = pa.array([name for names in self._component_names for name in names], type=pa.string())
+        values = pa.array([value for values in self._component_values for value in values], type=pa.string())
+        structs = pa.StructArray.from_arrays([names, values], fields=list(COMPONENT_TYPE.value_type))
+        # Rows without an AddressInfo get a null list rather than an empty one
+        return pa.ListArray.from_arrays(pa.array(self._component_offsets), structs,
+                                        type=COMPONENT_TYPE, mask=pa.array(~self._has_components))
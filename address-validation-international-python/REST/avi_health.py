@@ -0,0 +1,190 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class EndpointStatus:
+    # opened_at is the wall-clock time (time.time()) the circuit last opened, or None while closed
+    endpoint: str
+    state: str
+    consecutive_failures: int
+    total_successes: int
+    total_failures: int
+    opened_at: Optional[float]
+
+    def __str__(self) -> str:
+        return (f"EndpointStatus: endpoint={self.endpoint}, state={self.state}, "
+                f"consecutive_failures={self.consecutive_failures}, total_successes={self.total_successes}, "
+                f"total_failures={self.total_failures}, opened_at={self.opened_at}")
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1):
+        """
+        Circuit breaker for a single endpoint.
+
+        Closed: calls flow normally. After failure_threshold consecutive failures it opens.
+        Open: calls are refused until recovery_timeout seconds have passed, then it goes half-open.
+        Half-open: up to half_open_max_calls probe calls are let through. A successful probe
+        closes the circuit; a failed one opens it again for another recovery_timeout.
+
+        failure_threshold: Consecutive failures (errors, timeouts or TypeCode 3) that open the circuit.
+        recovery_timeout: Seconds to stay open before probing the endpoint again.
+        half_open_max_calls: Number of concurrent probe calls allowed while half-open.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._total_successes = 0
+        self._total_failures = 0
+        self._opened_at: Optional[float] = None
+        self._opened_at_wall: Optional[float] = None
+        self._probes_in_flight = 0
+        self._probe_started_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh(time.monotonic())
+            return self._state
+
+    def _refresh(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+        elif self._state == HALF_OPEN and self._probes_in_flight and now - self._probe_started_at >= self.recovery_timeout:
+            # A probe that never reported back must not keep the circuit half-open forever
+            self._probes_in_flight = 0
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be sent to the endpoint now."""
+        with self._lock:
+            now = time.monotonic()
+            self._refresh(now)
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                self._probe_started_at = now
+                return True
+            return False
+
+    def record_success(self) -> Optional[str]:
+        """Record a successful call. Returns the new state if it changed, otherwise None."""
+        with self._lock:
+            self._total_successes += 1
+            self._consecutive_failures = 0
+            if self._state != CLOSED:
+                self._state = CLOSED
+                self._opened_at = None
+                self._opened_at_wall = None
+                self._probes_in_flight = 0
+                return CLOSED
+            return None
+
+    def record_failure(self) -> Optional[str]:
+        """Record a failed call. Returns the new state if it changed, otherwise None."""
+        with self._lock:
+            self._total_failures += 1
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._opened_at_wall = time.time()
+                self._probes_in_flight = 0
+                return OPEN
+            return None
+
+    def status(self, endpoint: str) -> EndpointStatus:
+        with self._lock:
+            self._refresh(time.monotonic())
+            return EndpointStatus(
+                endpoint=endpoint,
+                state=self._state,
+                consecutive_failures=self._consecutive_failures,
+                total_successes=self._total_successes,
+                total_failures=self._total_failures,
+                opened_at=self._opened_at_wall,
+            )
+
+
+StateListener = Callable[[str, str], None]
+
+
+class EndpointHealth:
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1):
+        """
+        Tracks the health of every AVI endpoint with one CircuitBreaker per host.
+
+        Share one instance between the REST and SOAP clients: both reach the same hosts, so a
+        primary outage seen by one client routes the other straight to the backup as well.
+        Parameters are applied to every breaker; see CircuitBreaker.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._listeners: List[StateListener] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_for(url: str) -> str:
+        """Return the tracking key for a URL: its host and port."""
+        return urlsplit(url).netloc.lower()
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        endpoint = self.endpoint_for(url)
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    endpoint,
+                    CircuitBreaker(self.failure_threshold, self.recovery_timeout, self.half_open_max_calls),
+                )
+        return breaker
+
+    def allow_request(self, url: str) -> bool:
+        """Return True if a call may be sent to the endpoint serving url."""
+        return self.breaker(url).allow_request()
+
+    def record_success(self, url: str) -> None:
+        self._notify(url, self.breaker(url).record_success())
+
+    def record_failure(self, url: str) -> None:
+        self._notify(url, self.breaker(url).record_failure())
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Register listener(endpoint, new_state), called whenever a circuit opens or closes."""
+        self._listeners.append(listener)
+
+    def _notify(self, url: str, new_state: Optional[str]) -> None:
+        if new_state is not None:
+            endpoint = self.endpoint_for(url)
+            for listener in self._listeners:
+                listener(endpoint, new_state)
+
+    def snapshot(self) -> Dict[str, EndpointStatus]:
+        """Return the current status of every endpoint seen so far, keyed by host."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {endpoint: breaker.status(endpoint) for endpoint, breaker in breakers.items()}
+
+
+# Shared by the default REST client; pass it to other clients so they see the same endpoint health
+default_endpoint_health = EndpointHealth()
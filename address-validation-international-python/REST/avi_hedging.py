@@ -0,0 +1,108 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+# Hedge delay, in seconds, while percentile has too few samples and no delay is set
+BOOTSTRAP_DELAY = 1.0
+
+
+@dataclass
+class HedgePolicy:
+    """
+    When to send a hedged copy of a live request to the backup endpoint.
+
+    delay: Seconds to wait for the primary before hedging. Used on its own, or as the
+        fallback while too few latencies have been observed for percentile (BOOTSTRAP_DELAY
+        if None).
+    percentile: Hedge once the primary is slower than this percentile (e.g. 95) of its
+        recently observed latencies. None disables adaptive delays.
+    min_samples: Observed primary latencies required before percentile is used. Every primary
+        attempt is observed, hedged or not, including failures and timeouts.
+    window: Number of recent primary latencies the percentile is computed over.
+    max_hedge_ratio: Upper bound on hedged calls as a fraction of all calls (0.05 = 5%),
+        so hedging cannot double paid call volume.
+    burst: Number of hedges that may be sent back to back before max_hedge_ratio applies.
+    """
+    delay: Optional[float] = 1.0
+    percentile: Optional[float] = 95.0
+    min_samples: int = 100
+    window: int = 1000
+    max_hedge_ratio: float = 0.05
+    burst: float = 10.0
+
+
+@dataclass
+class HedgeStats:
+    calls: int = 0
+    hedges_sent: int = 0
+    hedges_won: int = 0
+    hedges_denied: int = 0
+
+    def __str__(self) -> str:
+        return (f"HedgeStats: calls={self.calls}, hedges_sent={self.hedges_sent}, "
+                f"hedges_won={self.hedges_won}, hedges_denied={self.hedges_denied}")
+
+
+class Hedger:
+    def __init__(self, policy: HedgePolicy):
+        """
+        Tracks primary latencies and the hedge budget for one client.
+
+        The budget is a token bucket: every call adds max_hedge_ratio tokens (up to burst)
+        and every hedge spends one, so over time at most max_hedge_ratio of calls are hedged.
+        """
+        self.policy = policy
+        self._latencies: "deque[float]" = deque(maxlen=policy.window)
+        self._since_sorted = 0
+        self._cached_delay: Optional[float] = None
+        self._tokens = policy.burst
+        self._stats = HedgeStats()
+        self._lock = threading.Lock()
+
+    def begin_call(self) -> Optional[float]:
+        """Count a call toward the hedge budget and return how long to wait before hedging it, or None."""
+        with self._lock:
+            self._stats.calls += 1
+            self._tokens = min(self.policy.burst, self._tokens + self.policy.max_hedge_ratio)
+            return self._delay()
+
+    def _delay(self) -> Optional[float]:
+        policy = self.policy
+        if policy.percentile is None:
+            return policy.delay
+        if len(self._latencies) < policy.min_samples:
+            # Hedging must run to gather samples, so percentile-only policies start from a fixed delay
+            return policy.delay if policy.delay is not None else BOOTSTRAP_DELAY
+        # Re-sorting on every call is wasteful; refresh the percentile every 10% of the samples held,
+        # so the first estimate, made from only min_samples latencies, is soon replaced
+        if self._cached_delay is None or self._since_sorted >= max(1, len(self._latencies) // 10):
+            ordered = sorted(self._latencies)
+            rank = min(len(ordered) - 1, int(len(ordered) * policy.percentile / 100.0))
+            self._cached_delay = ordered[rank]
+            self._since_sorted = 0
+        return self._cached_delay
+
+    def try_hedge(self) -> bool:
+        """Spend one hedge from the budget. Returns False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._stats.hedges_sent += 1
+                return True
+            self._stats.hedges_denied += 1
+            return False
+
+    def record_primary_latency(self, seconds: float) -> None:
+        """Observe one primary attempt's latency, whether it succeeded, failed or timed out."""
+        with self._lock:
+            self._latencies.append(seconds)
+            self._since_sorted += 1
+
+    def record_hedge_won(self) -> None:
+        with self._lock:
+            self._stats.hedges_won += 1
+
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(**vars(self._stats))
@@ -0,0 +1,276 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import asyncio
+
+# What an attempt tells the limiter when it releases its permit
+SUCCESS = "success"    # the endpoint answered; its latency is used to judge health
+OVERLOAD = "overload"  # timeout, HTTP 5xx or Error TypeCode 3: the service is struggling
+IGNORE = "ignore"      # says nothing about load (e.g. HTTP 4xx, connection refused)
+
+
+class LimiterTimeout(RuntimeError):
+    """Raised when no permit became available within the policy's max_wait or the caller's timeout."""
+
+
+@dataclass
+class LimiterPolicy:
+    """
+    Rate cap and adaptive concurrency settings for an AdaptiveLimiter.
+
+    rate: Maximum attempts started per second, e.g. a license's QPS cap. None for no cap.
+    burst: Attempts that may start back to back before rate applies. Defaults to max(1, rate).
+    initial_limit: Concurrent attempts allowed before any feedback has been seen.
+    min_limit: The concurrency limit never drops below this.
+    max_limit: The concurrency limit never rises above this.
+    increase: Added to the limit for every limit-worth of healthy attempts, so roughly once per
+        round trip while the limit is being used.
+    backoff: Factor the limit is multiplied by on an overload signal.
+    latency_tolerance: A window whose mean latency exceeds this multiple of the baseline counts as
+        an overload signal. None judges health by errors and timeouts only.
+    window: Number of successful attempts each mean latency is taken over.
+    max_wait: Seconds acquire may wait for a permit before raising LimiterTimeout. None waits as long as it
+        takes, or until the call's deadline.
+    """
+    rate: Optional[float] = None
+    burst: Optional[float] = None
+    initial_limit: int = 16
+    min_limit: int = 1
+    max_limit: int = 256
+    increase: float = 1.0
+    backoff: float = 0.7
+    latency_tolerance: Optional[float] = 2.0
+    window: int = 50
+    max_wait: Optional[float] = None
+
+
+@dataclass
+class LimiterStats:
+    # limit and baseline_latency are current values; the rest are totals since creation
+    limit: int = 0
+    in_flight: int = 0
+    acquired: int = 0
+    waited: int = 0
+    wait_seconds: float = 0.0
+    timeouts: int = 0
+    increases: int = 0
+    decreases: int = 0
+    baseline_latency: Optional[float] = None
+
+    def __str__(self) -> str:
+        return (f"LimiterStats: limit={self.limit}, in_flight={self.in_flight}, acquired={self.acquired}, "
+                f"waited={self.waited}, wait_seconds={self.wait_seconds}, timeouts={self.timeouts}, "
+                f"increases={self.increases}, decreases={self.decreases}, baseline_latency={self.baseline_latency}")
+
+
+class Permit:
+    __slots__ = ("started",)
+
+    def __init__(self, started: float):
+        self.started = started
+
+
+class AdaptiveLimiter:
+    def __init__(self, policy: Optional[LimiterPolicy] = None):
+        """
+        Caps the rate and adapts the concurrency of calls to the AVI service.
+
+        Every attempt, to any endpoint, holds a permit while it runs. A permit needs a token from a
+        token bucket refilled at policy.rate per second, and a free slot under the concurrency limit.
+
+        The limit follows AIMD (additive increase, multiplicative decrease). Healthy attempts raise
+        it by policy.increase per limit-worth of attempts, while at least half the limit is in use.
+        An overload signal multiplies it by policy.backoff. Signals from attempts that started
+        before the last decrease are not counted again, so one burst of failures cuts the limit once.
+
+        Latency is judged per window of successful attempts against a baseline. The baseline drops
+        straight to a lower window mean and drifts a tenth of the way towards a higher one, so a
+        lasting change in latency becomes the new normal instead of shrinking the limit forever.
+
+        One instance may be shared by any number of clients, threads and event loops; the limit
+        then applies to all of them together.
+        """
+        self.policy = policy = policy or LimiterPolicy()
+        if not 1 <= policy.min_limit <= policy.initial_limit <= policy.max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < policy.backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if policy.rate is not None and policy.rate <= 0:
+            raise ValueError("rate must be positive")
+        self._burst = policy.burst if policy.burst is not None else max(1.0, policy.rate or 0.0)
+        self._tokens = self._burst
+        self._refilled_at = time.monotonic()
+        self._limit = float(policy.initial_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._window_sum = 0.0
+        self._window_count = 0
+        self._baseline: Optional[float] = None
+        self._stats = LimiterStats()
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._async_waiters: "deque[tuple]" = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def _try_acquire(self, now: float) -> Optional[float]:
+        # Take a permit if one is available and return None; otherwise return how long to wait
+        # (0.0 when waiting for a release rather than for a token). Call with the lock held.
+        if self._in_flight >= int(self._limit):
+            return 0.0
+        rate = self.policy.rate
+        if rate is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * rate)
+            self._refilled_at = now
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / rate
+            self._tokens -= 1.0
+        self._in_flight += 1
+        self._stats.acquired += 1
+        return None
+
+    def _waited(self, started: float, now: float) -> None:
+        self._stats.waited += 1
+        self._stats.wait_seconds += now - started
+
+    def _timed_out(self, started: float) -> LimiterTimeout:
+        self._stats.timeouts += 1
+        return LimiterTimeout(f"No AVI call permit within {time.monotonic() - started:.3f}s (limit {int(self._limit)})")
+
+    def _deadline(self, started: float, timeout: Optional[float]) -> Optional[float]:
+        max_wait = self.policy.max_wait
+        if timeout is not None and (max_wait is None or timeout < max_wait):
+            max_wait = timeout
+        return started + max_wait if max_wait is not None else None
+
+    def acquire(self, timeout: Optional[float] = None) -> Permit:
+        """
+        Wait for a permit. Pass it to release when the attempt finishes, however it finishes.
+
+        Parameters:
+            timeout: Seconds to wait at most, when shorter than policy.max_wait (e.g. the rest of a
+                call's deadline).
+
+        Raises:
+            LimiterTimeout: If policy.max_wait or timeout passed without a permit.
+        """
+        started = time.monotonic()
+        deadline = self._deadline(started, timeout)
+        waited = False
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                wait = self._try_acquire(now)
+                if wait is None:
+                    if waited:
+                        self._waited(started, now)
+                    return Permit(now)
+                if deadline is not None:
+                    if now >= deadline:
+                        raise self._timed_out(started)
+                    wait = min(wait, deadline - now) if wait else deadline - now
+                self._released.wait(wait or None)
+                waited = True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> Permit:
+        """acquire for coroutines: waits without blocking the event loop."""
+        # Imported here so synchronous clients do not pay for loading asyncio
+        import asyncio
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        deadline = self._deadline(started, timeout)
+        waited = False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._try_acquire(now)
+                if wait is None:
+                    if waited:
+                        self._waited(started, now)
+                    return Permit(now)
+                if deadline is not None and now >= deadline:
+                    raise self._timed_out(started)
+                released = None
+                if not wait:
+                    released = loop.create_future()
+                    self._async_waiters.append((loop, released))
+            timeout = wait or None
+            if deadline is not None:
+                timeout = min(timeout, deadline - now) if timeout else deadline - now
+            if released is None:
+                await asyncio.sleep(timeout)
+            else:
+                try:
+                    await asyncio.wait_for(released, timeout)
+                except asyncio.TimeoutError:
+                    pass
+            waited = True
+
+    def release(self, permit: Permit, signal: str) -> None:
+        """
+        Return a permit and report how its attempt went: SUCCESS, OVERLOAD or IGNORE.
+        """
+        now = time.monotonic()
+        with self._lock:
+            in_use = self._in_flight
+            self._in_flight -= 1
+            if signal == OVERLOAD:
+                self._decrease(permit, now)
+            elif signal == SUCCESS:
+                self._success(permit, now, in_use)
+            self._released.notify_all()
+            waiters, self._async_waiters = self._async_waiters, deque()
+        for loop, released in waiters:
+            loop.call_soon_threadsafe(_wake, released)
+
+    def _decrease(self, permit: Permit, now: float) -> None:
+        if permit.started < self._last_decrease:
+            return
+        limit = max(float(self.policy.min_limit), self._limit * self.policy.backoff)
+        if int(limit) < int(self._limit):
+            self._stats.decreases += 1
+        self._limit = limit
+        self._last_decrease = now
+        self._window_sum = 0.0
+        self._window_count = 0
+
+    def _success(self, permit: Permit, now: float, in_use: int) -> None:
+        policy = self.policy
+        if policy.latency_tolerance is not None:
+            self._window_sum += now - permit.started
+            self._window_count += 1
+            if self._window_count >= policy.window:
+                mean = self._window_sum / self._window_count
+                self._window_sum = 0.0
+                self._window_count = 0
+                baseline = self._baseline
+                if baseline is not None and mean > baseline * policy.latency_tolerance:
+                    self._baseline = baseline + (mean - baseline) / 10
+                    self._decrease(permit, now)
+                    return
+                self._baseline = mean if baseline is None or mean < baseline else baseline + (mean - baseline) / 10
+        # Only grow while the limit is actually being used, so an idle client keeps a sensible limit
+        if in_use * 2 >= self._limit and self._limit < policy.max_limit:
+            limit = min(float(policy.max_limit), self._limit + policy.increase / self._limit)
+            if int(limit) > int(self._limit):
+                self._stats.increases += 1
+            self._limit = limit
+
+    def stats(self) -> LimiterStats:
+        with self._lock:
+            stats = LimiterStats(**vars(self._stats))
+            stats.limit = int(self._limit)
+            stats.in_flight = self._in_flight
+            stats.baseline_latency = self._baseline
+            return stats
+
+
+def _wake(released: "asyncio.Future") -> None:
+    if not released.done():
+        released.set_result(None)
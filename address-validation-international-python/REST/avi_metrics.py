@@ -0,0 +1,312 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Event kinds
+ATTEMPT_START = "attempt_start"
+ATTEMPT_END = "attempt_end"
+FAILOVER = "failover"
+CACHE_HIT = "cache_hit"
+CACHE_MISS = "cache_miss"
+CALL_END = "call_end"
+COALESCED = "coalesced"
+DEDUPLICATED = "deduplicated"
+REJECTED = "rejected"
+RETRY = "retry"
+
+# Outcomes of an attempt (ATTEMPT_END) or a whole call (CALL_END)
+OK = "ok"
+ERROR = "error"                    # the service answered with an Error other than TypeCode 3
+FAILOVER_ERROR = "failover_error"  # the service answered with Error TypeCode 3
+EXCEPTION = "exception"            # no usable answer: network, HTTP, timeout or decoding failure
+
+# Failover reasons
+CIRCUIT_OPEN = "circuit_open"
+TYPE_CODE_3 = "type_code_3"
+HTTP_ERROR = "http_error"
+TIMEOUT = "timeout"
+CONNECTION_ERROR = "connection_error"
+INVALID_RESPONSE = "invalid_response"
+
+
+@dataclass
+class CallEvent:
+    """
+    One instrumentation event from a client.
+
+    kind: ATTEMPT_START, ATTEMPT_END, FAILOVER, CACHE_HIT, CACHE_MISS, COALESCED (the call shared
+        another caller's in-flight upstream call), DEDUPLICATED (a validate_many input was answered with
+        an earlier input's result), REJECTED (prevalidation refused the input), RETRY (the call is about
+        to be tried again) or CALL_END.
+    client: Emitting client: "rest", "rest_async", "soap" or "soap_lite".
+    endpoint: Host and port of the endpoint the attempt went to (attempt events).
+    role: "primary", "backup" or "trial" (attempt events; FAILOVER carries the endpoint failed over from).
+    latency: Seconds the attempt (ATTEMPT_END) or the whole call (CALL_END) took, or the backoff before a RETRY.
+    http_status: HTTP status of the response, or None if none was received.
+    type_code: Error.TypeCode of the response (or of the prevalidation Error), or None if it had no Error.
+    outcome: OK, ERROR, FAILOVER_ERROR or EXCEPTION (ATTEMPT_END and CALL_END).
+    reason: Why the call failed over (FAILOVER): CIRCUIT_OPEN, TYPE_CODE_3, HTTP_ERROR,
+        TIMEOUT, CONNECTION_ERROR, INVALID_RESPONSE or EXCEPTION.
+    exception: The exception behind an EXCEPTION outcome, a failover or a retry, if any.
+    """
+    kind: str
+    client: str
+    endpoint: Optional[str] = None
+    role: Optional[str] = None
+    latency: Optional[float] = None
+    http_status: Optional[int] = None
+    type_code: Optional[str] = None
+    outcome: Optional[str] = None
+    reason: Optional[str] = None
+    exception: Optional[BaseException] = None
+
+    def __str__(self) -> str:
+        return (f"CallEvent: kind={self.kind}, client={self.client}, endpoint={self.endpoint}, role={self.role}, "
+                f"latency={self.latency}, http_status={self.http_status}, type_code={self.type_code}, "
+                f"outcome={self.outcome}, reason={self.reason}, exception={self.exception!r}")
+
+
+Observer = Callable[[CallEvent], None]
+
+
+def response_outcome(type_code: Optional[str]) -> str:
+    """Map a response's Error.TypeCode (None when there is no Error) to an outcome."""
+    if type_code is None:
+        return OK
+    return FAILOVER_ERROR if type_code == "3" else ERROR
+
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Fixed-bucket histogram. counts[i] holds observations <= buckets[i] (and > buckets[i - 1]);
+        the last count holds everything above the largest bucket.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the pct-th percentile, or None if empty."""
+        if not self.count:
+            return None
+        rank = self.count * pct / 100.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def copy(self) -> "Histogram":
+        histogram = Histogram(self.buckets)
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        return histogram
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsCollector:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Observer that aggregates CallEvents into counters, gauges and latency histograms.
+        Register it on any number of clients with add_observer(collector).
+
+        Metrics (labels in braces):
+            avi_calls_total{client, outcome}
+            avi_call_duration_seconds{client}
+            avi_attempts_total{client, endpoint, role, outcome}
+            avi_attempt_duration_seconds{client, endpoint, role}
+            avi_attempts_in_flight{client, endpoint}
+            avi_failovers_total{client, reason}
+            avi_cache_lookups_total{client, result}
+            avi_coalesced_calls_total{client}
+            avi_deduplicated_inputs_total{client}
+            avi_rejected_calls_total{client, type_code}
+            avi_retries_total{client}
+
+        buckets: Upper bounds, in seconds, of the latency histogram buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._gauges: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: CallEvent) -> None:
+        kind = event.kind
+        with self._lock:
+            if kind == ATTEMPT_START:
+                self._add(self._gauges, "avi_attempts_in_flight",
+                          (("client", event.client), ("endpoint", event.endpoint)), 1)
+            elif kind == ATTEMPT_END:
+                self._add(self._gauges, "avi_attempts_in_flight",
+                          (("client", event.client), ("endpoint", event.endpoint)), -1)
+                self._add(self._counters, "avi_attempts_total",
+                          (("client", event.client), ("endpoint", event.endpoint),
+                           ("role", event.role), ("outcome", event.outcome)), 1)
+                self._observe("avi_attempt_duration_seconds",
+                              (("client", event.client), ("endpoint", event.endpoint), ("role", event.role)),
+                              event.latency)
+            elif kind == FAILOVER:
+                self._add(self._counters, "avi_failovers_total",
+                          (("client", event.client), ("reason", event.reason)), 1)
+            elif kind == CACHE_HIT or kind == CACHE_MISS:
+                self._add(self._counters, "avi_cache_lookups_total",
+                          (("client", event.client), ("result", "hit" if kind == CACHE_HIT else "miss")), 1)
+            elif kind == COALESCED:
+                self._add(self._counters, "avi_coalesced_calls_total", (("client", event.client),), 1)
+            elif kind == DEDUPLICATED:
+                self._add(self._counters, "avi_deduplicated_inputs_total", (("client", event.client),), 1)
+            elif kind == REJECTED:
+                self._add(self._counters, "avi_rejected_calls_total",
+                          (("client", event.client), ("type_code", event.type_code)), 1)
+            elif kind == RETRY:
+                self._add(self._counters, "avi_retries_total", (("client", event.client),), 1)
+            elif kind == CALL_END:
+                self._add(self._counters, "avi_calls_total",
+                          (("client", event.client), ("outcome", event.outcome)), 1)
+                self._observe("avi_call_duration_seconds", (("client", event.client),), event.latency)
+
+    @staticmethod
+    def _add(metrics: Dict[Tuple[str, Labels], float], name: str, labels: Labels, amount: float) -> None:
+        key = (name, labels)
+        metrics[key] = metrics.get(key, 0) + amount
+
+    def _observe(self, name: str, labels: Labels, value: Optional[float]) -> None:
+        if value is None:
+            return
+        histogram = self._histograms.get((name, labels))
+        if histogram is None:
+            histogram = self._histograms[(name, labels)] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Return the sum of counter name over every series matching the given labels."""
+        wanted = set(labels.items())
+        with self._lock:
+            return sum(value for (metric, series), value in self._counters.items()
+                       if metric == name and wanted <= set(series))
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """Return histogram name merged over every series matching the given labels."""
+        wanted = set(labels.items())
+        merged = Histogram(self.buckets)
+        with self._lock:
+            for (metric, series), histogram in self._histograms.items():
+                if metric == name and wanted <= set(series):
+                    merged.count += histogram.count
+                    merged.sum += histogram.sum
+                    merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+        return merged
+
+    def snapshot(self) -> Dict[str, list]:
+        """
+        Return every series as {"counters": [...], "gauges": [...], "histograms": [...]},
+        each entry a (name, labels dict, value) tuple; histogram values are Histogram copies.
+        """
+        with self._lock:
+            return {
+                "counters": [(name, dict(labels), value) for (name, labels), value in self._counters.items()],
+                "gauges": [(name, dict(labels), value) for (name, labels), value in self._gauges.items()],
+                "histograms": [(name, dict(labels), histogram.copy())
+                               for (name, labels), histogram in self._histograms.items()],
+            }
+
+    def render(self) -> str:
+        """Return every series in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        typed = set()
+
+        def header(name: str, metric_type: str) -> None:
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {metric_type}")
+
+        for name, labels, value in sorted(snapshot["counters"], key=_sort_key):
+            header(name, "counter")
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for name, labels, value in sorted(snapshot["gauges"], key=_sort_key):
+            header(name, "gauge")
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for name, labels, histogram in sorted(snapshot["histograms"], key=_sort_key):
+            header(name, "histogram")
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_format_labels(dict(labels, le=le))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every counter and histogram. In-flight gauges are kept so they stay balanced."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _sort_key(series) -> tuple:
+    return series[0], sorted((key, str(value)) for key, value in series[1].items())
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def serve_metrics(collector: MetricsCollector, host: str = "127.0.0.1", port: int = 9464) -> "ThreadingHTTPServer":
+    """
+    Serve collector.render() over HTTP on a background thread, for a Prometheus scraper.
+
+    Returns:
+        ThreadingHTTPServer: The running server; call shutdown() on it to stop serving.
+    """
+    # Imported here so clients that never serve metrics do not pay for loading http.server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            body = self.server.collector.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    server.collector = collector
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,91 @@
+import dataclasses
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .avi_countries import find_country
+from .avi_response import Error, GetAddressInfoInput
+
+OUTPUT_LANGUAGES = ("ENGLISH", "BOTH", "LOCAL_ROMAN", "LOCAL")
+
+# Errors are shaped like the service's: Type and TypeCode match the service's categories
+# ("Authorization" is 1, "User Input" is 2). DescCode values are this library's own.
+AUTHORIZATION = ("Authorization", "1")
+USER_INPUT = ("User Input", "2")
+
+MISSING_LICENSE_KEY = "1"
+MISSING_COUNTRY = "2"
+UNKNOWN_COUNTRY = "3"
+MISSING_LOCALITY = "4"
+INVALID_OUTPUT_LANGUAGE = "5"
+
+
+def _error(category: Tuple[str, str], desc: str, desc_code: str) -> Error:
+    return Error(Type=category[0], TypeCode=category[1], Desc=desc, DescCode=desc_code)
+
+
+def _text(value) -> str:
+    # Fields read from JSONL or a DataFrame may be numbers (an int PostalCode) or NaN rather than text
+    if value is None or value != value:
+        return ""
+    return str(value).strip()
+
+
+def _blank(value) -> bool:
+    return not _text(value)
+
+
+def prevalidate(item: GetAddressInfoInput, strict_country: bool = False) -> Tuple[GetAddressInfoInput, Optional[Error]]:
+    """
+    Check an input against the rules the service enforces, without calling it, and normalize it.
+
+    Rejected inputs:
+        - no LicenseKey (Authorization error)
+        - no Country, or a two- or three-letter Country that is not an ISO 3166-1 code
+        - no PostalCode and not both Locality and AdministrativeArea
+        - an OutputLanguage other than ENGLISH, BOTH, LOCAL_ROMAN or LOCAL
+
+    Normalization: a recognized Country (code, name or common alternative name) is replaced by
+    its ISO 3166-1 alpha-3 code, and OutputLanguage is upper-cased, defaulting to ENGLISH.
+
+    Parameters:
+        item: The input to check.
+        strict_country: Also reject country names that are not in the ISO 3166 index. By default
+            they are passed to the service unchanged, as it may recognize spellings this index does not.
+
+    Returns:
+        Tuple[GetAddressInfoInput, Optional[Error]]: The normalized input (a copy; item is not
+        modified) and the first rule it breaks, or None if it may be sent.
+    """
+    if _blank(item.LicenseKey):
+        return item, _error(AUTHORIZATION, "Please provide a valid license key for this web service.",
+                            MISSING_LICENSE_KEY)
+
+    if _blank(item.Country):
+        return item, _error(USER_INPUT, "Country is required.", MISSING_COUNTRY)
+    country = find_country(_text(item.Country))
+    if country is not None:
+        country_value = country.Alpha3
+    else:
+        value = _text(item.Country)
+        if strict_country or (len(value) <= 3 and value.isalpha()):
+            return item, _error(USER_INPUT, f"Country '{value}' is not a recognized ISO 3166 country name or code.",
+                                UNKNOWN_COUNTRY)
+        country_value = item.Country
+
+    if _blank(item.PostalCode) and (_blank(item.Locality) or _blank(item.AdministrativeArea)):
+        return item, _error(USER_INPUT, "Locality and AdministrativeArea are required when PostalCode is not provided.",
+                            MISSING_LOCALITY)
+
+    output_language = (_text(item.OutputLanguage) or "ENGLISH").upper()
+    if output_language not in OUTPUT_LANGUAGES:
+        return item, _error(USER_INPUT, f"OutputLanguage must be one of {', '.join(OUTPUT_LANGUAGES)}.",
+                            INVALID_OUTPUT_LANGUAGE)
+
+    return dataclasses.replace(item, Country=country_value, OutputLanguage=output_language), None
+
+
+def prevalidate_many(
+    inputs: Iterable[GetAddressInfoInput], strict_country: bool = False
+) -> Iterator[Tuple[GetAddressInfoInput, Optional[Error]]]:
+    """Lazily prevalidate a stream of inputs, yielding (normalized input, error or None) for each."""
+    for item in inputs:
+        yield prevalidate(item, strict_country)
@@ -1,9 +1,20 @@
+import json
+from dataclasses import dataclass, fields
+from typing import Optional, List, Union
 
-from dataclasses import dataclass
-from typing import Optional, List
+try:
+    import orjson
+except ImportError:  # optional fast path; the standard json module is used without it
+    orjson = None
 
+# Endpoint URLs for ServiceObjects Address Validation International (AVI) API. They live here, with the
+# payload helpers both REST clients share, so the asyncio client does not import requests.
+primary_url = "https://sws.serviceobjects.com/avi/api.svc/json/GetAddressInfo?"
+backup_url = "https://swsbackup.serviceobjects.com/avi/api.svc/json/GetAddressInfo?"
+trial_url = "https://trial.serviceobjects.com/avi/api.svc/json/GetAddressInfo?"
 
-@dataclass
+
+@dataclass(slots=True)
 class GetAddressInfoInput:
     Address1: Optional[str] = None
     Address2: Optional[str] = None
@@ -27,7 +38,7 @@ class GetAddressInfoInput:
                 f"IsLive={self.IsLive}, TimeoutSeconds={self.TimeoutSeconds}")
 
 
-@dataclass
+@dataclass(slots=True)
 class InformationComponent:
     Name: Optional[str] = None
     Value: Optional[str] = None
@@ -36,7 +47,7 @@ class InformationComponent:
         return f"InformationComponent: Name={self.Name}, Value={self.Value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Error:
     Type: Optional[str] = None
     TypeCode: Optional[str] = None
@@ -47,7 +58,7 @@ class Error:
         return f"Error: Type={self.Type}, TypeCode={self.TypeCode}, Desc={self.Desc}, DescCode={self.DescCode}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressInfo:
     Status: Optional[str] = None
     ResolutionLevel: Optional[str] = None
@@ -82,7 +93,7 @@ class AddressInfo:
                 f"InformationComponents=[{components_string}]")
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressInfoResponse:
     AddressInfo: Optional['AddressInfo'] = None
     Error: Optional['Error'] = None
@@ -91,4 +102,59 @@ class AddressInfoResponse:
         address_info_string = str(self.AddressInfo) if self.AddressInfo else 'None'
         error_string = str(self.Error) if self.Error else 'None'
         return (f"AddressInfoResponse: AddressInfo={address_info_string}, "
-                f"Error={error_string}]")
\ No newline at end of file
+                f"Error={error_string}]")
+
+
+# Field order of each model, so the parser can build them positionally
+_ADDRESS_INFO_FIELDS = tuple(field.name for field in fields(AddressInfo) if field.name != "InformationComponents")
+_ERROR_FIELDS = tuple(field.name for field in fields(Error))
+
+
+def loads(content: Union[bytes, str]) -> dict:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _is_failover_error(data: dict) -> bool:
+    # Error.TypeCode 3 means the service itself failed; the call should be retried on the backup
+    error = data.get("Error")
+    return error is not None and error.get("TypeCode") == "3"
+
+
+def _type_code(data: dict) -> Optional[str]:
+    error = data.get("Error")
+    return error.get("TypeCode") if error else None
+
+
+def parse_response(data: dict) -> AddressInfoResponse:
+    """
+    Convert a GetAddressInfo JSON payload into an AddressInfoResponse.
+
+    Parameters:
+        data: The decoded JSON payload, with optional "AddressInfo" and "Error" objects.
+            Missing fields become None; unknown fields are ignored.
+
+    Returns:
+        AddressInfoResponse: The structured response.
+    """
+    error = data.get("Error")
+    if error:
+        get = error.get
+        error = Error(*[get(name) for name in _ERROR_FIELDS])
+    else:
+        error = None
+
+    address_info = data.get("AddressInfo")
+    if address_info:
+        get = address_info.get
+        components = get("InformationComponents") or ()
+        address_info = AddressInfo(
+            *[get(name) for name in _ADDRESS_INFO_FIELDS],
+            [InformationComponent(component.get("Name"), component.get("Value")) for component in components]
+        )
+    else:
+        address_info = None
+
+    return AddressInfoResponse(address_info, error)
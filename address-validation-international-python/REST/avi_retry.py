@@ -0,0 +1,96 @@
+import numbers
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+class RetryableError(RuntimeError):
+    """
+    A call failed in a way a later attempt may not: timeout, connection failure, HTTP 5xx,
+    unreadable response, Error TypeCode 3 or an open circuit.
+    """
+
+
+class DeadlineExceeded(RuntimeError):
+    """Raised when a call's deadline passed before any endpoint gave a usable answer."""
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How often, and how long after, a call that failed with a RetryableError is tried again.
+
+    Each retry repeats the whole call (primary, then backup) and waits a jittered, exponentially
+    growing delay first: a random value between (1 - jitter) and 1 times
+    min(max_delay, base_delay * multiplier ** retry). With the default full jitter, clients that
+    failed together do not retry together. Retries never outlast the call's deadline.
+
+    max_retries: Retries after the first try. 0 disables retrying.
+    base_delay: Seconds before the first retry, before jitter.
+    max_delay: Upper bound of the delay, before jitter.
+    multiplier: Factor the delay grows by with every retry.
+    jitter: Fraction of the delay that is randomized, from 0 (none) to 1 (full jitter).
+    """
+    max_retries: int = 2
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    multiplier: float = 2.0
+    jitter: float = 1.0
+
+    def __post_init__(self):
+        if self.max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+    def delay(self, retry: int) -> float:
+        """Return the seconds to wait before retry number retry (0 for the first retry)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** retry)
+        return random.uniform((1 - self.jitter) * delay, delay)
+
+
+class Deadline:
+    __slots__ = ("budget", "expires_at")
+
+    def __init__(self, budget: Optional[float]):
+        """
+        The time a call may take in total, spent down by every attempt, failover and retry wait.
+
+        budget: Seconds from now, or None for no deadline.
+
+        Raises:
+            ValueError: If budget is not a number (or None).
+        """
+        # Checked here, so a budget read from text fails clearly instead of partway through the call
+        if budget is not None and (isinstance(budget, bool) or not isinstance(budget, numbers.Real)):
+            raise ValueError(f"deadline must be a number of seconds or None, not {budget!r}")
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget if budget is not None else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, never below 0, or None without a deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def exceeded(self) -> DeadlineExceeded:
+        return DeadlineExceeded(f"AVI call deadline of {self.budget}s exceeded")
+
+    def timeouts(self, connect: float, read: float) -> Tuple[float, float, bool]:
+        """
+        Return the connect and read timeouts for the next attempt, cut down to the time left, and
+        whether either was cut.
+
+        Raises:
+            DeadlineExceeded: If no time is left.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return connect, read, False
+        if remaining <= 0:
+            raise self.exceeded()
+        return min(connect, remaining), min(read, remaining), read > remaining or connect > remaining
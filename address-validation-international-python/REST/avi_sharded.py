@@ -0,0 +1,311 @@
+import io
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .avi_batch import BatchResult
+from .avi_bulk import ResultWriter, build_limiter, flatten_result, validate_rows
+from .avi_cache import ResponseCache, SQLiteCacheBackend
+from .avi_cassette import CassettePlayer, ReplayLatency
+from .avi_response import GetAddressInfoInput
+from .get_address_info_rest import AVIRestClient
+
+
+@dataclass
+class ShardConfig:
+    """
+    How each worker process builds its client and writes its results. Sent to every process, so it must pickle.
+
+    output_format: "csv" or "jsonl".
+    threads: Concurrent validations per process, and the size of its connection pool.
+    cache_db: SQLite response cache file shared by every process (and by later runs), or None.
+    cache_size: In-memory cache entries per process.
+    max_qps: Calls started per second per process, or None for no cap.
+    adaptive: Adapt each process's concurrency, up to threads, to the service's health (see avi_limiter).
+    prevalidate: Answer inputs the service would reject locally (see avi_prevalidation).
+    dedup: Validate each distinct address in a chunk once (see AVIRestClient.validate_many).
+    endpoints: primary_url, backup_url and trial_url overrides for AVIRestClient.
+    parts_dir: Have each worker write its chunks to their own files in this directory instead of
+        sending the rows back to the parent (see part_path).
+    replay_cassette: Answer every call from this cassette instead of the service (see avi_cassette.CassettePlayer).
+        Every process maps the same file, so its pages are shared between them.
+    replay_latency: Synthetic latency of replayed calls, or None for none.
+    """
+    output_format: str = "csv"
+    threads: int = 10
+    cache_db: Optional[str] = None
+    cache_size: int = 100000
+    max_qps: Optional[float] = None
+    adaptive: bool = False
+    prevalidate: bool = False
+    dedup: bool = True
+    endpoints: Dict[str, str] = field(default_factory=dict)
+    parts_dir: Optional[str] = None
+    replay_cassette: Optional[str] = None
+    replay_latency: Optional[ReplayLatency] = None
+
+
+@dataclass
+class ChunkResult:
+    # text holds the rendered rows (no CSV header) unless they were written to path
+    first_row: int
+    rows: int
+    failures: int
+    text: Optional[str] = None
+    path: Optional[str] = None
+    abandoned: bool = False
+    duplicates: int = 0
+
+    def __str__(self) -> str:
+        return (f"ChunkResult: first_row={self.first_row}, rows={self.rows}, failures={self.failures}, "
+                f"path={self.path}, abandoned={self.abandoned}, duplicates={self.duplicates}")
+
+
+@dataclass
+class ShardStats:
+    # failures: rows with an Error or Exception; abandoned chunks' rows are counted there too
+    # duplicates: rows answered with the result of an earlier row of their chunk, without a call
+    rows: int = 0
+    failures: int = 0
+    duplicates: int = 0
+    chunks: int = 0
+    chunks_skipped: int = 0
+    chunks_retried: int = 0
+    chunks_abandoned: int = 0
+    worker_crashes: int = 0
+
+    def __str__(self) -> str:
+        return (f"ShardStats: rows={self.rows}, failures={self.failures}, duplicates={self.duplicates}, "
+                f"chunks={self.chunks}, "
+                f"chunks_skipped={self.chunks_skipped}, chunks_retried={self.chunks_retried}, "
+                f"chunks_abandoned={self.chunks_abandoned}, worker_crashes={self.worker_crashes}")
+
+
+def part_path(parts_dir: str, first_row: int, rows: int, output_format: str) -> str:
+    """Return the file a chunk is written to in per-shard mode, named by its first and last row."""
+    return os.path.join(parts_dir, f"part-{first_row:010d}-{first_row + rows - 1:010d}.{output_format}")
+
+
+def _render(first_row: int, results: Iterable[BatchResult], output_format: str, write_header: bool):
+    buffer = io.StringIO()
+    writer = ResultWriter(buffer, output_format, write_header)
+    rows = failures = 0
+    for result in results:
+        record = flatten_result(first_row + result.index, result)
+        if record["Exception"] or record["ErrorTypeCode"]:
+            failures += 1
+        writer.write(record)
+        rows += 1
+    return buffer.getvalue(), rows, failures
+
+
+def _finish(config: ShardConfig, first_row: int, results: Iterable[BatchResult]) -> ChunkResult:
+    if config.parts_dir is None:
+        text, rows, failures = _render(first_row, results, config.output_format, write_header=False)
+        return ChunkResult(first_row, rows, failures, text=text)
+    # Each part is complete on its own, header included, and appears atomically
+    text, rows, failures = _render(first_row, results, config.output_format, write_header=True)
+    path = part_path(config.parts_dir, first_row, rows, config.output_format)
+    with open(path + ".tmp", "w", encoding="utf-8", newline="") as handle:
+        handle.write(text)
+    os.replace(path + ".tmp", path)
+    return ChunkResult(first_row, rows, failures, path=path)
+
+
+# Per-process state, set up once by _init_worker
+_worker_config: Optional[ShardConfig] = None
+_worker_client: Optional[AVIRestClient] = None
+
+
+def _init_worker(config: ShardConfig) -> None:
+    global _worker_config, _worker_client
+    cache = None
+    if config.cache_db:
+        cache = ResponseCache(maxsize=config.cache_size, backend=SQLiteCacheBackend(config.cache_db))
+    limiter = build_limiter(config.threads, config.max_qps, config.adaptive)
+    cassette = None
+    if config.replay_cassette:
+        cassette = CassettePlayer(config.replay_cassette, config.replay_latency)
+    _worker_config = config
+    _worker_client = AVIRestClient(pool_size=config.threads, cache=cache, prevalidate=config.prevalidate,
+                                   limiter=limiter, cassette=cassette, **config.endpoints)
+
+
+def _validate_chunk(first_row: int, inputs: List[GetAddressInfoInput]) -> ChunkResult:
+    # Runs in a worker: validation, parsing and serialization all stay off the parent's GIL
+    # A worker runs one chunk at a time, so the change in its client's counters is this chunk's
+    duplicates = _worker_client.dedup_stats().duplicates
+    results = validate_rows(_worker_client, inputs, max_workers=_worker_config.threads, dedup=_worker_config.dedup)
+    result = _finish(_worker_config, first_row, results)
+    result.duplicates = _worker_client.dedup_stats().duplicates - duplicates
+    return result
+
+
+class _Chunk:
+    __slots__ = ("first_row", "inputs", "attempts", "future")
+
+    def __init__(self, first_row: int, inputs: List[GetAddressInfoInput]):
+        self.first_row = first_row
+        self.inputs = inputs
+        self.attempts = 0
+        self.future: Optional[Future] = None
+
+
+class ShardedRunner:
+    def __init__(
+        self,
+        config: ShardConfig,
+        processes: Optional[int] = None,
+        chunk_size: int = 500,
+        max_in_flight: Optional[int] = None,
+        max_retries: int = 2,
+    ):
+        """
+        Validates a stream of addresses on a pool of worker processes, each with its own pooled
+        AVIRestClient built from config.
+
+        The input is cut into chunks of chunk_size rows. Each chunk is validated, flattened and
+        rendered to CSV or JSONL inside a worker. The parent only reads input and writes finished
+        text, so thousands of responses per second are not limited by one interpreter's GIL.
+
+        If a worker process dies, the pool is rebuilt and the chunks that were in flight are sent
+        again; rows those chunks already validated are answered from the shared cache_db. A chunk
+        that is in flight for more than max_retries crashes, or that raises in the worker more
+        than max_retries times, is abandoned: its rows are reported with an Exception instead, so
+        the rest of the job carries on.
+
+        config: How workers build their client and write results.
+        processes: Number of worker processes. Defaults to os.cpu_count().
+        chunk_size: Rows per chunk.
+        max_in_flight: Chunks submitted but not yet yielded. Defaults to 2 * processes.
+        max_retries: Times a chunk is sent again after a crash or worker exception.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.config = config
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight or 2 * self.processes
+        self.max_retries = max_retries
+        self._stats = ShardStats()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def stats(self) -> ShardStats:
+        return ShardStats(**vars(self._stats))
+
+    def _submit(self, chunk: _Chunk) -> None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.processes, initializer=_init_worker, initargs=(self.config,))
+        chunk.attempts += 1
+        chunk.future = self._executor.submit(_validate_chunk, chunk.first_row, chunk.inputs)
+
+    def _restart(self, in_flight: List[_Chunk]) -> None:
+        # A dead worker breaks the whole pool: start a new one and resubmit everything unfinished
+        self._stats.worker_crashes += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        for chunk in in_flight:
+            if chunk.future.done() and not _crashed(chunk.future):
+                continue
+            if chunk.attempts <= self.max_retries:
+                self._stats.chunks_retried += 1
+                self._submit(chunk)
+            else:
+                chunk.future = _failed_future(RuntimeError(
+                    f"Worker process crashed {chunk.attempts} times while this chunk was in flight"))
+
+    def _result(self, chunk: _Chunk) -> Optional[ChunkResult]:
+        # The chunk's result, or None if it was resubmitted after a worker exception
+        exception = chunk.future.exception()
+        if exception is None:
+            return chunk.future.result()
+        if chunk.attempts <= self.max_retries and not isinstance(exception, _Abandoned):
+            self._stats.chunks_retried += 1
+            self._submit(chunk)
+            return None
+        self._stats.chunks_abandoned += 1
+        results = (BatchResult(index=index, input=item, exception=exception) for index, item in enumerate(chunk.inputs))
+        result = _finish(self.config, chunk.first_row, results)
+        result.abandoned = True
+        return result
+
+    def run(self, inputs: Iterable[GetAddressInfoInput], first_row: int = 1, ordered: bool = True,
+            skip_parts: bool = False) -> Iterator[ChunkResult]:
+        """
+        Validate inputs, yielding one ChunkResult per chunk.
+
+        Parameters:
+            inputs: The addresses to validate. May be a generator; it is consumed lazily.
+            first_row: Row number of the first input, used in the output Row column.
+            ordered: Yield chunks in input order when True, as they complete otherwise.
+            skip_parts: In per-shard mode, skip chunks whose part file already exists, so a job
+                resumes where it stopped. Only valid with the same chunk_size as the earlier run.
+
+        Returns:
+            Iterator[ChunkResult]: Chunks in the requested order. Skipped chunks are not yielded.
+        """
+        iterator = iter(inputs)
+        in_flight: List[_Chunk] = []
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self.max_in_flight:
+                    items = list(islice(iterator, self.chunk_size))
+                    if not items:
+                        exhausted = True
+                        break
+                    chunk = _Chunk(first_row, items)
+                    first_row += len(items)
+                    if skip_parts and self.config.parts_dir is not None and os.path.exists(
+                            part_path(self.config.parts_dir, chunk.first_row, len(items), self.config.output_format)):
+                        self._stats.chunks_skipped += 1
+                        continue
+                    self._submit(chunk)
+                    in_flight.append(chunk)
+                if not in_flight:
+                    return
+
+                if ordered:
+                    candidates = [in_flight[0]]
+                    wait([in_flight[0].future])
+                else:
+                    done, _ = wait([chunk.future for chunk in in_flight], return_when=FIRST_COMPLETED)
+                    candidates = [chunk for chunk in in_flight if chunk.future in done]
+
+                if any(_crashed(chunk.future) for chunk in candidates):
+                    self._restart(in_flight)
+                    continue
+                for chunk in candidates:
+                    result = self._result(chunk)
+                    if result is None:
+                        continue
+                    in_flight.remove(chunk)
+                    self._stats.chunks += 1
+                    self._stats.rows += result.rows
+                    self._stats.failures += result.failures
+                    self._stats.duplicates += result.duplicates
+                    yield result
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+class _Abandoned(RuntimeError):
+    pass
+
+
+def _crashed(future: Future) -> bool:
+    # Futures of a broken pool fail with BrokenProcessPool, or are cancelled when it shuts down
+    if not future.done():
+        return False
+    return future.cancelled() or isinstance(future.exception(), BrokenProcessPool)
+
+
+def _failed_future(exception: BaseException) -> Future:
+    future = Future()
+    future.set_exception(_Abandoned(str(exception)))
+    return future
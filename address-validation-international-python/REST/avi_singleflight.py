@@ -0,0 +1,156 @@
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from .avi_retry import Deadline
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    # calls: upstream calls made; collapsed: callers that shared another caller's upstream call
+    calls: int = 0
+    collapsed: int = 0
+
+    def __str__(self) -> str:
+        return f"SingleFlightStats: calls={self.calls}, collapsed={self.collapsed}"
+
+
+class _Flight:
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Collapses concurrent calls that share a key into one call, for threads.
+
+        While a call for a key is running, further callers with the same key wait for it and
+        receive its result, or its exception, instead of starting their own. Once it finishes
+        the key is released, so later callers start a fresh call; results are not cached.
+        """
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = SingleFlightStats()
+
+    def do(
+        self,
+        key: Hashable,
+        call: Callable[[], T],
+        on_shared: Optional[Callable[[], None]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[T, bool]:
+        """
+        Run call(), or wait for the call already running for key.
+
+        Parameters:
+            key: Identifies calls that may share a result.
+            call: Makes the upstream call. Only the first concurrent caller for key runs it.
+            on_shared: Called before waiting when this caller joins a call already in flight.
+            deadline: This caller's own deadline. A caller waiting on another's call stops waiting
+                when it passes, even if the call it joined has a later one; the call goes on for the others.
+
+        Returns:
+            Tuple[T, bool]: The call's result, and whether it was shared from another caller.
+
+        Raises:
+            Whatever call() raised, in every caller waiting on it.
+            avi_retry.DeadlineExceeded: If deadline passed while waiting on another caller's call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            shared = flight is not None
+            if shared:
+                self._stats.collapsed += 1
+            else:
+                flight = self._flights[key] = _Flight()
+                self._stats.calls += 1
+        if shared:
+            if on_shared is not None:
+                on_shared()
+            if not flight.done.wait(deadline.remaining() if deadline is not None else None):
+                raise deadline.exceeded()
+            if flight.exception is not None:
+                raise flight.exception
+            return flight.result, True
+
+        try:
+            flight.result = call()
+        except BaseException as exc:
+            flight.exception = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(**vars(self._stats))
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        """
+        Collapses concurrent calls that share a key into one call, for coroutines on one event loop.
+
+        The shared call runs as its own task, so a caller that is cancelled, including the one
+        that started it, does not cancel it for the others.
+        """
+        self._flights: Dict[Hashable, "asyncio.Future"] = {}
+        self._stats = SingleFlightStats()
+
+    async def do(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+        on_shared: Optional[Callable[[], None]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[T, bool]:
+        """
+        Await call(), or the call already running for key. Parameters, returns and raises as SingleFlight.do.
+        """
+        # Imported here so synchronous clients do not pay for loading asyncio
+        import asyncio
+        task = self._flights.get(key)
+        shared = task is not None
+        if shared:
+            self._stats.collapsed += 1
+            if on_shared is not None:
+                on_shared()
+        else:
+            task = asyncio.ensure_future(call())
+            self._flights[key] = task
+            self._stats.calls += 1
+
+            def release(finished: asyncio.Future) -> None:
+                if self._flights.get(key) is finished:
+                    del self._flights[key]
+                # Mark the exception as retrieved in case every caller was cancelled
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(release)
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is None:
+            return await asyncio.shield(task), shared
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), remaining), shared
+        except asyncio.TimeoutError as exc:
+            # Only this caller gives up; the shielded call still answers the others
+            if task.done():
+                raise
+            raise deadline.exceeded() from exc
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(**vars(self._stats))
@@ -1,10 +1,637 @@
-from avi_response import AddressInfoResponse, AddressInfo, InformationComponent, Error
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .avi_batch import DEDUP_WINDOW, BatchResult, DedupStats, run_batch
+from .avi_cache import ResponseCache, cache_key
+from .avi_canonical import batch_key
+from .avi_cassette import CassettePlayer, CassetteRecorder
+from .avi_health import EndpointHealth, default_endpoint_health
+from .avi_hedging import HedgePolicy, HedgeStats, Hedger
+from .avi_limiter import IGNORE, OVERLOAD, SUCCESS, AdaptiveLimiter, LimiterTimeout
+from .avi_metrics import (
+    ATTEMPT_END, ATTEMPT_START, CACHE_HIT, CACHE_MISS, CALL_END, CIRCUIT_OPEN, COALESCED, CONNECTION_ERROR,
+    DEDUPLICATED, ERROR, EXCEPTION, FAILOVER, HTTP_ERROR, INVALID_RESPONSE, OK, REJECTED, RETRY, TIMEOUT, TYPE_CODE_3,
+    CallEvent, Observer, response_outcome,
+)
+from .avi_prevalidation import prevalidate as prevalidate_input
+from .avi_retry import Deadline, RetryPolicy, RetryableError
+from .avi_singleflight import SingleFlight, SingleFlightStats
+from .avi_response import (
+    AddressInfoResponse, GetAddressInfoInput, _is_failover_error, _type_code, backup_url, loads, parse_response,
+    primary_url, trial_url,
+)
 import requests
+from requests.adapters import HTTPAdapter
+
+
+class AVIRestClient:
+    # Client name carried by this client's CallEvents
+    _client_name = "rest"
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        timeout: float = 10,
+        prewarm: bool = False,
+        is_live: bool = True,
+        primary_url: str = primary_url,
+        backup_url: str = backup_url,
+        trial_url: str = trial_url,
+        cache: Optional[ResponseCache] = None,
+        health: Optional[EndpointHealth] = None,
+        hedging: Optional[HedgePolicy] = None,
+        observers: Optional[List[Observer]] = None,
+        single_flight: bool = False,
+        prevalidate: bool = False,
+        limiter: Optional[AdaptiveLimiter] = None,
+        connect_timeout: Optional[float] = None,
+        deadline: Optional[float] = 15,
+        retry: Optional[RetryPolicy] = None,
+        cassette: Optional[Union[CassetteRecorder, CassettePlayer]] = None,
+    ):
+        """
+        Long-lived client for the AVI GetAddressInfo REST endpoint.
+
+        Holds one requests.Session per endpoint so TCP and TLS handshakes are paid once per
+        process instead of once per call. A single instance is safe to share across threads.
+
+        pool_size: Maximum number of pooled connections kept open per endpoint.
+        keep_alive: Whether to reuse connections between calls. When False, every call closes its connection.
+        timeout: Read timeout of each attempt, in seconds: how long to wait for the endpoint to answer.
+        prewarm: Open a connection to the endpoints for is_live up front (see warm_up).
+        is_live: Which endpoints to pre-warm when prewarm is True.
+        primary_url: Override for the primary (live) endpoint URL.
+        backup_url: Override for the backup (live) endpoint URL.
+        trial_url: Override for the trial endpoint URL.
+        cache: Optional response cache consulted before calling the service. Only results without an Error are stored.
+        health: Optional endpoint health tracker. While the primary's circuit is open, calls go straight to the backup.
+        hedging: Optional hedging policy for live calls. A primary call that is still running after the policy's
+            delay is duplicated to the backup and the first valid response wins.
+        observers: Optional callables receiving a CallEvent for every attempt, failover, cache lookup and
+            completed call (see add_observer).
+        single_flight: Collapse concurrent calls for the same address, license key and mode into one
+            upstream call whose result (or exception) every caller receives.
+        prevalidate: Check each input locally first (see avi_prevalidation.prevalidate). An input the service
+            would reject is answered with an AddressInfoResponse carrying the Error, without a call; a
+            recognized Country is sent as its ISO 3166-1 alpha-3 code.
+        limiter: Optional rate cap and adaptive concurrency limit (see avi_limiter.AdaptiveLimiter). Every
+            attempt, including failover and hedged attempts, waits for a permit, and timeouts, HTTP 5xx and
+            TypeCode 3 make the limiter back off. Share one instance between clients to limit them together.
+        connect_timeout: Connect timeout of each attempt, in seconds. Defaults to timeout.
+        deadline: Default total seconds a call may take, across the primary, backup, hedged attempts,
+            retries and their backoff; each attempt's timeouts are cut to the time left. Overridden per
+            call by timeout_seconds (GetAddressInfoInput.TimeoutSeconds in validate_many). None for no deadline.
+        retry: Optional retry policy (see avi_retry.RetryPolicy). A call that failed on every endpoint with a
+            timeout, connection failure, HTTP 5xx, unreadable response, TypeCode 3 or an open circuit is
+            tried again after a jittered exponential backoff, while its deadline allows.
+        cassette: Optional avi_cassette.CassetteRecorder, which records every answer the service gives, or
+            avi_cassette.CassettePlayer, which answers every call from a recording instead of the service.
+        """
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout if connect_timeout is not None else timeout
+        self.deadline = deadline
+        self.retry = retry
+        self.cassette = cassette
+        self.primary_url = primary_url
+        self.backup_url = backup_url
+        self.trial_url = trial_url
+        self.cache = cache
+        self.health = health
+        self._hedger = Hedger(hedging) if hedging is not None else None
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_executor_lock = threading.Lock()
+        self.prevalidate = prevalidate
+        self.limiter = limiter
+        self._observers: List[Observer] = list(observers or ())
+        self._single_flight = SingleFlight() if single_flight else None
+        self._dedup_stats = DedupStats()
+        self._dedup_lock = threading.Lock()
+
+        # One session (and therefore one connection pool) per endpoint
+        self._sessions: Dict[str, requests.Session] = {
+            url: self._create_session() for url in (primary_url, backup_url, trial_url)
+        }
+
+        if prewarm:
+            self.warm_up(is_live)
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def warm_up(self, is_live: bool = True) -> None:
+        """
+        Open a pooled connection to each endpoint used in the given mode so the first
+        validation does not pay for the TCP and TLS handshake.
+
+        Parameters:
+            is_live: Warm the primary and backup endpoints when True, the trial endpoint otherwise.
+
+        Failures are ignored; the connection is simply established on first use instead.
+        """
+        urls = (self.primary_url, self.backup_url) if is_live else (self.trial_url,)
+        for url in urls:
+            parts = urlsplit(url)
+            try:
+                self._sessions[url].head(f"{parts.scheme}://{parts.netloc}/",
+                                         timeout=(self.connect_timeout, self.timeout))
+            except requests.RequestException:
+                pass
+
+    def close(self) -> None:
+        """Close every pooled connection held by this client."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        for session in self._sessions.values():
+            session.close()
+
+    def hedge_stats(self) -> Optional[HedgeStats]:
+        """Return hedging counters, or None if hedging is not enabled."""
+        return self._hedger.stats() if self._hedger is not None else None
+
+    def single_flight_stats(self) -> Optional[SingleFlightStats]:
+        """Return upstream and collapsed call counters, or None if single-flight is not enabled."""
+        return self._single_flight.stats() if self._single_flight is not None else None
+
+    def dedup_stats(self) -> DedupStats:
+        """Return the inputs and duplicates seen by deduplicating validate_many batches so far."""
+        with self._dedup_lock:
+            return DedupStats(**vars(self._dedup_stats))
+
+    def add_observer(self, observer: Observer) -> None:
+        """
+        Register observer(event), called synchronously with a CallEvent (see avi_metrics) for every
+        attempt start and end, failover, cache lookup and completed call. Observers run on the
+        calling thread, so they should be quick. Without observers no events are built.
+        """
+        self._observers.append(observer)
+
+    def _emit(self, kind: str, **fields) -> None:
+        event = CallEvent(kind, self._client_name, **fields)
+        for observer in self._observers:
+            observer(event)
+
+    def _role(self, url: str) -> str:
+        if url == self.primary_url:
+            return "primary"
+        return "backup" if url == self.backup_url else "trial"
+
+    def __enter__(self) -> "AVIRestClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get(self, url: str, params: dict, timeout: Tuple[float, float]) -> dict:
+        response = self._sessions[url].get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        try:
+            return loads(response.content)
+        except ValueError as exc:
+            # Keep malformed bodies on the RequestException path, as response.json() did
+            raise requests.exceptions.InvalidJSONError(str(exc)) from exc
+
+    def get_address_info(
+        self,
+        address1: str,
+        address2: str,
+        address3: str,
+        address4: str,
+        address5: str,
+        locality: str,
+        administrative_area: str,
+        postal_code: str,
+        country: str,
+        output_language: str,
+        license_key: str,
+        is_live: bool = True,
+        timeout_seconds: Optional[float] = None
+    ) -> AddressInfoResponse:
+        """
+        Call ServiceObjects Address Validation International (AVI) API's GetAddressInfo endpoint
+        over this client's pooled connections. See get_address_info for parameter details.
+
+        Returns:
+            AddressInfoResponse: Parsed JSON response with validated address details or error details.
+
+        Raises:
+            RuntimeError: If the API returns an error payload.
+            avi_retry.RetryableError: If the failure was transient (see RetryPolicy), after any retries.
+            avi_retry.DeadlineExceeded: If the deadline passed without a usable answer.
+            avi_cassette.CassetteMiss: If replaying a cassette that did not record the address.
+        """
+        observed = bool(self._observers)
+        started = time.perf_counter() if observed else 0.0
+        deadline = Deadline(timeout_seconds if timeout_seconds is not None else self.deadline)
+        if self.prevalidate:
+            item, error = prevalidate_input(GetAddressInfoInput(
+                address1, address2, address3, address4, address5, locality, administrative_area,
+                postal_code, country, output_language, license_key, is_live
+            ))
+            if error is not None:
+                if observed:
+                    self._emit(REJECTED, type_code=error.TypeCode)
+                    self._emit(CALL_END, latency=time.perf_counter() - started, type_code=error.TypeCode,
+                               outcome=ERROR)
+                return AddressInfoResponse(Error=error)
+            country, output_language = item.Country, item.OutputLanguage
+
+        key = None
+        if self.cache is not None or self._single_flight is not None or self.cassette is not None:
+            key = cache_key(address1, address2, address3, address4, address5, locality,
+                            administrative_area, postal_code, country, output_language)
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if observed:
+                self._emit(CACHE_MISS if data is None else CACHE_HIT)
+            if data is not None:
+                if observed:
+                    self._emit(CALL_END, latency=time.perf_counter() - started, outcome=OK)
+                return parse_response(data)
+
+        params = {
+            "Address1": address1,
+            "Address2": address2,
+            "Address3": address3,
+            "Address4": address4,
+            "Address5": address5,
+            "Locality": locality,
+            "AdministrativeArea": administrative_area,
+            "PostalCode": postal_code,
+            "Country": country,
+            "OutputLanguage": output_language,
+            "LicenseKey": license_key,
+        }
+        shared = False
+        try:
+            if self._single_flight is None:
+                data = self._call(key, params, is_live, deadline)
+            else:
+                # The license key and mode change the outcome, so only identical calls are collapsed
+                data, shared = self._single_flight.do(
+                    (key, license_key, is_live),
+                    lambda: self._call(key, params, is_live, deadline),
+                    on_shared=(lambda: self._emit(COALESCED)) if observed else None,
+                    deadline=deadline,
+                )
+        except Exception as exc:
+            if observed:
+                self._emit(CALL_END, latency=time.perf_counter() - started, outcome=EXCEPTION, exception=exc)
+            raise
+
+        # Error payloads are never cached, so a transient service problem is not replayed
+        if self.cache is not None and not shared and not data.get("Error"):
+            self.cache.set(key, data)
+
+        if observed:
+            type_code = _type_code(data)
+            self._emit(CALL_END, latency=time.perf_counter() - started, type_code=type_code,
+                       outcome=response_outcome(type_code))
+
+        # Convert JSON response to AddressInfoResponse for structured access
+        return parse_response(data)
+
+    def _allow(self, url: str) -> bool:
+        return self.health is None or self.health.allow_request(url)
+
+    def _attempt(self, url: str, params: dict, deadline: Deadline) -> dict:
+        # Single call to one endpoint, reporting the outcome to the limiter, health tracker and observers
+        permit = None
+        if self.limiter is not None:
+            try:
+                permit = self.limiter.acquire(deadline.remaining())
+            except LimiterTimeout as exc:
+                if deadline.expired():
+                    raise deadline.exceeded() from exc
+                raise
+        try:
+            connect_timeout, read_timeout, cut = deadline.timeouts(self.connect_timeout, self.timeout)
+        except BaseException:
+            if permit is not None:
+                self.limiter.release(permit, IGNORE)
+            raise
+        observed = bool(self._observers)
+        if observed:
+            endpoint, role = EndpointHealth.endpoint_for(url), self._role(url)
+            self._emit(ATTEMPT_START, endpoint=endpoint, role=role)
+            started = time.perf_counter()
+        try:
+            data = self._get(url, params, (connect_timeout, read_timeout))
+        except requests.RequestException as exc:
+            # A timeout cut short by the deadline says nothing about the endpoint's health or load
+            cut_short = cut and isinstance(exc, requests.Timeout)
+            if permit is not None:
+                self.limiter.release(permit, IGNORE if cut_short else _limiter_signal(exc))
+            if self.health is not None and not cut_short:
+                if _is_endpoint_failure(exc):
+                    self.health.record_failure(url)
+                else:
+                    self.health.record_success(url)
+            if observed:
+                self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                           http_status=_http_status(exc), outcome=EXCEPTION, exception=exc)
+            raise
+        except BaseException as exc:
+            # Never leak a permit, whatever interrupted the call, and close the attempt for observers so
+            # in-flight counts return to zero (e.g. a 200 reply that is not JSON raises ValueError)
+            if permit is not None:
+                self.limiter.release(permit, IGNORE)
+            if observed:
+                self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                           outcome=EXCEPTION, exception=exc)
+            raise
+        if permit is not None:
+            self.limiter.release(permit, OVERLOAD if _is_failover_error(data) else SUCCESS)
+        if self.health is not None:
+            if _is_failover_error(data):
+                self.health.record_failure(url)
+            else:
+                self.health.record_success(url)
+        if observed:
+            type_code = _type_code(data)
+            self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                       http_status=200, type_code=type_code, outcome=response_outcome(type_code))
+        return data
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            with self._hedge_executor_lock:
+                if self._hedge_executor is None:
+                    # Each hedged call can occupy two workers: the primary and its hedge
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=2 * self.pool_size, thread_name_prefix="avi-hedge"
+                    )
+        return self._hedge_executor
+
+    def _attempt_timed(self, params: dict, deadline: Deadline) -> dict:
+        # Unhedged primary attempt; its latency still feeds the hedge percentile when hedging is on
+        if self._hedger is None:
+            return self._attempt(self.primary_url, params, deadline)
+        started = time.perf_counter()
+        try:
+            return self._attempt(self.primary_url, params, deadline)
+        finally:
+            self._hedger.record_primary_latency(time.perf_counter() - started)
+
+    def _attempt_hedged(self, params: dict, delay: float, deadline: Deadline) -> dict:
+        # Run the primary on a worker so we can stop waiting on it once the hedge answers
+        executor = self._get_hedge_executor()
+        started = time.perf_counter()
+        primary = executor.submit(self._attempt, self.primary_url, params, deadline)
+
+        def record_latency(future: Future) -> None:
+            # Record every primary latency, including calls that lose the race, fail or time out, so the
+            # percentile is not biased low
+            if not future.cancelled():
+                self._hedger.record_primary_latency(time.perf_counter() - started)
+
+        primary.add_done_callback(record_latency)
+
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._hedger.try_hedge() or not self._allow(self.backup_url):
+            return primary.result()
+
+        backup = executor.submit(self._attempt, self.backup_url, params, deadline)
+        pending = {primary, backup}
+        failures: Dict[Future, Exception] = {}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    data = future.result()
+                except requests.RequestException as exc:
+                    failures[future] = exc
+                    continue
+                if _is_failover_error(data):
+                    failures[future] = RetryableError(f"AVI service error: {data['Error']}")
+                    continue
+                # First valid response wins; the loser is dropped (a request already on the wire runs to completion)
+                for loser in pending:
+                    loser.cancel()
+                if future is backup:
+                    self._hedger.record_hedge_won()
+                return data
+        backup_exc = failures.get(backup)
+        raise _error_type(backup_exc)("AVI service unreachable on both endpoints") from backup_exc
+
+    def _call(self, key: Optional[str], params: dict, is_live: bool, deadline: Deadline) -> dict:
+        # The service's answer, or the cassette's in its place
+        if isinstance(self.cassette, CassettePlayer):
+            return self._replay(key, deadline)
+        started = time.perf_counter()
+        data = self._fetch(params, is_live, deadline)
+        if self.cassette is not None:
+            self.cassette.record(key, data, time.perf_counter() - started)
+        return data
+
+    def _replay(self, key: str, deadline: Deadline) -> dict:
+        data, delay = self.cassette.play(key)
+        remaining = deadline.remaining()
+        if remaining is not None and delay > remaining:
+            # The recorded answer would arrive too late, as a slow endpoint's would
+            time.sleep(remaining)
+            raise deadline.exceeded()
+        if delay > 0:
+            time.sleep(delay)
+        return data
+
+    def _fetch(self, params: dict, is_live: bool, deadline: Deadline) -> dict:
+        # One round of attempts, repeated under the retry policy while it fails transiently and time is left
+        retries = 0
+        while True:
+            try:
+                return self._fetch_once(params, is_live, deadline)
+            except RetryableError as exc:
+                if deadline.expired():
+                    raise deadline.exceeded() from exc
+                if self.retry is None or retries >= self.retry.max_retries:
+                    raise
+                delay = self.retry.delay(retries)
+                remaining = deadline.remaining()
+                if remaining is not None and delay >= remaining:
+                    raise
+                retries += 1
+                if self._observers:
+                    self._emit(RETRY, latency=delay, exception=exc)
+                time.sleep(delay)
+
+    def _fetch_once(self, params: dict, is_live: bool, deadline: Deadline) -> dict:
+        if not is_live:
+            # Trial mode has no backup, so any failure ends the round
+            if not self._allow(self.trial_url):
+                raise RetryableError("AVI trial error: circuit open for the trial endpoint")
+            try:
+                data = self._attempt(self.trial_url, params, deadline)
+            except requests.RequestException as req_exc:
+                raise _error_type(req_exc)(f"AVI trial error: {str(req_exc)}") from req_exc
+            if _is_failover_error(data):
+                raise RetryableError(f"AVI trial error: {data['Error']}")
+            return data
+
+        primary_exc = None
+        primary_allowed = self._allow(self.primary_url)
+        if primary_allowed:
+            hedge_delay = self._hedger.begin_call() if self._hedger is not None else None
+            try:
+                # Attempt primary endpoint
+                if hedge_delay is None:
+                    data = self._attempt_timed(params, deadline)
+                else:
+                    data = self._attempt_hedged(params, hedge_delay, deadline)
+                if not _is_failover_error(data):
+                    return data
+            except requests.RequestException as req_exc:
+                # Network or HTTP-level error occurred
+                primary_exc = req_exc
+
+        # Fall back to the backup: primary failed, returned TypeCode 3, or its circuit is open
+        if self._observers:
+            if not primary_allowed:
+                reason = CIRCUIT_OPEN
+            else:
+                reason = _failure_reason(primary_exc) if primary_exc is not None else TYPE_CODE_3
+            self._emit(FAILOVER, endpoint=EndpointHealth.endpoint_for(self.primary_url), role="primary",
+                       reason=reason, exception=primary_exc)
+        if not self._allow(self.backup_url):
+            raise RetryableError("AVI service unreachable on both endpoints") from primary_exc
+        if deadline.expired():
+            raise deadline.exceeded() from primary_exc
+        try:
+            data = self._attempt(self.backup_url, params, deadline)
+        except requests.RequestException as backup_exc:
+            raise _error_type(backup_exc)("AVI service unreachable on both endpoints") from backup_exc
+
+        # If still error, propagate exception
+        if "Error" in data:
+            error = RetryableError if _is_failover_error(data) else RuntimeError
+            raise error(f"AVI service error: {data['Error']}") from primary_exc
+        return data
+
+    def validate_many(
+        self,
+        inputs: Iterable[GetAddressInfoInput],
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        dedup: bool = True,
+        dedup_window: int = DEDUP_WINDOW,
+    ) -> Iterator[BatchResult]:
+        """
+        Validate many addresses concurrently over this client's pooled connections.
+
+        Inputs that differ only in case, spacing, Unicode form, blank vs. missing fields or the
+        spelling of Country (see avi_canonical.canonical_key), with the same license key and mode,
+        are validated once and the result is given to each of them. dedup_stats() counts them.
+
+        Parameters:
+            inputs: The addresses to validate. May be a generator; it is consumed lazily.
+            max_workers: Number of worker threads. Defaults to the client's pool_size so every worker has a pooled connection.
+            max_in_flight: Maximum number of submitted but not yet yielded inputs. Defaults to 2 * max_workers.
+            ordered: Yield results in input order when True, as they complete otherwise.
+            dedup: Validate each distinct input once. When False, every input is its own call.
+            dedup_window: Number of distinct inputs remembered for deduplication; an input recurring
+                after more than that many others is validated again (or answered by the cache).
+
+        Returns:
+            Iterator[BatchResult]: One result per input, carrying either the AddressInfoResponse
+            or the exception raised for that input. Duplicates share their first input's response object.
+        """
+        return run_batch(
+            self._get_address_info_for_input,
+            inputs,
+            max_workers=max_workers or self.pool_size,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            key=batch_key if dedup else None,
+            dedup_window=dedup_window,
+            on_row=self._count_row,
+        )
+
+    def _count_row(self, duplicate: bool) -> None:
+        with self._dedup_lock:
+            self._dedup_stats.rows += 1
+            self._dedup_stats.duplicates += duplicate
+        if duplicate and self._observers:
+            self._emit(DEDUPLICATED)
+
+    def _get_address_info_for_input(self, item: GetAddressInfoInput) -> AddressInfoResponse:
+        return self.get_address_info(
+            item.Address1,
+            item.Address2,
+            item.Address3,
+            item.Address4,
+            item.Address5,
+            item.Locality,
+            item.AdministrativeArea,
+            item.PostalCode,
+            item.Country,
+            item.OutputLanguage,
+            item.LicenseKey,
+            item.IsLive,
+            item.TimeoutSeconds
+        )
+
+
+def _http_status(exc: Exception) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    return response.status_code if response is not None else None
+
+
+def _failure_reason(exc: Exception) -> str:
+    # Timeout first: a connect timeout is also a ConnectionError
+    if isinstance(exc, requests.Timeout):
+        return TIMEOUT
+    if isinstance(exc, requests.HTTPError):
+        return HTTP_ERROR
+    if isinstance(exc, requests.ConnectionError):
+        return CONNECTION_ERROR
+    if isinstance(exc, (requests.exceptions.InvalidJSONError, requests.exceptions.ContentDecodingError)):
+        return INVALID_RESPONSE
+    return EXCEPTION
+
+
+def _limiter_signal(exc: Exception) -> str:
+    # Timeouts and 5xx mean the service is struggling; anything else says nothing about its load
+    if isinstance(exc, requests.Timeout) or (_http_status(exc) or 0) >= 500:
+        return OVERLOAD
+    return IGNORE
+
+
+def _is_endpoint_failure(exc: Exception) -> bool:
+    # 4xx responses mean the endpoint is up and rejected the request; everything else counts against it
+    response = getattr(exc, "response", None)
+    return response is None or response.status_code >= 500
+
+
+def _error_type(exc: Optional[Exception]) -> type:
+    # Endpoint failures are transient and worth retrying; a 4xx would only be rejected again
+    return RetryableError if exc is None or _is_endpoint_failure(exc) else RuntimeError
+
+
+_default_client: Optional[AVIRestClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> AVIRestClient:
+    """Return the process-wide AVIRestClient used by get_address_info, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = AVIRestClient(health=default_endpoint_health)
+    return _default_client
 
-# Endpoint URLs for ServiceObjects Address Validation International (AVI) API
-primary_url = "https://sws.serviceobjects.com/avi/api.svc/json/GetAddressInfo?"
-backup_url = "https://swsbackup.serviceobjects.com/avi/api.svc/json/GetAddressInfo?"
-trial_url = "https://trial.serviceobjects.com/avi/api.svc/json/GetAddressInfo?"
 
 def get_address_info(
     address1: str,
@@ -18,12 +645,16 @@ def get_address_info(
     country: str,
     output_language: str,
     license_key: str,
-    is_live: bool = True
+    is_live: bool = True,
+    timeout_seconds: Optional[float] = None
 ) -> AddressInfoResponse:
     """
     Call ServiceObjects Address Validation International (AVI) API's GetAddressInfo endpoint
     to retrieve validated and corrected international address information.
 
+    Calls are made through a shared AVIRestClient, so connections are pooled and reused
+    across calls in the same process.
+
     Parameters:
         address1: Address line 1 of the international address.
         address2: Address line 2 of the international address. Optional.
@@ -37,128 +668,43 @@ def get_address_info(
         output_language: The language for service output (e.g., "ENGLISH", "BOTH", "LOCAL_ROMAN", "LOCAL").
         license_key: Your ServiceObjects license key.
         is_live: Use live or trial servers.
+        timeout_seconds: Total seconds the call may take, across the primary, backup and any retries.
+            Defaults to the client's deadline (15 seconds).
 
     Returns:
         AddressInfoResponse: Parsed JSON response with validated address details or error details.
 
     Raises:
-        RuntimeError: If the API returns an error payload.
-        requests.RequestException: On network/HTTP failures (trial mode).
+        RuntimeError: If the API returns an error payload, or no endpoint could be reached.
+        avi_retry.RetryableError: If the failure was transient (a RuntimeError subclass).
+        avi_retry.DeadlineExceeded: If timeout_seconds passed without a usable answer (a RuntimeError subclass).
     """
-    params = {
-        "Address1": address1,
-        "Address2": address2,
-        "Address3": address3,
-        "Address4": address4,
-        "Address5": address5,
-        "Locality": locality,
-        "AdministrativeArea": administrative_area,
-        "PostalCode": postal_code,
-        "Country": country,
-        "OutputLanguage": output_language,
-        "LicenseKey": license_key,
-    }
-    # Select the base URL: production vs trial
-    url = primary_url if is_live else trial_url
-
-    try:
-        # Attempt primary (or trial) endpoint
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        # If API returned an error in JSON payload, trigger fallback
-        error = data.get('Error')
-        if not (error is None or error.get('TypeCode') != "3"):
-            if is_live:
-                # Try backup URL
-                response = requests.get(backup_url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                # If still error, propagate exception
-                if 'Error' in data:
-                    raise RuntimeError(f"AVI service error: {data['Error']}")
-            else:
-                # Trial mode error is terminal
-                raise RuntimeError(f"AVI trial error: {data['Error']}")
+    return get_default_client().get_address_info(
+        address1,
+        address2,
+        address3,
+        address4,
+        address5,
+        locality,
+        administrative_area,
+        postal_code,
+        country,
+        output_language,
+        license_key,
+        is_live,
+        timeout_seconds
+    )
 
-        # Convert JSON response to AddressInfoResponse for structured access
-        error = Error(**data.get("Error", {})) if data.get("Error") else None
-        address_info = data.get("AddressInfo")
-        address_info_obj = None
-        if address_info:
-            address_info_obj = AddressInfo(
-                Status=address_info.get("Status"),
-                ResolutionLevel=address_info.get("ResolutionLevel"),
-                Address1=address_info.get("Address1"),
-                Address2=address_info.get("Address2"),
-                Address3=address_info.get("Address3"),
-                Address4=address_info.get("Address4"),
-                Address5=address_info.get("Address5"),
-                Address6=address_info.get("Address6"),
-                Address7=address_info.get("Address7"),
-                Address8=address_info.get("Address8"),
-                Locality=address_info.get("Locality"),
-                AdministrativeArea=address_info.get("AdministrativeArea"),
-                PostalCode=address_info.get("PostalCode"),
-                Country=address_info.get("Country"),
-                CountryISO2=address_info.get("CountryISO2"),
-                CountryISO3=address_info.get("CountryISO3"),
-                InformationComponents=[
-                    InformationComponent(Name=comp.get("Name"), Value=comp.get("Value"))
-                    for comp in address_info.get("InformationComponents", [])
-                ] if "InformationComponents" in address_info else []
-            )
-
-        return AddressInfoResponse(
-            AddressInfo=address_info_obj,
-            Error=error
-        )
 
-    except requests.RequestException as req_exc:
-        # Network or HTTP-level error occurred
-        if is_live:
-            try:
-                # Fallback to backup URL
-                response = requests.get(backup_url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-                if "Error" in data:
-                    raise RuntimeError(f"AVI backup error: {data['Error']}") from req_exc
-
-                error = Error(**data.get("Error", {})) if data.get("Error") else None
-                address_info = data.get("AddressInfo")
-                address_info_obj = None
-                if address_info:
-                    address_info_obj = AddressInfo(
-                        Status=address_info.get("Status"),
-                        ResolutionLevel=address_info.get("ResolutionLevel"),
-                        Address1=address_info.get("Address1"),
-                        Address2=address_info.get("Address2"),
-                        Address3=address_info.get("Address3"),
-                        Address4=address_info.get("Address4"),
-                        Address5=address_info.get("Address5"),
-                        Address6=address_info.get("Address6"),
-                        Address7=address_info.get("Address7"),
-                        Address8=address_info.get("Address8"),
-                        Locality=address_info.get("Locality"),
-                        AdministrativeArea=address_info.get("AdministrativeArea"),
-                        PostalCode=address_info.get("PostalCode"),
-                        Country=address_info.get("Country"),
-                        CountryISO2=address_info.get("CountryISO2"),
-                        CountryISO3=address_info.get("CountryISO3"),
-                        InformationComponents=[
-                            InformationComponent(Name=comp.get("Name"), Value=comp.get("Value"))
-                            for comp in address_info.get("InformationComponents", [])
-                        ] if "InformationComponents" in address_info else []
-                    )
-
-                return AddressInfoResponse(
-                    AddressInfo=address_info_obj,
-                    Error=error
-                )
-            except Exception as backup_exc:
-                raise RuntimeError("AVI service unreachable on both endpoints") from backup_exc
-        else:
-            raise RuntimeError(f"AVI trial error: {str(req_exc)}") from req_exc
\ No newline at end of file
+def validate_many(
+    inputs: Iterable[GetAddressInfoInput],
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    dedup: bool = True,
+) -> Iterator[BatchResult]:
+    """
+    Validate many addresses concurrently through the shared AVIRestClient.
+    See AVIRestClient.validate_many for parameter details.
+    """
+    return get_default_client().validate_many(inputs, max_workers, max_in_flight, ordered, dedup)
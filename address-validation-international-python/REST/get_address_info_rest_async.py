@@ -0,0 +1,632 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import AsyncIterable, AsyncIterator, Hashable, Iterable, List, Optional, Union
+
+import aiohttp
+
+from .avi_batch import DEDUP_WINDOW, BatchResult, DedupStats
+from .avi_cache import ResponseCache, cache_key
+from .avi_canonical import batch_key
+from .avi_cassette import CassettePlayer, CassetteRecorder
+from .avi_health import EndpointHealth
+from .avi_limiter import IGNORE, OVERLOAD, SUCCESS, AdaptiveLimiter, LimiterTimeout
+from .avi_metrics import (
+    ATTEMPT_END, ATTEMPT_START, CACHE_HIT, CACHE_MISS, CALL_END, CIRCUIT_OPEN, COALESCED, CONNECTION_ERROR,
+    DEDUPLICATED, ERROR, EXCEPTION, FAILOVER, HTTP_ERROR, INVALID_RESPONSE, OK, REJECTED, RETRY, TIMEOUT, TYPE_CODE_3,
+    CallEvent, Observer, response_outcome,
+)
+from .avi_prevalidation import prevalidate as prevalidate_input
+from .avi_retry import Deadline, RetryPolicy, RetryableError
+from .avi_singleflight import AsyncSingleFlight, SingleFlightStats
+from .avi_response import (
+    AddressInfoResponse, GetAddressInfoInput, _is_failover_error, _type_code, backup_url, loads, parse_response,
+    primary_url, trial_url,
+)
+
+# Network, HTTP-level and JSON decoding errors
+_TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+
+class AVIAsyncRestClient:
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        pool_size: int = 100,
+        keep_alive: bool = True,
+        timeout: float = 10,
+        primary_url: str = primary_url,
+        backup_url: str = backup_url,
+        trial_url: str = trial_url,
+        cache: Optional[ResponseCache] = None,
+        health: Optional[EndpointHealth] = None,
+        observers: Optional[List[Observer]] = None,
+        single_flight: bool = False,
+        prevalidate: bool = False,
+        limiter: Optional[AdaptiveLimiter] = None,
+        connect_timeout: Optional[float] = None,
+        deadline: Optional[float] = 15,
+        retry: Optional[RetryPolicy] = None,
+        cassette: Optional[Union[CassetteRecorder, CassettePlayer]] = None,
+    ):
+        """
+        asyncio client for the AVI GetAddressInfo REST endpoint.
+
+        All calls share one aiohttp connection pool, and at most max_concurrency calls are
+        in flight at once; further calls wait for a slot instead of opening more connections.
+        The pool is bound to the event loop it is first used on, and is closed when that loop shuts down
+        through asyncio.run; moving to a new loop closes the old pool first.
+
+        max_concurrency: Maximum number of concurrent get_address_info calls.
+        pool_size: Maximum number of pooled connections across all endpoints.
+        keep_alive: Whether to reuse connections between calls.
+        timeout: Read timeout of each attempt, in seconds.
+        primary_url: Override for the primary (live) endpoint URL.
+        backup_url: Override for the backup (live) endpoint URL.
+        trial_url: Override for the trial endpoint URL.
+        cache: Optional response cache consulted before calling the service. Only results without an Error are stored.
+        health: Optional endpoint health tracker. While the primary's circuit is open, calls go straight to the backup.
+        observers: Optional callables receiving a CallEvent for every attempt, failover, cache lookup and
+            completed call (see AVIRestClient.add_observer). They are called on the event loop and must not block.
+        single_flight: Collapse concurrent calls for the same address, license key and mode into one
+            upstream call whose result (or exception) every caller receives.
+        prevalidate: Check each input locally first (see avi_prevalidation.prevalidate). An input the service
+            would reject is answered with an AddressInfoResponse carrying the Error, without a call; a
+            recognized Country is sent as its ISO 3166-1 alpha-3 code.
+        limiter: Optional rate cap and adaptive concurrency limit (see AVIRestClient). Permits are awaited
+            without blocking the event loop, and one instance may be shared with thread-based clients.
+        connect_timeout: Connect timeout of each attempt, in seconds. Defaults to timeout.
+        deadline: Default total seconds a call may take, across the primary, backup, retries and their
+            backoff (see AVIRestClient). Overridden per call by timeout_seconds. None for no deadline.
+        retry: Optional retry policy for transient failures (see AVIRestClient and avi_retry.RetryPolicy).
+        cassette: Optional avi_cassette.CassetteRecorder or CassettePlayer, to record the service's answers or
+            replay them instead of calling it (see AVIRestClient). Replayed latency is awaited with asyncio.sleep.
+        """
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout if connect_timeout is not None else timeout
+        self.deadline = deadline
+        self.retry = retry
+        self.cassette = cassette
+        self.primary_url = primary_url
+        self.backup_url = backup_url
+        self.trial_url = trial_url
+        self.cache = cache
+        self.health = health
+        self.prevalidate = prevalidate
+        self.limiter = limiter
+        self._observers: List[Observer] = list(observers or ())
+        self._single_flight = AsyncSingleFlight() if single_flight else None
+        self._dedup_stats = DedupStats()
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._keeper: Optional[asyncio.Task] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        # aiohttp sessions belong to one event loop; start a fresh pool if we moved to another
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and not self._session.closed:
+                self._release_session()
+            connector = aiohttp.TCPConnector(limit=self.pool_size, force_close=not self.keep_alive)
+            # Timeouts are set per attempt, from what is left of the call's deadline
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+            # asyncio.run cancels pending tasks before closing its loop, so the pool is closed on the
+            # loop that owns it even when close() is never awaited
+            self._keeper = loop.create_task(_close_on_shutdown(self._session))
+        return self._session
+
+    def _release_session(self) -> None:
+        # The open session belongs to another loop, which is the only place it can be closed
+        if not self._loop.is_running():
+            raise RuntimeError(
+                "AVIAsyncRestClient still holds connections on an event loop that is not running; "
+                "await close() on that loop before using the client on another one"
+            )
+        self._loop.call_soon_threadsafe(self._keeper.cancel)
+        self._session = self._keeper = None
+
+    async def close(self) -> None:
+        """Close every pooled connection held by this client."""
+        if self._keeper is not None:
+            self._keeper.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = self._keeper = None
+
+    def single_flight_stats(self) -> Optional[SingleFlightStats]:
+        """Return upstream and collapsed call counters, or None if single-flight is not enabled."""
+        return self._single_flight.stats() if self._single_flight is not None else None
+
+    def dedup_stats(self) -> DedupStats:
+        """Return the inputs and duplicates seen by deduplicating validate_many batches so far."""
+        return DedupStats(**vars(self._dedup_stats))
+
+    def add_observer(self, observer: Observer) -> None:
+        """Register observer(event); see AVIRestClient.add_observer."""
+        self._observers.append(observer)
+
+    def _emit(self, kind: str, **fields) -> None:
+        event = CallEvent(kind, "rest_async", **fields)
+        for observer in self._observers:
+            observer(event)
+
+    def _role(self, url: str) -> str:
+        if url == self.primary_url:
+            return "primary"
+        return "backup" if url == self.backup_url else "trial"
+
+    async def __aenter__(self) -> "AVIAsyncRestClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _get(self, url: str, params: dict, timeout: aiohttp.ClientTimeout) -> dict:
+        async with self._get_session().get(url, params=params, timeout=timeout) as response:
+            response.raise_for_status()
+            return loads(await response.read())
+
+    async def get_address_info(
+        self,
+        address1: str,
+        address2: str,
+        address3: str,
+        address4: str,
+        address5: str,
+        locality: str,
+        administrative_area: str,
+        postal_code: str,
+        country: str,
+        output_language: str,
+        license_key: str,
+        is_live: bool = True,
+        timeout_seconds: Optional[float] = None
+    ) -> AddressInfoResponse:
+        """
+        Asynchronously call ServiceObjects Address Validation International (AVI) API's GetAddressInfo
+        endpoint. Primary, backup and trial handling, deadlines and retries are the same as get_address_info.
+
+        Returns:
+            AddressInfoResponse: Parsed JSON response with validated address details or error details.
+
+        Raises:
+            RuntimeError: If the API returns an error payload, or on network/HTTP failures.
+            avi_retry.RetryableError: If the failure was transient, after any retries.
+            avi_retry.DeadlineExceeded: If the deadline passed without a usable answer.
+            avi_cassette.CassetteMiss: If replaying a cassette that did not record the address.
+        """
+        observed = bool(self._observers)
+        started = time.perf_counter() if observed else 0.0
+        deadline = Deadline(timeout_seconds if timeout_seconds is not None else self.deadline)
+        if self.prevalidate:
+            item, error = prevalidate_input(GetAddressInfoInput(
+                address1, address2, address3, address4, address5, locality, administrative_area,
+                postal_code, country, output_language, license_key, is_live
+            ))
+            if error is not None:
+                if observed:
+                    self._emit(REJECTED, type_code=error.TypeCode)
+                    self._emit(CALL_END, latency=time.perf_counter() - started, type_code=error.TypeCode,
+                               outcome=ERROR)
+                return AddressInfoResponse(Error=error)
+            country, output_language = item.Country, item.OutputLanguage
+
+        key = None
+        if self.cache is not None or self._single_flight is not None or self.cassette is not None:
+            key = cache_key(address1, address2, address3, address4, address5, locality,
+                            administrative_area, postal_code, country, output_language)
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if observed:
+                self._emit(CACHE_MISS if data is None else CACHE_HIT)
+            if data is not None:
+                if observed:
+                    self._emit(CALL_END, latency=time.perf_counter() - started, outcome=OK)
+                return parse_response(data)
+
+        params = {
+            "Address1": address1,
+            "Address2": address2,
+            "Address3": address3,
+            "Address4": address4,
+            "Address5": address5,
+            "Locality": locality,
+            "AdministrativeArea": administrative_area,
+            "PostalCode": postal_code,
+            "Country": country,
+            "OutputLanguage": output_language,
+            "LicenseKey": license_key,
+        }
+        # aiohttp rejects None query values; requests silently drops them
+        params = {name: value for name, value in params.items() if value is not None}
+
+        self._get_session()
+
+        async def fetch() -> dict:
+            async with self._semaphore:
+                return await self._call(key, params, is_live, deadline)
+
+        shared = False
+        try:
+            if self._single_flight is None:
+                data = await fetch()
+            else:
+                # The license key and mode change the outcome, so only identical calls are collapsed
+                data, shared = await self._single_flight.do(
+                    (key, license_key, is_live),
+                    fetch,
+                    on_shared=(lambda: self._emit(COALESCED)) if observed else None,
+                    deadline=deadline,
+                )
+        except Exception as exc:
+            if observed:
+                self._emit(CALL_END, latency=time.perf_counter() - started, outcome=EXCEPTION, exception=exc)
+            raise
+
+        # Error payloads are never cached, so a transient service problem is not replayed
+        if self.cache is not None and not shared and not data.get("Error"):
+            self.cache.set(key, data)
+
+        if observed:
+            type_code = _type_code(data)
+            self._emit(CALL_END, latency=time.perf_counter() - started, type_code=type_code,
+                       outcome=response_outcome(type_code))
+
+        return parse_response(data)
+
+    def _allow(self, url: str) -> bool:
+        return self.health is None or self.health.allow_request(url)
+
+    async def _attempt(self, url: str, params: dict, deadline: Deadline) -> dict:
+        # Single call to one endpoint, reporting the outcome to the limiter, health tracker and observers
+        permit = None
+        if self.limiter is not None:
+            try:
+                permit = await self.limiter.acquire_async(deadline.remaining())
+            except LimiterTimeout as exc:
+                if deadline.expired():
+                    raise deadline.exceeded() from exc
+                raise
+        try:
+            connect_timeout, read_timeout, cut = deadline.timeouts(self.connect_timeout, self.timeout)
+        except BaseException:
+            if permit is not None:
+                self.limiter.release(permit, IGNORE)
+            raise
+        timeout = aiohttp.ClientTimeout(total=deadline.remaining(), sock_connect=connect_timeout,
+                                        sock_read=read_timeout)
+        observed = bool(self._observers)
+        if observed:
+            endpoint, role = EndpointHealth.endpoint_for(url), self._role(url)
+            self._emit(ATTEMPT_START, endpoint=endpoint, role=role)
+            started = time.perf_counter()
+        try:
+            data = await self._get(url, params, timeout)
+        except _TRANSPORT_ERRORS as exc:
+            # A timeout cut short by the deadline says nothing about the endpoint's health or load
+            cut_short = isinstance(exc, asyncio.TimeoutError) and (cut or deadline.expired())
+            if permit is not None:
+                self.limiter.release(permit, IGNORE if cut_short else _limiter_signal(exc))
+            if self.health is not None and not cut_short:
+                if isinstance(exc, aiohttp.ClientResponseError) and exc.status < 500:
+                    self.health.record_success(url)
+                else:
+                    self.health.record_failure(url)
+            if observed:
+                http_status = exc.status if isinstance(exc, aiohttp.ClientResponseError) else None
+                self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                           http_status=http_status, outcome=EXCEPTION, exception=exc)
+            raise
+        except BaseException as exc:
+            # Cancellation included: never leak a permit, and close the attempt for observers
+            if permit is not None:
+                self.limiter.release(permit, IGNORE)
+            if observed:
+                self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                           outcome=EXCEPTION, exception=exc)
+            raise
+        if permit is not None:
+            self.limiter.release(permit, OVERLOAD if _is_failover_error(data) else SUCCESS)
+        if self.health is not None:
+            if _is_failover_error(data):
+                self.health.record_failure(url)
+            else:
+                self.health.record_success(url)
+        if observed:
+            type_code = _type_code(data)
+            self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                       http_status=200, type_code=type_code, outcome=response_outcome(type_code))
+        return data
+
+    async def _call(self, key: Optional[str], params: dict, is_live: bool, deadline: Deadline) -> dict:
+        # The service's answer, or the cassette's in its place
+        if isinstance(self.cassette, CassettePlayer):
+            return await self._replay(key, deadline)
+        started = time.perf_counter()
+        data = await self._fetch(params, is_live, deadline)
+        if self.cassette is not None:
+            self.cassette.record(key, data, time.perf_counter() - started)
+        return data
+
+    async def _replay(self, key: str, deadline: Deadline) -> dict:
+        data, delay = self.cassette.play(key)
+        remaining = deadline.remaining()
+        if remaining is not None and delay > remaining:
+            # The recorded answer would arrive too late, as a slow endpoint's would
+            await asyncio.sleep(remaining)
+            raise deadline.exceeded()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return data
+
+    async def _fetch(self, params: dict, is_live: bool, deadline: Deadline) -> dict:
+        # One round of attempts, repeated under the retry policy while it fails transiently and time is left
+        retries = 0
+        while True:
+            try:
+                return await self._fetch_once(params, is_live, deadline)
+            except RetryableError as exc:
+                if deadline.expired():
+                    raise deadline.exceeded() from exc
+                if self.retry is None or retries >= self.retry.max_retries:
+                    raise
+                delay = self.retry.delay(retries)
+                remaining = deadline.remaining()
+                if remaining is not None and delay >= remaining:
+                    raise
+                retries += 1
+                if self._observers:
+                    self._emit(RETRY, latency=delay, exception=exc)
+                await asyncio.sleep(delay)
+
+    async def _fetch_once(self, params: dict, is_live: bool, deadline: Deadline) -> dict:
+        if not is_live:
+            # Trial mode has no backup, so any failure ends the round
+            if not self._allow(self.trial_url):
+                raise RetryableError("AVI trial error: circuit open for the trial endpoint")
+            try:
+                data = await self._attempt(self.trial_url, params, deadline)
+            except _TRANSPORT_ERRORS as req_exc:
+                raise _error_type(req_exc)(f"AVI trial error: {str(req_exc)}") from req_exc
+            if _is_failover_error(data):
+                raise RetryableError(f"AVI trial error: {data['Error']}")
+            return data
+
+        primary_exc = None
+        primary_allowed = self._allow(self.primary_url)
+        if primary_allowed:
+            try:
+                # Attempt primary endpoint
+                data = await self._attempt(self.primary_url, params, deadline)
+                if not _is_failover_error(data):
+                    return data
+            except _TRANSPORT_ERRORS as req_exc:
+                # Network, HTTP-level or JSON decoding error occurred
+                primary_exc = req_exc
+
+        # Fall back to the backup: primary failed, returned TypeCode 3, or its circuit is open
+        if self._observers:
+            if not primary_allowed:
+                reason = CIRCUIT_OPEN
+            else:
+                reason = _failure_reason(primary_exc) if primary_exc is not None else TYPE_CODE_3
+            self._emit(FAILOVER, endpoint=EndpointHealth.endpoint_for(self.primary_url), role="primary",
+                       reason=reason, exception=primary_exc)
+        if not self._allow(self.backup_url):
+            raise RetryableError("AVI service unreachable on both endpoints") from primary_exc
+        if deadline.expired():
+            raise deadline.exceeded() from primary_exc
+        try:
+            data = await self._attempt(self.backup_url, params, deadline)
+        except _TRANSPORT_ERRORS as backup_exc:
+            raise _error_type(backup_exc)("AVI service unreachable on both endpoints") from backup_exc
+
+        # If still error, propagate exception
+        if "Error" in data:
+            error = RetryableError if _is_failover_error(data) else RuntimeError
+            raise error(f"AVI service error: {data['Error']}") from primary_exc
+        return data
+
+    async def _run_one(self, index: int, item: GetAddressInfoInput) -> BatchResult:
+        try:
+            response = await self.get_address_info(
+                item.Address1,
+                item.Address2,
+                item.Address3,
+                item.Address4,
+                item.Address5,
+                item.Locality,
+                item.AdministrativeArea,
+                item.PostalCode,
+                item.Country,
+                item.OutputLanguage,
+                item.LicenseKey,
+                item.IsLive,
+                item.TimeoutSeconds
+            )
+            return BatchResult(index=index, input=item, response=response)
+        except Exception as exc:
+            return BatchResult(index=index, input=item, exception=exc)
+
+    async def validate_many(
+        self,
+        inputs: Union[Iterable[GetAddressInfoInput], AsyncIterable[GetAddressInfoInput]],
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        dedup: bool = True,
+        dedup_window: int = DEDUP_WINDOW,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Validate many addresses concurrently on the running event loop. Duplicate inputs are
+        validated once, as by AVIRestClient.validate_many.
+
+        Parameters:
+            inputs: The addresses to validate. May be a sync or async iterable; it is consumed lazily.
+            max_in_flight: Maximum number of started but not yet yielded inputs. Defaults to 2 * max_concurrency.
+            ordered: Yield results in input order when True, as they complete otherwise.
+            dedup: Validate each distinct input once. When False, every input is its own call.
+            dedup_window: Number of distinct inputs remembered for deduplication.
+
+        Returns:
+            AsyncIterator[BatchResult]: One result per input, carrying either the AddressInfoResponse
+            or the exception raised for that input. Duplicates share their first input's response object.
+        """
+        if max_in_flight is None:
+            max_in_flight = 2 * self.max_concurrency
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        in_flight: "deque[asyncio.Task]" = deque()
+        # Distinct key -> task of its first input, least recently seen first
+        seen: "OrderedDict[Hashable, asyncio.Task]" = OrderedDict()
+
+        async def next_done():
+            if ordered:
+                return [await in_flight.popleft()]
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                in_flight.remove(task)
+            return [task.result() for task in done]
+
+        try:
+            index = 0
+            async for item in _aiter(inputs):
+                if len(in_flight) >= max_in_flight:
+                    for result in await next_done():
+                        yield result
+                if not dedup:
+                    task = asyncio.ensure_future(self._run_one(index, item))
+                else:
+                    item_key = batch_key(item)
+                    source = seen.get(item_key)
+                    if source is None:
+                        task = seen[item_key] = asyncio.ensure_future(self._run_one(index, item))
+                        if len(seen) > dedup_window:
+                            seen.popitem(last=False)
+                    else:
+                        seen.move_to_end(item_key)
+                        task = asyncio.ensure_future(_shared_result(source, index, item))
+                    self._count_row(source is not None)
+                in_flight.append(task)
+                index += 1
+            while in_flight:
+                for result in await next_done():
+                    yield result
+        finally:
+            # Reached early when the caller stops iterating
+            for task in in_flight:
+                task.cancel()
+
+    def _count_row(self, duplicate: bool) -> None:
+        self._dedup_stats.rows += 1
+        self._dedup_stats.duplicates += duplicate
+        if duplicate and self._observers:
+            self._emit(DEDUPLICATED)
+
+
+async def _close_on_shutdown(session: aiohttp.ClientSession) -> None:
+    # Waits until cancelled by close(), by a move to another loop or by the loop shutting down
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+
+async def _shared_result(source: "asyncio.Task[BatchResult]", index: int, item: GetAddressInfoInput) -> BatchResult:
+    # A duplicate input's result: the outcome of source, its first occurrence. Shielded, so
+    # cancelling the duplicate leaves the first occurrence running.
+    result = await asyncio.shield(source)
+    return BatchResult(index=index, input=item, response=result.response, exception=result.exception)
+
+
+def _failure_reason(exc: Exception) -> str:
+    # Timeout first: aiohttp's ServerTimeoutError is also a ClientConnectionError
+    if isinstance(exc, asyncio.TimeoutError):
+        return TIMEOUT
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return HTTP_ERROR
+    if isinstance(exc, aiohttp.ClientConnectionError):
+        return CONNECTION_ERROR
+    if isinstance(exc, ValueError):
+        return INVALID_RESPONSE
+    return EXCEPTION
+
+
+def _error_type(exc: Exception) -> type:
+    # Endpoint failures are transient and worth retrying; a 4xx would only be rejected again
+    if isinstance(exc, aiohttp.ClientResponseError) and exc.status < 500:
+        return RuntimeError
+    return RetryableError
+
+
+def _limiter_signal(exc: Exception) -> str:
+    # Timeouts and 5xx mean the service is struggling; anything else says nothing about its load
+    if isinstance(exc, asyncio.TimeoutError) or (isinstance(exc, aiohttp.ClientResponseError) and exc.status >= 500):
+        return OVERLOAD
+    return IGNORE
+
+
+async def _aiter(inputs):
+    if hasattr(inputs, "__aiter__"):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
+
+
+_default_client: Optional[AVIAsyncRestClient] = None
+
+
+def get_default_async_client() -> AVIAsyncRestClient:
+    """Return the process-wide AVIAsyncRestClient used by get_address_info_async, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        _default_client = AVIAsyncRestClient()
+    return _default_client
+
+
+async def get_address_info_async(
+    address1: str,
+    address2: str,
+    address3: str,
+    address4: str,
+    address5: str,
+    locality: str,
+    administrative_area: str,
+    postal_code: str,
+    country: str,
+    output_language: str,
+    license_key: str,
+    is_live: bool = True,
+    timeout_seconds: Optional[float] = None
+) -> AddressInfoResponse:
+    """
+    Asynchronously call ServiceObjects Address Validation International (AVI) API's GetAddressInfo endpoint
+    through a shared AVIAsyncRestClient. Parameters and return value match get_address_info.
+
+    Raises:
+        RuntimeError: If the API returns an error payload, or on network/HTTP failures.
+    """
+    return await get_default_async_client().get_address_info(
+        address1,
+        address2,
+        address3,
+        address4,
+        address5,
+        locality,
+        administrative_area,
+        postal_code,
+        country,
+        output_language,
+        license_key,
+        is_live,
+        timeout_seconds
+    )
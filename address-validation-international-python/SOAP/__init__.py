@@ -0,0 +1,4 @@
+"""
+SOAP clients for AVI GetAddressInfo: GetAddressInfoSoap (suds) and AVISoapLiteClient (no suds).
+Both are also available from the top-level package, where they are imported on first use.
+"""
@@ -1,30 +1,281 @@
+import dataclasses
+import gzip
+import http.client
+import io
+import select
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.error import URLError
+from urllib.parse import urlsplit
+
+from ..avi_batch import DEDUP_WINDOW, BatchResult, DedupStats, run_batch
+from ..avi_cache import ResponseCache, cache_key
+from ..avi_canonical import canonical_key
+from ..avi_cassette import CassettePlayer, CassetteRecorder
+from ..avi_health import EndpointHealth
+from ..avi_limiter import IGNORE, OVERLOAD, SUCCESS, AdaptiveLimiter, LimiterTimeout
+from ..avi_metrics import (
+    ATTEMPT_END, ATTEMPT_START, CACHE_HIT, CACHE_MISS, CALL_END, CIRCUIT_OPEN, COALESCED, CONNECTION_ERROR,
+    DEDUPLICATED, ERROR, EXCEPTION, FAILOVER, HTTP_ERROR, INVALID_RESPONSE, OK, REJECTED, RETRY, TIMEOUT, TYPE_CODE_3,
+    CallEvent, Observer, response_outcome,
+)
+from ..avi_prevalidation import prevalidate as prevalidate_input
+from ..avi_response import GetAddressInfoInput
+from ..avi_retry import Deadline, DeadlineExceeded, RetryPolicy, RetryableError
+from ..avi_singleflight import SingleFlight, SingleFlightStats
+from suds.cache import ObjectCache
 from suds.client import Client
 from suds import WebFault
-from suds.sudsobject import Object
+from suds.sudsobject import Factory, Object
+from suds.transport import Reply, TransportError
+from suds.transport.http import HttpTransport
+
+
+class _CircuitOpenError(RuntimeError):
+    pass
+
+
+class _KeepAliveTransport(HttpTransport):
+    def __init__(self, pool_size: int = 10, keep_alive: bool = True, **kwargs):
+        """
+        suds transport that posts SOAP requests over pooled keep-alive http.client connections.
+
+        suds' own transport opens a urllib connection per request, so every call paid a new TCP
+        (and TLS) handshake. Up to pool_size idle connections per host are kept for reuse; more
+        may be open at once, as with requests' pools. WSDL downloads and proxied requests still go
+        through urllib, as before.
+        """
+        super().__init__(**kwargs)
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self._idle: Dict[Tuple[str, str, Optional[int]], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request):
+        if self.options.proxy:
+            return super().send(request)
+        parts = urlsplit(request.url)
+        host = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path + ("?" + parts.query if parts.query else "")
+        timeout = request.timeout or self.options.timeout
+        connection = self._checkout(host, timeout)
+        try:
+            connection.request("POST", path, body=request.message, headers=request.headers)
+            response = connection.getresponse()
+            message = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close or not self.keep_alive:
+            connection.close()
+        else:
+            self._checkin(host, connection)
+
+        encoding = response.getheader("Content-Encoding")
+        if encoding == "gzip":
+            message = gzip.decompress(message)
+        elif encoding == "deflate":
+            message = zlib.decompress(message)
+        if response.status == http.client.OK:
+            return Reply(http.client.OK, response.msg, message)
+        if response.status in (http.client.ACCEPTED, http.client.NO_CONTENT):
+            return None
+        # suds reads a SOAP fault from a 500 reply's body, as it does with urllib's HTTPError
+        raise TransportError(response.reason, response.status, io.BytesIO(message))
+
+    def _checkout(self, host: Tuple[str, str, Optional[int]], timeout: float) -> http.client.HTTPConnection:
+        while True:
+            with self._lock:
+                idle = self._idle.get(host)
+                connection = idle.pop() if idle else None
+            if connection is None:
+                scheme, hostname, port = host
+                if scheme == "https":
+                    return http.client.HTTPSConnection(hostname, port, timeout=timeout)
+                return http.client.HTTPConnection(hostname, port, timeout=timeout)
+            if _dropped(connection):
+                connection.close()
+                continue
+            # Each request has its own timeout, cut to what is left of its call's deadline
+            connection.timeout = timeout
+            connection.sock.settimeout(timeout)
+            return connection
+
+    def _checkin(self, host: Tuple[str, str, Optional[int]], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(host, [])
+            if len(idle) < self.pool_size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def __deepcopy__(self, memo={}):
+        clone = super().__deepcopy__(memo)
+        clone.pool_size, clone.keep_alive = self.pool_size, self.keep_alive
+        return clone
+
+
+def _dropped(connection: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket with something to read has been closed by the server
+    if connection.sock is None:
+        return True
+    try:
+        return bool(select.select([connection.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
 
 class GetAddressInfoSoap:
-    def __init__(self, license_key: str, is_live: bool = True, timeout_ms: int = 15000):
+    def __init__(
+        self,
+        license_key: str,
+        is_live: bool = True,
+        timeout_ms: int = 15000,
+        cache_location: Optional[str] = None,
+        cache_days: int = 7,
+        primary_wsdl: Optional[str] = None,
+        backup_wsdl: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        health: Optional[EndpointHealth] = None,
+        observers: Optional[List[Observer]] = None,
+        single_flight: bool = False,
+        prevalidate: bool = False,
+        limiter: Optional[AdaptiveLimiter] = None,
+        attempt_timeout_ms: Optional[int] = 10000,
+        retry: Optional[RetryPolicy] = None,
+        cassette: Optional[Union[CassetteRecorder, CassettePlayer]] = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+    ):
         """
         license_key: Service Objects AVI license key.
         is_live: Whether to use live or trial endpoints.
-        timeout_ms: SOAP call timeout in milliseconds.
+        timeout_ms: Deadline of each call in milliseconds, shared by the primary attempt, the backup attempt,
+            any retries and their backoff: every attempt's timeout is cut to the time left.
+        cache_location: Directory for the on-disk WSDL/schema cache. Defaults to suds' temp directory.
+        cache_days: How long a cached WSDL stays valid on disk, in days.
+        primary_wsdl: Override for the primary WSDL URL.
+        backup_wsdl: Override for the backup WSDL URL.
+        cache: Optional response cache consulted before calling the service. Only results without an Error are stored.
+        health: Optional endpoint health tracker. While the primary's circuit is open, calls go straight to the backup.
+        observers: Optional callables receiving a CallEvent for every attempt, failover, cache lookup and
+            completed call (see add_observer).
+        single_flight: Collapse concurrent calls for the same address into one upstream call whose
+            response (or exception) every caller receives.
+        prevalidate: Check each input locally first (see avi_prevalidation.prevalidate). An input the service
+            would reject is answered with a response carrying the Error, without a call; a recognized
+            Country is sent as its ISO 3166-1 alpha-3 code.
+        limiter: Optional rate cap and adaptive concurrency limit (see avi_limiter.AdaptiveLimiter). Every
+            attempt, including the backup attempt, waits for a permit, and timeouts, HTTP 5xx and TypeCode 3
+            make the limiter back off. One instance may be shared with the REST clients.
+        attempt_timeout_ms: Timeout of each attempt in milliseconds (and of WSDL downloads), so a hung primary
+            leaves time for the backup. The socket timeout applies to connecting and to every read alike.
+            None lets an attempt use the whole deadline.
+        retry: Optional retry policy (see avi_retry.RetryPolicy). A call that failed on both endpoints with a
+            timeout, connection failure, HTTP 5xx or SOAP fault, empty response, TypeCode 3 or an open circuit
+            is tried again after a jittered exponential backoff, while its deadline allows.
+        cassette: Optional avi_cassette.CassetteRecorder, which records every answer the service gives, or
+            avi_cassette.CassettePlayer, which answers every call from a recording instead of the service,
+            without downloading the WSDL. Cassettes hold REST-shaped payloads, so one recording can be
+            replayed by the SOAP and REST clients alike.
+        pool_size: Maximum number of idle connections kept open per endpoint for reuse by later calls.
+            validate_many raises it to its max_workers.
+        keep_alive: Whether to reuse connections between calls. When False, every call closes its connection.
         """
         self.is_live = is_live
-        self.timeout = timeout_ms / 1000.0
+        self.deadline = timeout_ms / 1000.0
+        self.timeout = attempt_timeout_ms / 1000.0 if attempt_timeout_ms is not None else self.deadline
+        self.retry = retry
+        self.cassette = cassette
         self.license_key = license_key
+        self.cache = cache
+        self.health = health
+        self.prevalidate = prevalidate
+        self.limiter = limiter
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self._observers: List[Observer] = list(observers or ())
+        self._single_flight = SingleFlight() if single_flight else None
+        self._dedup_stats = DedupStats()
+        self._dedup_lock = threading.Lock()
 
         # WSDL URLs
-        self._primary_wsdl = (
+        self._primary_wsdl = primary_wsdl or (
             "https://sws.serviceobjects.com/avi/soap.svc?wsdl"
             if is_live
             else "https://trial.serviceobjects.com/avi/soap.svc?wsdl"
         )
-        self._backup_wsdl = (
+        self._backup_wsdl = backup_wsdl or (
             "https://swsbackup.serviceobjects.com/avi/soap.svc?wsdl"
             if is_live
             else "https://trial.serviceobjects.com/avi/soap.svc?wsdl"
         )
 
+        # Parsed WSDL definitions are pickled to disk, so a cold start skips both the download and the parse
+        self._wsdl_cache = ObjectCache(location=cache_location, days=cache_days)
+
+        # One parsed client per WSDL, built on first use. Calls only read the client's options and
+        # parsed WSDL, so the same client is shared by every thread, along with its connection pool.
+        self._clients: Dict[str, Client] = {}
+        self._transports: Dict[str, _KeepAliveTransport] = {}
+        self._clients_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close every pooled connection held by this client."""
+        for transport in self._transports.values():
+            transport.close()
+
+    def __enter__(self) -> "GetAddressInfoSoap":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def single_flight_stats(self) -> Optional[SingleFlightStats]:
+        """Return upstream and collapsed call counters, or None if single-flight is not enabled."""
+        return self._single_flight.stats() if self._single_flight is not None else None
+
+    def dedup_stats(self) -> DedupStats:
+        """Return the inputs and duplicates seen by deduplicating validate_many batches so far."""
+        with self._dedup_lock:
+            return DedupStats(**vars(self._dedup_stats))
+
+    def add_observer(self, observer: Observer) -> None:
+        """
+        Register observer(event), called synchronously with a CallEvent (see avi_metrics) for every
+        attempt start and end, failover, cache lookup and completed call. Without observers no
+        events are built.
+        """
+        self._observers.append(observer)
+
+    def _emit(self, kind: str, **fields) -> None:
+        event = CallEvent(kind, "soap", **fields)
+        for observer in self._observers:
+            observer(event)
+
+    def _get_client(self, wsdl: str) -> Client:
+        client = self._clients.get(wsdl)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(wsdl)
+                if client is None:
+                    transport = _KeepAliveTransport(self.pool_size, self.keep_alive, timeout=self.timeout)
+                    client = Client(wsdl, timeout=self.timeout, cache=self._wsdl_cache, cachingpolicy=1,
+                                    transport=transport)
+                    self._transports[wsdl] = transport
+                    self._clients[wsdl] = client
+        return client
+
     def get_address_info(
         self,
         address1: str,
@@ -37,6 +288,7 @@ class GetAddressInfoSoap:
         postal_code: str,
         country: str,
         output_language: str,
+        timeout_seconds: Optional[float] = None,
     ) -> Object:
         """
         Calls the GetAddressInfo SOAP API to retrieve validated and corrected international address information.
@@ -52,16 +304,203 @@ class GetAddressInfoSoap:
             postal_code: The postal code of the address. Required if locality and administrative area are not provided.
             country: The country name or ISO 3166-1 Alpha-2/Alpha-3 code.
             output_language: The language for service output (e.g., "ENGLISH", "BOTH", "LOCAL_ROMAN", "LOCAL").
-            license_key: Your ServiceObjects license key.
-            is_live: Determines whether to use the live or trial servers.
-            timeout_ms: Timeout, in milliseconds, for the call to the service.
+            timeout_seconds: Deadline of this call, in seconds. Defaults to the instance's timeout_ms.
 
         Returns:
             suds.sudsobject.Object: SOAP response containing validated address details or error.
 
         Raises:
             RuntimeError: If both primary and backup endpoints fail.
+            avi_retry.RetryableError: If they failed transiently (a RuntimeError subclass), after any retries.
+            avi_retry.DeadlineExceeded: If the deadline passed without a usable answer (a RuntimeError subclass).
+            avi_cassette.CassetteMiss: If replaying a cassette that did not record the address (a RuntimeError subclass).
         """
+        observed = bool(self._observers)
+        started = time.perf_counter() if observed else 0.0
+        deadline = Deadline(timeout_seconds if timeout_seconds is not None else self.deadline)
+        if self.prevalidate:
+            item, error = prevalidate_input(GetAddressInfoInput(
+                address1, address2, address3, address4, address5, locality, administrative_area,
+                postal_code, country, output_language, self.license_key, self.is_live
+            ))
+            if error is not None:
+                if observed:
+                    self._emit(REJECTED, type_code=error.TypeCode)
+                    self._emit(CALL_END, latency=time.perf_counter() - started, type_code=error.TypeCode,
+                               outcome=ERROR)
+                return _payload_to_response({"Error": dataclasses.asdict(error)})
+            country, output_language = item.Country, item.OutputLanguage
+
+        key = None
+        if self.cache is not None or self._single_flight is not None or self.cassette is not None:
+            key = cache_key(address1, address2, address3, address4, address5, locality,
+                            administrative_area, postal_code, country, output_language)
+        if self.cache is not None:
+            payload = self.cache.get(key)
+            if observed:
+                self._emit(CACHE_MISS if payload is None else CACHE_HIT)
+            if payload is not None:
+                if observed:
+                    self._emit(CALL_END, latency=time.perf_counter() - started, outcome=OK)
+                return _payload_to_response(payload)
+
+        def call() -> Object:
+            if isinstance(self.cassette, CassettePlayer):
+                return _payload_to_response(self._replay(key, deadline))
+            fetch_started = time.perf_counter()
+            response = self._call(
+                deadline,
+                address1,
+                address2,
+                address3,
+                address4,
+                address5,
+                locality,
+                administrative_area,
+                postal_code,
+                country,
+                output_language,
+            )
+            if self.cassette is not None:
+                self.cassette.record(key, _response_to_payload(response), time.perf_counter() - fetch_started)
+            return response
+
+        shared = False
+        try:
+            if self._single_flight is None:
+                response = call()
+            else:
+                # Collapsed callers receive the same suds response object
+                response, shared = self._single_flight.do(
+                    key, call, on_shared=(lambda: self._emit(COALESCED)) if observed else None, deadline=deadline
+                )
+        except Exception as exc:
+            if observed:
+                self._emit(CALL_END, latency=time.perf_counter() - started, outcome=EXCEPTION, exception=exc)
+            raise
+
+        # Error payloads are never cached, so a transient service problem is not replayed
+        if self.cache is not None and not shared and not getattr(response, "Error", None):
+            self.cache.set(key, _response_to_payload(response))
+
+        if observed:
+            type_code = _type_code(response)
+            self._emit(CALL_END, latency=time.perf_counter() - started, type_code=type_code,
+                       outcome=response_outcome(type_code))
+        return response
+
+    def _replay(self, key: str, deadline: Deadline) -> dict:
+        payload, delay = self.cassette.play(key)
+        remaining = deadline.remaining()
+        if remaining is not None and delay > remaining:
+            # The recorded answer would arrive too late, as a slow endpoint's would
+            time.sleep(remaining)
+            raise deadline.exceeded()
+        if delay > 0:
+            time.sleep(delay)
+        return payload
+
+    def _attempt(self, wsdl: str, call_kwargs: dict, deadline: Deadline) -> Object:
+        # Single call to one endpoint, reporting the outcome to the health tracker and observers
+        if self.health is not None and not self.health.allow_request(wsdl):
+            raise _CircuitOpenError(f"Circuit open for {EndpointHealth.endpoint_for(wsdl)}")
+        permit = None
+        if self.limiter is not None:
+            try:
+                permit = self.limiter.acquire(deadline.remaining())
+            except LimiterTimeout as exc:
+                if deadline.expired():
+                    raise deadline.exceeded() from exc
+                raise
+        try:
+            _, timeout, cut = deadline.timeouts(self.timeout, self.timeout)
+        except BaseException:
+            if permit is not None:
+                self.limiter.release(permit, IGNORE)
+            raise
+        observed = bool(self._observers)
+        if observed:
+            endpoint = EndpointHealth.endpoint_for(wsdl)
+            role = "primary" if wsdl == self._primary_wsdl else "backup"
+            self._emit(ATTEMPT_START, endpoint=endpoint, role=role)
+            started = time.perf_counter()
+        try:
+            client = self._get_client(wsdl)
+            # Override endpoint URL if needed:
+            # client.set_options(location=wsdl.replace('?wsdl','/soap'))
+            # suds passes __timeout through to this one request, leaving the shared client's options alone
+            response = client.service.GetAddressInfo(**call_kwargs, __timeout=timeout)
+        except Exception as exc:
+            # A timeout cut short by the deadline says nothing about the endpoint's health or load
+            cut_short = cut and _failure_reason(exc) == TIMEOUT
+            if permit is not None:
+                self.limiter.release(permit, IGNORE if cut_short else _limiter_signal(exc))
+            if self.health is not None and not cut_short:
+                self.health.record_failure(wsdl)
+            if observed:
+                self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                           http_status=_http_status(exc), outcome=EXCEPTION, exception=exc)
+            raise
+        except BaseException as exc:
+            if permit is not None:
+                self.limiter.release(permit, IGNORE)
+            if observed:
+                self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                           outcome=EXCEPTION, exception=exc)
+            raise
+        if permit is not None:
+            self.limiter.release(permit, OVERLOAD if response is None or _is_failover_error(response) else SUCCESS)
+        if self.health is not None:
+            if response is None or _is_failover_error(response):
+                self.health.record_failure(wsdl)
+            else:
+                self.health.record_success(wsdl)
+        if observed:
+            type_code = _type_code(response)
+            self._emit(ATTEMPT_END, endpoint=endpoint, role=role, latency=time.perf_counter() - started,
+                       http_status=200, type_code=type_code,
+                       outcome=response_outcome(type_code) if response is not None else EXCEPTION)
+        return response
+
+    def _call(self, deadline: Deadline, *address: str) -> Object:
+        # One round of attempts, repeated under the retry policy while it fails transiently and time is left
+        # A TypeCode 3 from the backup is returned, as before, once no retry is left
+        retries = 0
+        while True:
+            failure = None
+            try:
+                response = self._call_once(deadline, *address)
+                if not _is_failover_error(response):
+                    return response
+            except RetryableError as exc:
+                if deadline.expired():
+                    raise deadline.exceeded() from exc
+                failure = exc
+            delay = self.retry.delay(retries) if self.retry is not None and retries < self.retry.max_retries else None
+            remaining = deadline.remaining()
+            if delay is None or (remaining is not None and delay >= remaining):
+                if failure is not None:
+                    raise failure
+                return response
+            retries += 1
+            if self._observers:
+                self._emit(RETRY, latency=delay, exception=failure)
+            time.sleep(delay)
+
+    def _call_once(
+        self,
+        deadline: Deadline,
+        address1: str,
+        address2: str,
+        address3: str,
+        address4: str,
+        address5: str,
+        locality: str,
+        administrative_area: str,
+        postal_code: str,
+        country: str,
+        output_language: str,
+    ) -> Object:
         # Common kwargs for both calls
         call_kwargs = dict(
             Address1=address1,
@@ -78,34 +517,195 @@ class GetAddressInfoSoap:
         )
 
         # Attempt primary
+        failover_reason = None
         try:
-            client = Client(self._primary_wsdl, timeout=self.timeout)
-            # Override endpoint URL if needed:
-            # client.set_options(location=self._primary_wsdl.replace('?wsdl','/soap'))
-            response = client.service.GetAddressInfo(**call_kwargs)
+            response = self._attempt(self._primary_wsdl, call_kwargs, deadline)
 
             # If response invalid or Error.TypeCode == "3", trigger fallback
-            if response is None or (
-                hasattr(response, "Error")
-                and response.Error
-                and response.Error.TypeCode == "3"
-            ):
+            if response is None or _is_failover_error(response):
+                failover_reason = INVALID_RESPONSE if response is None else TYPE_CODE_3
                 raise ValueError("Primary returned no result or Error.TypeCode=3")
 
             return response
 
         except (WebFault, ValueError, Exception) as primary_ex:
+            if self._observers:
+                self._emit(FAILOVER, endpoint=EndpointHealth.endpoint_for(self._primary_wsdl), role="primary",
+                           reason=failover_reason or _failure_reason(primary_ex), exception=primary_ex)
+            if deadline.expired():
+                raise deadline.exceeded() from primary_ex
             # Attempt backup
             try:
-                client = Client(self._backup_wsdl, timeout=self.timeout)
-                response = client.service.GetAddressInfo(**call_kwargs)
+                response = self._attempt(self._backup_wsdl, call_kwargs, deadline)
                 if response is None:
                     raise ValueError("Backup returned no result")
                 return response
+            except DeadlineExceeded:
+                raise
             except (WebFault, Exception) as backup_ex:
                 msg = (
                     "Both primary and backup endpoints failed.\n"
                     f"Primary error: {str(primary_ex)}\n"
                     f"Backup error: {str(backup_ex)}"
                 )
-                raise RuntimeError(msg)
\ No newline at end of file
+                raise _error_type(backup_ex)(msg) from backup_ex
+
+    def validate_many(
+        self,
+        inputs: Iterable[GetAddressInfoInput],
+        max_workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        dedup: bool = True,
+        dedup_window: int = DEDUP_WINDOW,
+    ) -> Iterator[BatchResult]:
+        """
+        Validates many addresses concurrently, sharing this instance's cached SOAP clients.
+
+        Each input's TimeoutSeconds is its deadline. The LicenseKey and IsLive fields are ignored;
+        the values this instance was created with are used instead. Inputs with the same canonical
+        address (see avi_canonical.canonical_key) are validated once; dedup_stats() counts them.
+
+        Parameters:
+            inputs: The addresses to validate. May be a generator; it is consumed lazily.
+            max_workers: Number of worker threads.
+            max_in_flight: Maximum number of submitted but not yet yielded inputs. Defaults to 2 * max_workers.
+            ordered: Yield results in input order when True, as they complete otherwise.
+            dedup: Validate each distinct input once. When False, every input is its own call.
+            dedup_window: Number of distinct inputs remembered for deduplication.
+
+        Returns:
+            Iterator[BatchResult]: One result per input, carrying either the SOAP response
+            or the exception raised for that input. Duplicates share their first input's response object.
+        """
+        # Keep a pooled connection for every worker
+        with self._clients_lock:
+            self.pool_size = max(self.pool_size, max_workers)
+            for transport in self._transports.values():
+                transport.pool_size = self.pool_size
+        return run_batch(
+            self._get_address_info_for_input,
+            inputs,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            key=canonical_key if dedup else None,
+            dedup_window=dedup_window,
+            on_row=self._count_row,
+        )
+
+    def _count_row(self, duplicate: bool) -> None:
+        with self._dedup_lock:
+            self._dedup_stats.rows += 1
+            self._dedup_stats.duplicates += duplicate
+        if duplicate and self._observers:
+            self._emit(DEDUPLICATED)
+
+    def _get_address_info_for_input(self, item: GetAddressInfoInput) -> Object:
+        return self.get_address_info(
+            item.Address1,
+            item.Address2,
+            item.Address3,
+            item.Address4,
+            item.Address5,
+            item.Locality,
+            item.AdministrativeArea,
+            item.PostalCode,
+            item.Country,
+            item.OutputLanguage,
+            item.TimeoutSeconds,
+        )
+
+
+def _type_code(response: Object) -> Optional[str]:
+    error = getattr(response, "Error", None)
+    return getattr(error, "TypeCode", None) if error else None
+
+
+def _http_status(exc: Exception) -> Optional[int]:
+    if isinstance(exc, WebFault):
+        return 500
+    if isinstance(exc, TransportError):
+        return exc.httpcode
+    # suds reports other non-200 replies as Exception((status, description))
+    if exc.args and isinstance(exc.args[0], tuple) and exc.args[0] and isinstance(exc.args[0][0], int):
+        return exc.args[0][0]
+    return None
+
+
+def _failure_reason(exc: Exception) -> str:
+    if isinstance(exc, _CircuitOpenError):
+        return CIRCUIT_OPEN
+    if isinstance(exc, TimeoutError) or (isinstance(exc, URLError) and isinstance(exc.reason, TimeoutError)):
+        return TIMEOUT
+    if _http_status(exc) is not None:
+        return HTTP_ERROR
+    if isinstance(exc, (URLError, ConnectionError)):
+        return CONNECTION_ERROR
+    return EXCEPTION
+
+
+def _error_type(exc: Exception) -> type:
+    # Endpoint failures are transient and worth retrying; a 4xx (or a limiter timeout) would fail again
+    if isinstance(exc, RuntimeError) and not isinstance(exc, _CircuitOpenError):
+        return RuntimeError
+    status = _http_status(exc)
+    return RuntimeError if status is not None and status < 500 else RetryableError
+
+
+def _limiter_signal(exc: Exception) -> str:
+    # Timeouts and 5xx mean the service is struggling; anything else says nothing about its load
+    if _failure_reason(exc) == TIMEOUT or (_http_status(exc) or 0) >= 500:
+        return OVERLOAD
+    return IGNORE
+
+
+def _is_failover_error(response: Object) -> bool:
+    return bool(
+        hasattr(response, "Error")
+        and response.Error
+        and response.Error.TypeCode == "3"
+    )
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _response_to_payload(response: Object) -> dict:
+    # Store SOAP results in the REST JSON shape so one cache can serve both clients
+    payload = {}
+    address_info = getattr(response, "AddressInfo", None)
+    if address_info:
+        info = {name: _text(value) for name, value in address_info if name != "InformationComponents"}
+        components = getattr(address_info, "InformationComponents", None)
+        components = getattr(components, "InformationComponent", None) or [] if components else []
+        if not isinstance(components, list):
+            components = [components]
+        info["InformationComponents"] = [
+            {"Name": _text(getattr(component, "Name", None)), "Value": _text(getattr(component, "Value", None))}
+            for component in components
+        ]
+        payload["AddressInfo"] = info
+    error = getattr(response, "Error", None)
+    if error:
+        payload["Error"] = {name: _text(value) for name, value in error}
+    return payload
+
+
+def _payload_to_response(payload: dict) -> Object:
+    # Rebuild the suds object graph callers get from a live SOAP call
+    response = Factory.object("AddressInfoResponse")
+    info = payload.get("AddressInfo")
+    if info:
+        fields = {name: value for name, value in info.items() if name != "InformationComponents"}
+        fields["InformationComponents"] = Factory.object("ArrayOfInformationComponent", {
+            "InformationComponent": [
+                Factory.object("InformationComponent", component)
+                for component in info.get("InformationComponents", [])
+            ]
+        })
+        response.AddressInfo = Factory.object("AddressInfo", fields)
+    if payload.get("Error"):
+        response.Error = Factory.object("Error", payload["Error"])
+    return response
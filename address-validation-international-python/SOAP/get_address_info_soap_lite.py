@@ -0,0 +1,144 @@
+from typing import Iterable, Iterator, Tuple, Union
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+from xml.sax.saxutils import escape
+
+import requests
+
+from ..get_address_info_rest import AVIRestClient
+
+primary_url = "https://sws.serviceobjects.com/avi/soap.svc"
+backup_url = "https://swsbackup.serviceobjects.com/avi/soap.svc"
+trial_url = "https://trial.serviceobjects.com/avi/soap.svc"
+
+SOAP_ENV_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+AVI_NS = "http://www.serviceobjects.com"
+_XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+
+_HEADERS = {
+    "Content-Type": "text/xml; charset=utf-8",
+    "SOAPAction": '"http://www.serviceobjects.com/IAVISoapService/GetAddressInfo"',
+}
+
+# Request parameters in the order the WSDL's GetAddressInfo sequence declares them
+_INPUT_FIELDS = ("Address1", "Address2", "Address3", "Address4", "Address5", "Locality", "AdministrativeArea",
+                 "PostalCode", "Country", "OutputLanguage", "LicenseKey")
+
+# The request envelope, compiled once; each call only escapes and substitutes the values
+_ENVELOPE = (
+    f'<?xml version="1.0" encoding="utf-8"?><soap:Envelope xmlns:soap="{SOAP_ENV_NS}"><soap:Body>'
+    f'<GetAddressInfo xmlns="{AVI_NS}">'
+    + "".join(f"<{name}>{{}}</{name}>" for name in _INPUT_FIELDS)
+    + "</GetAddressInfo></soap:Body></soap:Envelope>"
+)
+
+_CONTAINERS = ("AddressInfo", "Error")
+
+# Bytes read from the reply per XMLPullParser.feed
+_CHUNK_SIZE = 8192
+
+
+def build_envelope(params: dict) -> bytes:
+    """Fill the GetAddressInfo request envelope with params (keyed by input field name)."""
+    values = [escape(str(params[name])) if params.get(name) else "" for name in _INPUT_FIELDS]
+    return _ENVELOPE.format(*values).encode("utf-8")
+
+
+def parse_envelope(content: Union[bytes, Iterable[bytes]]) -> dict:
+    """
+    Read a GetAddressInfo SOAP reply into the REST JSON payload shape.
+
+    The reply is parsed as it arrives: each chunk is fed to an XMLPullParser and its start/end
+    events are handled before the next chunk is read. Leaf values go straight into the dict of the
+    AddressInfo, Error or InformationComponent being read, and every element is cleared once read,
+    so no document tree is kept. Everything else (envelope, namespaces, Debug) is skipped.
+
+    The result is the payload dict rather than AddressInfoResponse: the failover check, response
+    cache, cassettes and single-flight all share that dict with the REST client, and parse_response
+    turns it into the avi_response dataclasses as it does a REST body.
+
+    Parameters:
+        content: The whole reply, or an iterable of its chunks (e.g. response.iter_content()).
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If content is not well-formed XML.
+    """
+    payload: dict = {}
+    current = None
+    components = None
+    component = None
+    for event, element in _events(content):
+        tag = element.tag
+        name = tag[tag.rfind("}") + 1:]
+        if event == "start":
+            if name in _CONTAINERS:
+                current = payload[name] = {}
+            elif name == "InformationComponents" and current is not None:
+                components = current[name] = []
+            elif name == "InformationComponent" and components is not None:
+                component = {}
+                components.append(component)
+            continue
+        if name in _CONTAINERS:
+            # A nil AddressInfo or Error reads as absent, as it does in JSON
+            if not current:
+                payload.pop(name, None)
+            current = components = None
+        elif name == "InformationComponent":
+            component = None
+        elif name == "InformationComponents":
+            components = None
+        elif current is not None:
+            value = None if element.get(_XSI_NIL) == "true" else (element.text or "")
+            if component is not None:
+                component[name] = value
+            elif components is None:
+                current[name] = value
+        element.clear()
+    return payload
+
+
+def _events(content: Union[bytes, Iterable[bytes]]) -> Iterator[Tuple[str, Element]]:
+    # Events are read after every chunk, so an element's text is complete by its end event
+    parser = XMLPullParser(("start", "end"))
+    for chunk in ((content,) if isinstance(content, bytes) else content):
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+class AVISoapLiteClient(AVIRestClient):
+    _client_name = "soap_lite"
+
+    def __init__(self, primary_url: str = primary_url, backup_url: str = backup_url, trial_url: str = trial_url,
+                 **options):
+        """
+        Client for the AVI GetAddressInfo SOAP endpoint that does without suds.
+
+        There is no WSDL to download or introspect: the request envelope is a precompiled template,
+        posted over the same pooled requests sessions as AVIRestClient, and the reply is parsed as
+        it streams in (see parse_envelope). Results are AddressInfoResponse objects, exactly as from
+        the REST clients.
+
+        Everything else is AVIRestClient's: get_address_info and validate_many take the same
+        arguments, and primary/backup failover, trial mode, timeouts, deadlines and every option
+        (cache, health, hedging, observers, single_flight, prevalidate, limiter, retry, cassette) work the
+        same way.
+        Observers see client "soap_lite".
+
+        primary_url: Override for the primary (live) SOAP endpoint URL (not the WSDL URL).
+        backup_url: Override for the backup (live) SOAP endpoint URL.
+        trial_url: Override for the trial SOAP endpoint URL.
+        options: Any other AVIRestClient argument.
+        """
+        super().__init__(primary_url=primary_url, backup_url=backup_url, trial_url=trial_url, **options)
+
+    def _get(self, url: str, params: dict, timeout: Tuple[float, float]) -> dict:
+        with self._sessions[url].post(url, data=build_envelope(params), headers=_HEADERS, timeout=timeout,
+                                      stream=True) as response:
+            response.raise_for_status()
+            try:
+                return parse_envelope(response.iter_content(_CHUNK_SIZE))
+            except ParseError as exc:
+                # Keep malformed replies on the RequestException path, so they fail over like bad JSON
+                raise requests.exceptions.ContentDecodingError(str(exc)) from exc
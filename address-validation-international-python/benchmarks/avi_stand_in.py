@@ -0,0 +1,455 @@
+"""
+Local stand-in for the ServiceObjects AVI GetAddressInfo service.
+
+Serves the REST JSON endpoint (/avi/api.svc/json/GetAddressInfo) and the SOAP endpoint
+(/avi/soap.svc with ?wsdl) on localhost so the clients can be benchmarked without
+calling the paid live service. A StandInConfig adds response latency drawn from a
+distribution, injected errors (TypeCode 3 payloads and HTTP 500s) and dropped connections.
+
+Usage:
+    python avi_stand_in.py --port 8080
+    python avi_stand_in.py --port 8080 --latency-ms 40 --distribution lognormal --error-rate 0.02 --drop-rate 0.01
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, fields as dataclass_fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+SOAP_ENV_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+AVI_NS = "http://www.serviceobjects.com"
+
+REST_PATH = "/avi/api.svc/json/GetAddressInfo"
+SOAP_PATH = "/avi/soap.svc"
+
+# Payload the live service returns for an internal failure; clients fail over on TypeCode 3
+FATAL_ERROR = {
+    "Type": "Service Objects Fatal",
+    "TypeCode": "3",
+    "Desc": "Unhandled error. Please contact Service Objects.",
+    "DescCode": "1",
+}
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+INPUT_FIELDS = (
+    "Address1", "Address2", "Address3", "Address4", "Address5", "Locality",
+    "AdministrativeArea", "PostalCode", "Country", "OutputLanguage", "LicenseKey",
+)
+
+WSDL_TEMPLATE = """<?xml version="1.0" encoding="utf-8"?>
+<wsdl:definitions name="AVISoapService" targetNamespace="http://www.serviceobjects.com"
+    xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/"
+    xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    xmlns:tns="http://www.serviceobjects.com">
+  <wsdl:types>
+    <xs:schema elementFormDefault="qualified" targetNamespace="http://www.serviceobjects.com">
+      <xs:element name="GetAddressInfo">
+        <xs:complexType>
+          <xs:sequence>
+{input_elements}
+          </xs:sequence>
+        </xs:complexType>
+      </xs:element>
+      <xs:element name="GetAddressInfoResponse">
+        <xs:complexType>
+          <xs:sequence>
+            <xs:element minOccurs="0" name="GetAddressInfoResult" nillable="true" type="tns:AddressInfoResponse"/>
+          </xs:sequence>
+        </xs:complexType>
+      </xs:element>
+      <xs:complexType name="AddressInfoResponse">
+        <xs:sequence>
+          <xs:element minOccurs="0" name="AddressInfo" nillable="true" type="tns:AddressInfo"/>
+          <xs:element minOccurs="0" name="Error" nillable="true" type="tns:Error"/>
+          <xs:element minOccurs="0" name="Debug" nillable="true" type="xs:string"/>
+        </xs:sequence>
+      </xs:complexType>
+      <xs:complexType name="AddressInfo">
+        <xs:sequence>
+{address_info_elements}
+          <xs:element minOccurs="0" name="InformationComponents" nillable="true" type="tns:ArrayOfInformationComponent"/>
+        </xs:sequence>
+      </xs:complexType>
+      <xs:complexType name="ArrayOfInformationComponent">
+        <xs:sequence>
+          <xs:element minOccurs="0" maxOccurs="unbounded" name="InformationComponent" nillable="true" type="tns:InformationComponent"/>
+        </xs:sequence>
+      </xs:complexType>
+      <xs:complexType name="InformationComponent">
+        <xs:sequence>
+          <xs:element minOccurs="0" name="Name" nillable="true" type="xs:string"/>
+          <xs:element minOccurs="0" name="Value" nillable="true" type="xs:string"/>
+        </xs:sequence>
+      </xs:complexType>
+      <xs:complexType name="Error">
+        <xs:sequence>
+          <xs:element minOccurs="0" name="Type" nillable="true" type="xs:string"/>
+          <xs:element minOccurs="0" name="TypeCode" nillable="true" type="xs:string"/>
+          <xs:element minOccurs="0" name="Desc" nillable="true" type="xs:string"/>
+          <xs:element minOccurs="0" name="DescCode" nillable="true" type="xs:string"/>
+        </xs:sequence>
+      </xs:complexType>
+    </xs:schema>
+  </wsdl:types>
+  <wsdl:message name="IAVISoapService_GetAddressInfo_InputMessage">
+    <wsdl:part name="parameters" element="tns:GetAddressInfo"/>
+  </wsdl:message>
+  <wsdl:message name="IAVISoapService_GetAddressInfo_OutputMessage">
+    <wsdl:part name="parameters" element="tns:GetAddressInfoResponse"/>
+  </wsdl:message>
+  <wsdl:portType name="IAVISoapService">
+    <wsdl:operation name="GetAddressInfo">
+      <wsdl:input message="tns:IAVISoapService_GetAddressInfo_InputMessage"/>
+      <wsdl:output message="tns:IAVISoapService_GetAddressInfo_OutputMessage"/>
+    </wsdl:operation>
+  </wsdl:portType>
+  <wsdl:binding name="DOTSAddressValidationInternational" type="tns:IAVISoapService">
+    <soap:binding transport="http://schemas.xmlsoap.org/soap/http"/>
+    <wsdl:operation name="GetAddressInfo">
+      <soap:operation soapAction="http://www.serviceobjects.com/IAVISoapService/GetAddressInfo" style="document"/>
+      <wsdl:input><soap:body use="literal"/></wsdl:input>
+      <wsdl:output><soap:body use="literal"/></wsdl:output>
+    </wsdl:operation>
+  </wsdl:binding>
+  <wsdl:service name="AVISoapService">
+    <wsdl:port name="DOTSAddressValidationInternational" binding="tns:DOTSAddressValidationInternational">
+      <soap:address location="{location}"/>
+    </wsdl:port>
+  </wsdl:service>
+</wsdl:definitions>"""
+
+ADDRESS_INFO_FIELDS = (
+    "Status", "ResolutionLevel", "Address1", "Address2", "Address3", "Address4", "Address5",
+    "Address6", "Address7", "Address8", "Locality", "AdministrativeArea", "PostalCode",
+    "Country", "CountryISO2", "CountryISO3",
+)
+
+
+def _string_elements(names) -> str:
+    return "\n".join(
+        f'            <xs:element minOccurs="0" name="{name}" nillable="true" type="xs:string"/>'
+        for name in names
+    )
+
+
+def build_wsdl(location: str) -> str:
+    """Return the stand-in WSDL with its SOAP endpoint pointing at location."""
+    return WSDL_TEMPLATE.format(
+        input_elements=_string_elements(INPUT_FIELDS),
+        address_info_elements=_string_elements(ADDRESS_INFO_FIELDS),
+        location=location,
+    )
+
+
+def build_result(fields: Dict[str, str]) -> dict:
+    """
+    Build a canned GetAddressInfo result for the given input fields, shaped like the
+    live service's JSON response.
+    """
+    return {
+        "AddressInfo": {
+            "Status": "Validated",
+            "ResolutionLevel": "Premise",
+            "Address1": (fields.get("Address1") or "").upper(),
+            "Address2": (fields.get("Address2") or "").upper(),
+            "Address3": "",
+            "Address4": "",
+            "Address5": "",
+            "Address6": "",
+            "Address7": "",
+            "Address8": "",
+            "Locality": (fields.get("Locality") or "").upper(),
+            "AdministrativeArea": (fields.get("AdministrativeArea") or "").upper(),
+            "PostalCode": fields.get("PostalCode") or "",
+            "Country": "United States",
+            "CountryISO2": "US",
+            "CountryISO3": "USA",
+            "InformationComponents": [
+                {"Name": "DPV", "Value": "1"},
+                {"Name": "DPVDesc", "Value": "Yes, the input record is a valid mailing address"},
+                {"Name": "Latitude", "Value": "34.418014"},
+                {"Name": "Longitude", "Value": "-119.696477"},
+            ],
+        }
+    }
+
+
+@dataclass
+class StandInConfig:
+    """
+    Latency and fault injection applied to every GetAddressInfo call (WSDL downloads are
+    never delayed or failed).
+
+    latency_ms: Median response latency, in milliseconds.
+    distribution: How latency is drawn: "fixed", "uniform" (latency_ms +/- spread),
+        "exponential" (median latency_ms) or "lognormal" (median latency_ms, sigma spread).
+    spread: Width of the uniform and lognormal distributions (fraction of latency_ms, sigma).
+    tail_rate: Fraction of calls that take tail_ms instead, e.g. to exercise hedging.
+    tail_ms: Latency of tail calls, in milliseconds.
+    error_rate: Fraction of calls answered with a TypeCode 3 error payload.
+    http_error_rate: Fraction of calls answered with HTTP 500.
+    drop_rate: Fraction of calls whose connection is closed without a response.
+    seed: Seed for the random draws, for repeatable runs.
+    """
+    latency_ms: float = 0.0
+    distribution: str = "fixed"
+    spread: float = 0.5
+    tail_rate: float = 0.0
+    tail_ms: float = 0.0
+    error_rate: float = 0.0
+    http_error_rate: float = 0.0
+    drop_rate: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Draw one response latency, in seconds."""
+        if self.tail_rate and rng.random() < self.tail_rate:
+            return self.tail_ms / 1000.0
+        median = self.latency_ms
+        if median <= 0 or self.distribution == "fixed":
+            return max(median, 0.0) / 1000.0
+        if self.distribution == "uniform":
+            latency = rng.uniform(median * (1 - self.spread), median * (1 + self.spread))
+        elif self.distribution == "exponential":
+            # Median of an exponential distribution is mean * ln 2
+            latency = rng.expovariate(0.6931471805599453 / median)
+        else:
+            latency = rng.lognormvariate(0.0, self.spread) * median
+        return max(latency, 0.0) / 1000.0
+
+
+@dataclass
+class StandInStats:
+    connections: int = 0
+    requests: int = 0
+    errors_injected: int = 0
+    http_errors_injected: int = 0
+    drops: int = 0
+
+    def __str__(self) -> str:
+        return (f"StandInStats: connections={self.connections}, requests={self.requests}, "
+                f"errors_injected={self.errors_injected}, http_errors_injected={self.http_errors_injected}, "
+                f"drops={self.drops}")
+
+
+def _xml_elements(values: dict) -> str:
+    return "".join(f"<{name}>{escape(value or '')}</{name}>" for name, value in values.items())
+
+
+def build_soap_envelope(result: dict) -> str:
+    """Serialize a GetAddressInfo result into the SOAP response envelope."""
+    body = ""
+    address_info = result.get("AddressInfo")
+    if address_info:
+        scalars = {name: address_info.get(name) for name in ADDRESS_INFO_FIELDS}
+        components = "".join(
+            f"<InformationComponent>{_xml_elements(component)}</InformationComponent>"
+            for component in address_info.get("InformationComponents", [])
+        )
+        body += (f"<AddressInfo>{_xml_elements(scalars)}"
+                 f"<InformationComponents>{components}</InformationComponents></AddressInfo>")
+    error = result.get("Error")
+    if error:
+        body += f"<Error>{_xml_elements(error)}</Error>"
+    return (f'<s:Envelope xmlns:s="{SOAP_ENV_NS}"><s:Body>'
+            f'<GetAddressInfoResponse xmlns="{AVI_NS}"><GetAddressInfoResult>{body}</GetAddressInfoResult>'
+            f'</GetAddressInfoResponse></s:Body></s:Envelope>')
+
+
+def parse_soap_request(payload: bytes) -> Dict[str, str]:
+    """Extract the GetAddressInfo input fields from a SOAP request envelope."""
+    root = ElementTree.fromstring(payload)
+    request = root.find(f"{{{SOAP_ENV_NS}}}Body/{{{AVI_NS}}}GetAddressInfo")
+    if request is None:
+        return {}
+    return {child.tag.split("}", 1)[-1]: child.text or "" for child in request}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle's algorithm adds ~40 ms per response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.stand_in.count("connections")
+
+    def _inject(self) -> Optional[str]:
+        """
+        Apply the configured latency and faults to one call. Returns "drop", "http_error" or
+        "error" when a fault was drawn, otherwise None.
+        """
+        stand_in = self.server.stand_in
+        config = stand_in.config
+        stand_in.count("requests")
+        delay, roll = stand_in.draw()
+        if delay:
+            time.sleep(delay)
+        for fault, rate in (("drop", config.drop_rate), ("http_error", config.http_error_rate),
+                            ("error", config.error_rate)):
+            if roll < rate:
+                stand_in.count({"drop": "drops", "http_error": "http_errors_injected",
+                                "error": "errors_injected"}[fault])
+                return fault
+            roll -= rate
+        return None
+
+    def _drop(self) -> None:
+        # Close without answering, as a load balancer resetting a kept-alive connection would
+        self.close_connection = True
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path.lower() == REST_PATH.lower():
+            fault = self._inject()
+            if fault == "drop":
+                self._drop()
+                return
+            if fault == "http_error":
+                self._send(500, b"", "text/plain")
+                return
+            query = parse_qs(parts.query, keep_blank_values=True)
+            fields = {name: values[0] for name, values in query.items()}
+            result = {"Error": dict(FATAL_ERROR)} if fault == "error" else build_result(fields)
+            self._send(200, json.dumps(result).encode("utf-8"), "application/json")
+        elif parts.path.lower() == SOAP_PATH.lower() and parts.query.lower() == "wsdl":
+            location = f"http://{self.headers['Host']}{SOAP_PATH}"
+            self._send(200, build_wsdl(location).encode("utf-8"), "text/xml; charset=utf-8")
+        else:
+            self._send(404, b"", "text/plain")
+
+    def do_POST(self):
+        payload = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if urlsplit(self.path).path.lower() != SOAP_PATH.lower():
+            self._send(404, b"", "text/plain")
+            return
+        fault = self._inject()
+        if fault == "drop":
+            self._drop()
+            return
+        if fault == "http_error":
+            self._send(500, b"", "text/plain")
+            return
+        result = {"Error": dict(FATAL_ERROR)} if fault == "error" else build_result(parse_soap_request(payload))
+        self._send(200, build_soap_envelope(result).encode("utf-8"), "text/xml; charset=utf-8")
+
+
+class StandInServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[StandInConfig] = None):
+        """
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free port.
+        config: Latency and fault injection. May be replaced while the server is running.
+        """
+        self.config = config or StandInConfig()
+        self._rng = random.Random(self.config.seed)
+        self._stats = StandInStats()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), StandInHandler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self._thread: Optional[threading.Thread] = None
+
+    def draw(self):
+        """Return (latency in seconds, fault roll in [0, 1)) for one call."""
+        with self._lock:
+            return self.config.sample_latency(self._rng), self._rng.random()
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    def stats(self) -> StandInStats:
+        with self._lock:
+            return StandInStats(**vars(self._stats))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = StandInStats()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def rest_url(self) -> str:
+        return f"{self.base_url}{REST_PATH}?"
+
+    @property
+    def soap_url(self) -> str:
+        return f"{self.base_url}{SOAP_PATH}"
+
+    @property
+    def wsdl_url(self) -> str:
+        return f"{self.base_url}{SOAP_PATH}?wsdl"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median response latency.")
+    parser.add_argument("--distribution", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--spread", type=float, default=0.5)
+    parser.add_argument("--tail-rate", type=float, default=0.0)
+    parser.add_argument("--tail-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of TypeCode 3 responses.")
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="Fraction of HTTP 500 responses.")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of dropped connections.")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    config = StandInConfig(**{field.name: getattr(args, field.name) for field in dataclass_fields(StandInConfig)})
+    server = StandInServer(args.host, args.port, config)
+    print(f"REST: {server.rest_url}")
+    print(f"WSDL: {server.wsdl_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,138 @@
+"""
+Throughput, latency percentiles and memory of the REST and SOAP clients against the local
+AVI stand-in, across a set of service behaviours.
+
+    baseline : instant responses, no faults
+    latency  : lognormal latency around --latency-ms
+    failover : as latency, plus --error-rate TypeCode 3 responses from the primary
+    drops    : as latency, plus --drop-rate dropped connections on the primary
+
+Each scenario runs --calls calls from --workers threads through AVIRestClient, GetAddressInfoSoap
+(suds) and AVISoapLiteClient (no suds), with a clean stand-in as the backup. Latency is
+measured per call; memory is the tracemalloc peak of a second, shorter pass.
+
+Usage:
+    python bench_clients.py --calls 2000 --workers 16
+    python bench_clients.py --scenario failover --client rest --json results.json
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from address_validation_international import AVIRestClient, AVISoapLiteClient, GetAddressInfoSoap
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "Ste 500", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH")
+
+SCENARIOS = ("baseline", "latency", "failover", "drops")
+CLIENTS = ("rest", "soap", "soap_lite")
+
+
+def scenario_config(name: str, args: argparse.Namespace) -> StandInConfig:
+    """Return the primary stand-in's behaviour for a scenario."""
+    if name == "baseline":
+        return StandInConfig(seed=args.seed)
+    config = StandInConfig(latency_ms=args.latency_ms, distribution="lognormal", spread=0.5, seed=args.seed)
+    if name == "failover":
+        config.error_rate = args.error_rate
+    elif name == "drops":
+        config.drop_rate = args.drop_rate
+    return config
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100.0))]
+
+
+def _run_calls(call: Callable[[], object], calls: int, workers: int):
+    def timed(_):
+        start = time.perf_counter()
+        try:
+            call()
+            failed = False
+        except Exception:
+            failed = True
+        return time.perf_counter() - start, failed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(timed, range(calls)))
+    return time.perf_counter() - started, outcomes
+
+
+def measure(make_call: Callable[[], Callable[[], object]], args: argparse.Namespace) -> Dict[str, float]:
+    call = make_call()
+    call()  # warm up connections and, for SOAP, the WSDL
+    elapsed, outcomes = _run_calls(call, args.calls, args.workers)
+    latencies = sorted(seconds * 1000 for seconds, _ in outcomes)
+
+    # Memory pass: a fresh client, so its setup cost is included in the peak
+    tracemalloc.start()
+    _run_calls(make_call(), max(1, args.calls // 10), args.workers)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "throughput": len(outcomes) / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "failed": sum(1 for _, failed in outcomes if failed),
+        "peak_mib": peak / (1024 * 1024),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="Repeat to pick several; default all.")
+    parser.add_argument("--client", choices=CLIENTS, action="append", help="Repeat to pick several; default all.")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--drop-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="Also write the results to this file, for comparing runs.")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{args.calls} calls, {args.workers} workers\n")
+    print(f"{'scenario':<9} {'client':<9} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'failed':>7} {'peak MiB':>9}")
+    with StandInServer() as primary, StandInServer() as backup, tempfile.TemporaryDirectory() as cache_dir:
+        for scenario in args.scenario or SCENARIOS:
+            for client in args.client or CLIENTS:
+                primary.config = scenario_config(scenario, args)
+
+                if client == "rest":
+                    def make_call():
+                        rest = AVIRestClient(pool_size=args.workers, primary_url=primary.rest_url,
+                                             backup_url=backup.rest_url)
+                        return lambda: rest.get_address_info(*ADDRESS, "KEY")
+                elif client == "soap_lite":
+                    def make_call():
+                        lite = AVISoapLiteClient(pool_size=args.workers, primary_url=primary.soap_url,
+                                                 backup_url=backup.soap_url)
+                        return lambda: lite.get_address_info(*ADDRESS, "KEY")
+                else:
+                    def make_call():
+                        soap = GetAddressInfoSoap("KEY", primary_wsdl=primary.wsdl_url,
+                                                  backup_wsdl=backup.wsdl_url, cache_location=cache_dir)
+                        return lambda: soap.get_address_info(*ADDRESS)
+
+                row = dict(scenario=scenario, client=client, **measure(make_call, args))
+                results.append(row)
+                print(f"{scenario:<9} {client:<9} {row['throughput']:9.1f} {row['p50_ms']:8.2f} "
+                      f"{row['p95_ms']:8.2f} {row['p99_ms']:8.2f} {row['failed']:7d} {row['peak_mib']:9.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"calls": args.calls, "workers": args.workers, "results": results}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Import time of the address_validation_international package and of each client, as a
+serverless cold start pays it.
+
+    package   : import address_validation_international
+    rest      : ... import AVIRestClient
+    async     : ... import AVIAsyncRestClient
+    soap      : ... import GetAddressInfoSoap (suds)
+    soap_lite : ... import AVISoapLiteClient
+    eager     : every module of the package, as importing it did before names were resolved lazily
+
+Each import runs --repeat times in a fresh interpreter; the median is reported, with the
+heavy third-party modules that the import loaded. The run fails when a client loads another
+client's transport (e.g. AVIAsyncRestClient loading requests), and with --max-ms when any
+measured import is slower, so it can guard a deployment's cold start in CI.
+
+Usage:
+    python bench_import.py --repeat 10
+    python bench_import.py --target rest --max-ms 250 --json imports.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+PACKAGE = "address_validation_international"
+
+TARGETS = {
+    "package": f"import {PACKAGE}",
+    "rest": f"from {PACKAGE} import AVIRestClient",
+    "async": f"from {PACKAGE} import AVIAsyncRestClient",
+    "soap": f"from {PACKAGE} import GetAddressInfoSoap",
+    "soap_lite": f"from {PACKAGE} import AVISoapLiteClient",
+    "eager": f"import {PACKAGE} as p\nfor n in p.__all__: getattr(p, n)",
+}
+
+HEAVY = ("requests", "aiohttp", "asyncio", "suds", "orjson", "numpy", "pandas", "pyarrow", "sqlite3", "http.server")
+
+# Heavy modules each import must not load: every client brings only its own transport
+MUST_NOT_LOAD = {
+    "package": HEAVY,
+    "rest": ("aiohttp", "suds", "numpy", "pandas", "pyarrow"),
+    "async": ("requests", "suds", "numpy", "pandas", "pyarrow"),
+    "soap": ("requests", "aiohttp", "numpy", "pandas", "pyarrow"),
+    "soap_lite": ("aiohttp", "suds", "numpy", "pandas", "pyarrow"),
+}
+
+# Runs in the fresh interpreter: time the import, then report it and the heavy modules it loaded
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - started
+print(elapsed * 1000.0)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(code: str, repeat: int) -> Dict[str, object]:
+    """Run code in repeat fresh interpreters and return the median import time and modules loaded."""
+    times = []
+    loaded = ""
+    for _ in range(repeat):
+        probe = _PROBE.format(code=code, heavy=HEAVY)
+        output = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+        elapsed, loaded = output.splitlines()
+        times.append(float(elapsed))
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "loaded": loaded.split(",") if loaded else []}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--target", choices=TARGETS, action="append", help="Repeat to pick several; default all.")
+    parser.add_argument("--max-ms", type=float, help="Exit with status 1 if any median import time is above this.")
+    parser.add_argument("--json", help="Also write the results to this file, for comparing runs.")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{args.repeat} fresh interpreters per import\n")
+    print(f"{'import':<10} {'median ms':>10} {'min ms':>8}  loaded")
+    for target in args.target or TARGETS:
+        row = dict(target=target, **measure(TARGETS[target], args.repeat))
+        results.append(row)
+        print(f"{target:<10} {row['median_ms']:10.1f} {row['min_ms']:8.1f}  {', '.join(row['loaded']) or '-'}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"repeat": args.repeat, "python": sys.version.split()[0], "results": results}, handle, indent=2)
+
+    failed = False
+    for row in results:
+        leaked = [module for module in row["loaded"] if module in MUST_NOT_LOAD.get(row["target"], ())]
+        if leaked:
+            print(f"\n{row['target']} loaded {', '.join(leaked)}, which it must not import")
+            failed = True
+    if args.max_ms is not None:
+        slow = [row["target"] for row in results if row["median_ms"] > args.max_ms]
+        if slow:
+            print(f"\nAbove the {args.max_ms:g} ms budget: {', '.join(slow)}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
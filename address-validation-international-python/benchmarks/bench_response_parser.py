@@ -0,0 +1,149 @@
+"""
+Cost of turning a GetAddressInfo JSON body into an AddressInfoResponse, and the memory
+held per parsed result.
+
+    before : json.loads plus the original field-by-field parser building dict-backed
+             dataclasses
+    after  : avi_response.loads (orjson when installed) plus the table-driven
+             parse_response building slotted dataclasses
+
+Memory is measured with tracemalloc while keeping every parsed result alive, as a bulk
+job holding its results would.
+
+Usage:
+    python bench_response_parser.py --count 100000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Optional
+
+from address_validation_international import avi_response
+from avi_stand_in import build_result
+
+
+# The models and parser as they were before slots and the shared parser
+@dataclass
+class LegacyInformationComponent:
+    Name: Optional[str] = None
+    Value: Optional[str] = None
+
+
+@dataclass
+class LegacyError:
+    Type: Optional[str] = None
+    TypeCode: Optional[str] = None
+    Desc: Optional[str] = None
+    DescCode: Optional[str] = None
+
+
+@dataclass
+class LegacyAddressInfo:
+    Status: Optional[str] = None
+    ResolutionLevel: Optional[str] = None
+    Address1: Optional[str] = None
+    Address2: Optional[str] = None
+    Address3: Optional[str] = None
+    Address4: Optional[str] = None
+    Address5: Optional[str] = None
+    Address6: Optional[str] = None
+    Address7: Optional[str] = None
+    Address8: Optional[str] = None
+    Locality: Optional[str] = None
+    AdministrativeArea: Optional[str] = None
+    PostalCode: Optional[str] = None
+    Country: Optional[str] = None
+    CountryISO2: Optional[str] = None
+    CountryISO3: Optional[str] = None
+    InformationComponents: Optional[List[LegacyInformationComponent]] = None
+
+    def __post_init__(self):
+        if self.InformationComponents is None:
+            self.InformationComponents = []
+
+
+@dataclass
+class LegacyAddressInfoResponse:
+    AddressInfo: Optional[LegacyAddressInfo] = None
+    Error: Optional[LegacyError] = None
+
+
+def legacy_parse_response(data: dict) -> LegacyAddressInfoResponse:
+    error = LegacyError(**data.get("Error", {})) if data.get("Error") else None
+    address_info = data.get("AddressInfo")
+    address_info_obj = None
+    if address_info:
+        address_info_obj = LegacyAddressInfo(
+            Status=address_info.get("Status"),
+            ResolutionLevel=address_info.get("ResolutionLevel"),
+            Address1=address_info.get("Address1"),
+            Address2=address_info.get("Address2"),
+            Address3=address_info.get("Address3"),
+            Address4=address_info.get("Address4"),
+            Address5=address_info.get("Address5"),
+            Address6=address_info.get("Address6"),
+            Address7=address_info.get("Address7"),
+            Address8=address_info.get("Address8"),
+            Locality=address_info.get("Locality"),
+            AdministrativeArea=address_info.get("AdministrativeArea"),
+            PostalCode=address_info.get("PostalCode"),
+            Country=address_info.get("Country"),
+            CountryISO2=address_info.get("CountryISO2"),
+            CountryISO3=address_info.get("CountryISO3"),
+            InformationComponents=[
+                LegacyInformationComponent(Name=comp.get("Name"), Value=comp.get("Value"))
+                for comp in address_info.get("InformationComponents", [])
+            ] if "InformationComponents" in address_info else []
+        )
+    return LegacyAddressInfoResponse(AddressInfo=address_info_obj, Error=error)
+
+
+def before(body: bytes):
+    return legacy_parse_response(json.loads(body))
+
+
+def after(body: bytes):
+    return avi_response.parse_response(avi_response.loads(body))
+
+
+def _time_parse(parse, bodies: List[bytes]) -> float:
+    start = time.perf_counter()
+    for body in bodies:
+        parse(body)
+    return (time.perf_counter() - start) / len(bodies) * 1e6
+
+
+def _retained_bytes(parse, bodies: List[bytes]) -> float:
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    results = [parse(body) for body in bodies]
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del results
+    return retained / len(bodies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    # Distinct bodies, so interned strings do not flatter either side
+    bodies = [
+        json.dumps(build_result({"Address1": f"{number} E Cota St", "Locality": "Santa Barbara",
+                                 "AdministrativeArea": "CA", "PostalCode": "93101"})).encode()
+        for number in range(args.count)
+    ]
+    decoder = "orjson" if avi_response.orjson is not None else "json (orjson not installed)"
+    print(f"{args.count} responses, after decoder: {decoder}\n")
+
+    for label, parse in (("before", before), ("after", after)):
+        parse(bodies[0])
+        print(f"{label:<6}: {_time_parse(parse, bodies):6.2f} us/response   "
+              f"{_retained_bytes(parse, bodies):7.0f} bytes retained/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Per-call latency of GetAddressInfoSoap before and after client/WSDL caching, measured
+against the local AVI stand-in.
+
+    before     : a new suds Client (WSDL download and parse) on every call, as the SOAP
+                 client used to do
+    after      : one GetAddressInfoSoap instance reused across calls
+    cold start : a fresh GetAddressInfoSoap per call, reading the parsed WSDL from the
+                 on-disk cache
+
+Usage:
+    python bench_soap_client.py --calls 200
+"""
+import argparse
+import statistics
+import tempfile
+import time
+
+from suds.client import Client
+from address_validation_international import GetAddressInfoSoap
+from avi_stand_in import StandInServer
+
+ADDRESS = ("27 E Cota St", "Ste 500", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH")
+
+
+def _report(label: str, samples) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<11}: mean {statistics.mean(samples):8.2f} ms   "
+          f"p50 {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def _time_calls(calls: int, call) -> list:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with StandInServer() as server, tempfile.TemporaryDirectory() as cache_dir:
+        wsdl = server.wsdl_url
+        fields = dict(zip(
+            ("Address1", "Address2", "Address3", "Address4", "Address5", "Locality",
+             "AdministrativeArea", "PostalCode", "Country", "OutputLanguage"), ADDRESS))
+
+        def before():
+            Client(wsdl, timeout=15).service.GetAddressInfo(LicenseKey="KEY", **fields)
+
+        service = GetAddressInfoSoap("KEY", primary_wsdl=wsdl, backup_wsdl=wsdl, cache_location=cache_dir)
+
+        def after():
+            service.get_address_info(*ADDRESS)
+
+        def cold_start():
+            GetAddressInfoSoap("KEY", primary_wsdl=wsdl, backup_wsdl=wsdl,
+                               cache_location=cache_dir).get_address_info(*ADDRESS)
+
+        print(f"{args.calls} calls against {wsdl}\n")
+        _report("before", _time_calls(args.calls, before))
+        _report("after", _time_calls(args.calls, after))
+        _report("cold start", _time_calls(args.calls, cold_start))
+
+
+if __name__ == "__main__":
+    main()
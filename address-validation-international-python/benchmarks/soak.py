@@ -0,0 +1,585 @@
+"""
+Soak test: drive the REST and SOAP clients at a target rate or concurrency for a fixed
+duration, and report what a long-running worker fleet would see.
+
+    latency      : HDR-style histograms per client, for the whole run and per interval
+    throughput   : calls, calls/s and failures per --interval, as the run goes
+    failover     : failovers by reason, attempts answered by the backup, retries and call outcomes
+    connections  : connections opened vs. attempts made (client side) and vs. requests served
+                   (server side, for local stand-ins)
+    leaks        : open file descriptors and threads of this process per interval
+
+With --qps, calls are started on a fixed schedule (open loop) by up to --concurrency threads,
+and latency is measured from when each call was due, so a stalled service shows up as the
+waiting it causes instead of as fewer, faster calls. Without --qps, --concurrency threads
+call back to back (closed loop). Several --client flags load the clients at the same time,
+each at the full --qps or --concurrency.
+
+Without --base-url, a primary and a backup stand-in (avi_stand_in.py) are started in this
+process, the primary with the given latency and faults. With --base-url, the clients call
+that host instead, e.g. a stand-in started separately, so only the clients' file descriptors
+and threads are counted.
+
+Usage:
+    python soak.py --client rest --qps 200 --duration 600 --latency-ms 40 --error-rate 0.02
+    python soak.py --client rest --client soap_lite --concurrency 32 --duration 300 --hgrm soak
+    python soak.py --client rest --base-url http://10.0.0.5:8080 --qps 500 --duration 3600 --json soak.json
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import count
+from typing import Callable, Dict, List, Optional, Tuple
+
+from address_validation_international import (
+    AVIRestClient, AVISoapLiteClient, GetAddressInfoInput, GetAddressInfoSoap, RetryPolicy,
+)
+from address_validation_international.avi_metrics import ATTEMPT_END, CALL_END, FAILOVER, OK, RETRY, CallEvent
+from avi_stand_in import LATENCY_DISTRIBUTIONS, REST_PATH, SOAP_PATH, StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "Ste 500", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH")
+
+CLIENTS = ("rest", "soap", "soap_lite")
+
+SUMMARY_PERCENTILES = (50.0, 75.0, 90.0, 99.0, 99.9, 99.99, 100.0)
+
+# A call started this long after it was due counts as behind schedule
+LATE_AFTER = 0.005
+
+# The ClientLoad whose call the current thread is making
+_current = threading.local()
+
+
+class LatencyHistogram:
+    def __init__(self, sub_bucket_bits: int = 8):
+        """
+        HDR-style histogram of latencies in microseconds. Buckets are log-linear: values below
+        2 ** sub_bucket_bits are counted exactly, and every larger value to within
+        1 / 2 ** (sub_bucket_bits - 1) of itself (0.8% by default), so memory stays constant
+        however many values are recorded and however long the tail. Not thread-safe.
+
+        sub_bucket_bits: Resolution of each power-of-two range of values.
+        """
+        self._bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self._sum = 0.0
+        self._sum_squares = 0.0
+
+    def _index(self, value: int) -> int:
+        if value < 1 << self._bits:
+            return value
+        shift = value.bit_length() - self._bits
+        return (1 << self._bits) + (shift - 1) * self._half + (value >> shift) - self._half
+
+    def _highest_equivalent(self, index: int) -> int:
+        # Largest value counted in bucket index, which is what percentiles report, as HdrHistogram does
+        if index < 1 << self._bits:
+            return index
+        shift, offset = divmod(index - (1 << self._bits), self._half)
+        shift += 1
+        return ((offset + self._half) << shift) + (1 << shift) - 1
+
+    def record(self, value: int) -> None:
+        value = max(int(value), 0)
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.min = value if not self.total else min(self.min, value)
+        self.max = max(self.max, value)
+        self.total += 1
+        self._sum += value
+        self._sum_squares += float(value) * value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add every value recorded in other, which must have the same sub_bucket_bits."""
+        if not other.total:
+            return
+        for index, number in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + number
+        self.min = other.min if not self.total else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.total += other.total
+        self._sum += other._sum
+        self._sum_squares += other._sum_squares
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total if self.total else 0.0
+
+    @property
+    def stdev(self) -> float:
+        if not self.total:
+            return 0.0
+        return math.sqrt(max(self._sum_squares / self.total - self.mean ** 2, 0.0))
+
+    def percentiles(self, levels: List[float]) -> List[Tuple[float, int, int]]:
+        """
+        Return (percentile, value, count of values at or below it) for each of levels, which
+        must be ascending, in one pass over the buckets.
+        """
+        rows = []
+        if not self.total:
+            return [(level, 0, 0) for level in levels]
+        buckets = sorted(self.counts.items())
+        position = cumulative = 0
+        for level in levels:
+            target = max(1, math.ceil(level / 100.0 * self.total))
+            while cumulative < target:
+                cumulative += buckets[position][1]
+                position += 1
+            rows.append((level, min(self._highest_equivalent(buckets[position - 1][0]), self.max), cumulative))
+        return rows
+
+    def percentile(self, level: float) -> int:
+        return self.percentiles([level])[0][1]
+
+    def distribution_levels(self, ticks_per_half_distance: int = 5) -> List[float]:
+        """Percentile levels of an HdrHistogram distribution: closer together the nearer they get to 100."""
+        levels = []
+        step = 0
+        while True:
+            level = 100.0 * (1 - 0.5 ** (step / ticks_per_half_distance))
+            # Stop once the next level would cover every value recorded
+            if (1 - level / 100.0) * self.total < 1:
+                break
+            levels.append(level)
+            step += 1
+        levels.append(100.0)
+        return levels
+
+    def write_hgrm(self, handle, unit_scale: float = 1000.0) -> None:
+        """
+        Write the percentile distribution in HdrHistogram's text format, which its plotting tools
+        read. Values are divided by unit_scale: milliseconds by default.
+        """
+        handle.write(f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}\n\n")
+        for level, value, cumulative in self.percentiles(self.distribution_levels()):
+            fraction = level / 100.0
+            if fraction < 1.0:
+                handle.write(f"{value / unit_scale:12.3f} {fraction:2.12f} {cumulative:10d} {1 / (1 - fraction):14.2f}\n")
+            else:
+                handle.write(f"{value / unit_scale:12.3f} {fraction:2.12f} {cumulative:10d}\n")
+        # Power-of-two ranges needed to cover the largest value, as HdrHistogram counts its buckets
+        buckets = max(self.max.bit_length() - self._bits + 1, 1)
+        handle.write(f"#[Mean    = {self.mean / unit_scale:12.3f}, StdDeviation   = {self.stdev / unit_scale:12.3f}]\n")
+        handle.write(f"#[Max     = {self.max / unit_scale:12.3f}, Total count    = {self.total:12d}]\n")
+        handle.write(f"#[Buckets = {buckets:12d}, SubBuckets     = {1 << self._bits:12d}]\n")
+
+
+class ClientLoad:
+    def __init__(self, name: str):
+        """
+        Everything recorded about one client during a run: latency histograms (the whole run and the
+        current interval), call counters and the counts of the events its observer sees.
+        Thread-safe; record and observe are called from every load thread.
+        """
+        self.name = name
+        self.call: Callable[[GetAddressInfoInput], object] = lambda item: None
+        self.client = None
+        self.histogram = LatencyHistogram()
+        self._interval = LatencyHistogram()
+        self.calls = 0
+        self.failed = 0
+        self.late = 0
+        self.max_lag = 0.0
+        self.events: Counter = Counter()
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def observe(self, event: CallEvent) -> None:
+        # Observer passed to the client: counts failovers by reason, backup answers, retries and outcomes
+        with self._lock:
+            if event.kind == FAILOVER:
+                self.events["failover"] += 1
+                self.events[f"failover:{event.reason}"] += 1
+            elif event.kind == ATTEMPT_END:
+                self.events["attempts"] += 1
+                if event.role == "backup" and event.outcome == OK:
+                    self.events["answered_by_backup"] += 1
+            elif event.kind == RETRY:
+                self.events["retry"] += 1
+            elif event.kind == CALL_END:
+                self.events[f"outcome:{event.outcome}"] += 1
+
+    def record(self, latency: float, failed: bool, lag: float = 0.0) -> None:
+        micros = int(latency * 1e6)
+        with self._lock:
+            self.histogram.record(micros)
+            self._interval.record(micros)
+            self.calls += 1
+            self.failed += failed
+            if lag > LATE_AFTER:
+                self.late += 1
+                self.max_lag = max(self.max_lag, lag)
+
+    def take_interval(self) -> Tuple[LatencyHistogram, int, Counter]:
+        """Return the current interval's histogram, and the totals so far of failed calls and events."""
+        with self._lock:
+            interval, self._interval = self._interval, LatencyHistogram()
+            return interval, self.failed, Counter(self.events)
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+
+def _count_connections(event: str, args: tuple) -> None:
+    # Audit hook: every socket a load thread connects is charged to the client it is calling. This sees
+    # reconnects after the server closed a pooled connection, which urllib3's own counters miss, and
+    # suds' per-call urllib connections alike
+    if event == "socket.connect":
+        load = getattr(_current, "load", None)
+        if load is not None:
+            load.count_connection()
+
+
+def open_fds() -> Optional[int]:
+    """Open file descriptors of this process, where /proc tells (Linux), else None."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def load_inputs(path: Optional[str], limit: int, license_key: str) -> List[GetAddressInfoInput]:
+    """Read up to limit addresses from a CSV or JSONL file, or return ADDRESS alone without one."""
+    if not path:
+        return [GetAddressInfoInput(*ADDRESS, LicenseKey=license_key)]
+    from address_validation_international.avi_bulk import read_inputs
+    file_format = "jsonl" if path.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+    with open(path, "r", encoding="utf-8-sig", newline="") as handle:
+        inputs = []
+        for item in read_inputs(handle, file_format, license_key, True):
+            inputs.append(item)
+            if len(inputs) >= limit:
+                break
+    if not inputs:
+        raise SystemExit(f"No addresses in {path}")
+    return inputs
+
+
+def _fields(item: GetAddressInfoInput) -> tuple:
+    return (item.Address1, item.Address2, item.Address3, item.Address4, item.Address5, item.Locality,
+            item.AdministrativeArea, item.PostalCode, item.Country, item.OutputLanguage)
+
+
+def build_client(load: ClientLoad, args: argparse.Namespace, base_url: str, backup_base_url: str, cache_dir: str) -> None:
+    """Create load's client, pointed at base_url and backup_base_url, and the call the load threads make."""
+    is_live = not args.trial
+    retry = RetryPolicy(max_retries=args.retries) if args.retries else None
+    if load.name == "soap":
+        wsdl = f"{base_url}{SOAP_PATH}?wsdl"
+        backup_wsdl = f"{backup_base_url}{SOAP_PATH}?wsdl"
+        # The suds client takes its license key and mode once, so the inputs' own keys are not used
+        load.client = GetAddressInfoSoap(args.license_key, is_live, primary_wsdl=wsdl, backup_wsdl=wsdl if args.trial else backup_wsdl,
+                                         cache_location=cache_dir, observers=[load.observe], retry=retry,
+                                         pool_size=args.concurrency, keep_alive=not args.no_keep_alive)
+        load.call = lambda item: load.client.get_address_info(*_fields(item))
+        return
+    if load.name == "rest":
+        path, client_type = f"{REST_PATH}?", AVIRestClient
+    else:
+        path, client_type = SOAP_PATH, AVISoapLiteClient
+    load.client = client_type(
+        pool_size=args.concurrency, keep_alive=not args.no_keep_alive, is_live=is_live,
+        primary_url=base_url + path, backup_url=backup_base_url + path, trial_url=base_url + path,
+        observers=[load.observe], retry=retry,
+    )
+    load.call = lambda item: load.client.get_address_info(*_fields(item), item.LicenseKey, is_live)
+
+
+def _timed_call(load: ClientLoad, item: GetAddressInfoInput) -> bool:
+    # True if the call raised; a response with an Error is counted by the observer's outcomes
+    _current.load = load
+    try:
+        load.call(item)
+        return False
+    except Exception:
+        return True
+
+
+def closed_loop(load: ClientLoad, inputs: List[GetAddressInfoInput], concurrency: int, stop_at: float) -> None:
+    """Call back to back from concurrency threads until stop_at (perf_counter time)."""
+    sequence = count()
+
+    def worker() -> None:
+        while time.perf_counter() < stop_at:
+            item = inputs[next(sequence) % len(inputs)]
+            started = time.perf_counter()
+            failed = _timed_call(load, item)
+            load.record(time.perf_counter() - started, failed)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def open_loop(load: ClientLoad, inputs: List[GetAddressInfoInput], qps: float, concurrency: int,
+              stop_at: float) -> None:
+    """Start qps calls per second, on a fixed schedule, on up to concurrency threads until stop_at."""
+    # A call's latency is counted from when it was due, not from when a free thread started it,
+    # so time spent waiting behind a slow service is measured instead of omitted
+    slots = threading.BoundedSemaphore(concurrency)
+
+    def run(item: GetAddressInfoInput, due: float) -> None:
+        try:
+            started = time.perf_counter()
+            failed = _timed_call(load, item)
+            load.record(time.perf_counter() - due, failed, lag=started - due)
+        finally:
+            slots.release()
+
+    interval = 1.0 / qps
+    due = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for number in count():
+            if due >= stop_at:
+                break
+            wait = due - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            slots.acquire()
+            executor.submit(run, inputs[number % len(inputs)], due)
+            due += interval
+
+
+def _ms(micros: float) -> float:
+    return micros / 1000.0
+
+
+def run(args: argparse.Namespace) -> int:
+    inputs = load_inputs(args.input, args.input_rows, args.license_key)
+    loads = [ClientLoad(name) for name in dict.fromkeys(args.client or ("rest",))]
+
+    with ExitStack() as stack:
+        stand_ins: List[StandInServer] = []
+        if args.base_url:
+            base_url = args.base_url.rstrip("/")
+            backup_base_url = (args.backup_base_url or args.base_url).rstrip("/")
+        else:
+            primary = stack.enter_context(StandInServer(config=StandInConfig(
+                latency_ms=args.latency_ms, distribution=args.distribution, error_rate=args.error_rate,
+                http_error_rate=args.http_error_rate, drop_rate=args.drop_rate, seed=args.seed,
+            )))
+            backup = stack.enter_context(StandInServer(config=StandInConfig(latency_ms=args.latency_ms,
+                                                                            distribution=args.distribution)))
+            stand_ins = [primary, backup]
+            base_url, backup_base_url = primary.base_url, backup.base_url
+        cache_dir = stack.enter_context(tempfile.TemporaryDirectory())
+
+        sys.addaudithook(_count_connections)
+        for load in loads:
+            build_client(load, args, base_url, backup_base_url, cache_dir)
+            # One call first, so connections and the WSDL are in place before the clock starts
+            _timed_call(load, inputs[0])
+            load.events.clear()
+            load.connections = 0
+        for server in stand_ins:
+            server.reset_stats()
+
+        mode = f"{args.qps:g} calls/s" if args.qps else "back to back"
+        print(f"{', '.join(load.name for load in loads)}: {mode}, {args.concurrency} threads each, "
+              f"{args.duration:g}s against {base_url}\n")
+        print(f"{'time':>6}  {'client':<9} {'calls':>8} {'calls/s':>9} {'failed':>7} {'failovers':>9} "
+              f"{'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'conns':>6} {'fds':>5} {'threads':>7}")
+
+        started = time.perf_counter()
+        stop_at = started + args.duration
+        drivers = []
+        for load in loads:
+            if args.qps:
+                target, driver_args = open_loop, (load, inputs, args.qps, args.concurrency, stop_at)
+            else:
+                target, driver_args = closed_loop, (load, inputs, args.concurrency, stop_at)
+            driver = threading.Thread(target=target, args=driver_args, daemon=True)
+            driver.start()
+            drivers.append(driver)
+
+        intervals = []
+        last: Dict[str, Tuple[int, int, int]] = {load.name: (0, 0, 0) for load in loads}
+        first_fds = last_fds = None
+        reported = started
+        next_report = started + args.interval
+        while any(driver.is_alive() for driver in drivers):
+            for driver in drivers:
+                driver.join(timeout=max(0.0, next_report - time.perf_counter()))
+            now = time.perf_counter()
+            if now < next_report and any(driver.is_alive() for driver in drivers):
+                continue
+            fds, threads = open_fds(), threading.active_count()
+            if first_fds is None:
+                first_fds = fds
+            last_fds = fds
+            for load in loads:
+                interval, failed, events = load.take_interval()
+                previous_failed, previous_failovers, previous_opened = last[load.name]
+                opened = load.connections
+                row = {
+                    "time": round(now - started, 3),
+                    "client": load.name,
+                    "calls": interval.total,
+                    "calls_per_second": interval.total / max(now - reported, 1e-9),
+                    "failed": failed - previous_failed,
+                    "failovers": events["failover"] - previous_failovers,
+                    "p50_ms": _ms(interval.percentile(50)),
+                    "p99_ms": _ms(interval.percentile(99)),
+                    "max_ms": _ms(interval.max),
+                    "connections_opened": opened - previous_opened,
+                    "open_fds": fds,
+                    "threads": threads,
+                }
+                last[load.name] = (failed, events["failover"], opened)
+                intervals.append(row)
+                print(f"{row['time']:5.1f}s  {load.name:<9} {row['calls']:8d} {row['calls_per_second']:9.1f} "
+                      f"{row['failed']:7d} {row['failovers']:9d} {row['p50_ms']:8.2f} {row['p99_ms']:8.2f} "
+                      f"{row['max_ms']:8.2f} {row['connections_opened']:6d} {fds if fds is not None else '-':>5} {threads:7d}")
+            reported = now
+            next_report += args.interval
+        elapsed = time.perf_counter() - started
+
+        results = {}
+        for load in loads:
+            results[load.name] = summarize(load, elapsed, args)
+        server_stats = [server.stats() for server in stand_ins]
+        for load in loads:
+            if hasattr(load.client, "close"):
+                load.client.close()
+
+    if first_fds is not None and last_fds is not None:
+        print(f"\nopen fds: {first_fds} after the first interval, {last_fds} at the end")
+    if server_stats:
+        connections = sum(stats.connections for stats in server_stats)
+        requests = sum(stats.requests for stats in server_stats)
+        reuse = max(1 - connections / requests, 0.0) if requests else 0.0
+        print(f"stand-ins: {connections} connections for {requests} requests ({reuse:.2%} reused)")
+        for role, stats in zip(("primary", "backup"), server_stats):
+            print(f"  {role}: {stats}")
+
+    if args.hgrm:
+        for load in loads:
+            with open(f"{args.hgrm}-{load.name}.hgrm", "w", encoding="utf-8") as handle:
+                load.histogram.write_hgrm(handle)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({
+                "clients": [load.name for load in loads], "qps": args.qps, "concurrency": args.concurrency,
+                "duration": args.duration, "base_url": base_url, "results": results, "intervals": intervals,
+                "open_fds": {"first_interval": first_fds, "end": last_fds},
+                "stand_ins": [vars(stats) for stats in server_stats],
+            }, handle, indent=2)
+
+    status = 0
+    if args.max_p99_ms is not None:
+        slow = [name for name, result in results.items() if result["percentiles_ms"]["99"] > args.max_p99_ms]
+        if slow:
+            print(f"\np99 above {args.max_p99_ms:g} ms: {', '.join(slow)}")
+            status = 1
+    if args.max_fd_growth is not None and first_fds is not None and last_fds is not None:
+        if last_fds - first_fds > args.max_fd_growth:
+            print(f"\nopen fds grew by {last_fds - first_fds}, above {args.max_fd_growth}: possible connection leak")
+            status = 1
+    return status
+
+
+def summarize(load: ClientLoad, elapsed: float, args: argparse.Namespace) -> dict:
+    """Print and return one client's totals: latency percentiles, failover analysis and connection reuse."""
+    histogram, events = load.histogram, load.events
+    calls = histogram.total
+    percentiles = {f"{level:g}": _ms(value) for level, value, _ in histogram.percentiles(list(SUMMARY_PERCENTILES))}
+    outcomes = {name.split(":", 1)[1]: number for name, number in events.items() if name.startswith("outcome:")}
+    reasons = {name.split(":", 1)[1]: number for name, number in events.items() if name.startswith("failover:")}
+    opened = load.connections
+    attempts = events["attempts"]
+    result = {
+        "calls": calls,
+        "calls_per_second": calls / elapsed if elapsed else 0.0,
+        "failed": load.failed,
+        "outcomes": outcomes,
+        "failovers": events["failover"],
+        "failover_reasons": reasons,
+        "answered_by_backup": events["answered_by_backup"],
+        "retries": events["retry"],
+        "attempts": attempts,
+        "connections_opened": opened,
+        "late_calls": load.late,
+        "max_lag_ms": load.max_lag * 1000.0,
+        "mean_ms": _ms(histogram.mean),
+        "percentiles_ms": percentiles,
+    }
+
+    print(f"\n{load.name}: {calls} calls in {elapsed:.1f}s ({result['calls_per_second']:.1f}/s), "
+          f"{load.failed} failed")
+    print(f"  outcomes: {', '.join(f'{name}={number}' for name, number in sorted(outcomes.items())) or '-'}")
+    failover_rate = events["failover"] / calls if calls else 0.0
+    print(f"  failovers: {events['failover']} ({failover_rate:.2%} of calls)"
+          + (f": {', '.join(f'{name}={number}' for name, number in sorted(reasons.items()))}" if reasons else ""))
+    print(f"  answered by backup: {events['answered_by_backup']}, retries: {events['retry']}")
+    # Connections that carried no GetAddressInfo call (suds' WSDL downloads) can outnumber the attempts
+    reuse = max(1 - opened / attempts, 0.0) if attempts else 0.0
+    print(f"  connections: {opened} opened for {attempts} attempts ({reuse:.2%} reused)")
+    if args.qps:
+        print(f"  behind schedule: {load.late} calls started over {LATE_AFTER * 1000:g} ms late, "
+              f"max {load.max_lag * 1000.0:.1f} ms")
+    print(f"  latency ms: mean {_ms(histogram.mean):.2f}, "
+          + ", ".join(f"p{level}={value:.2f}" for level, value in percentiles.items() if level != "100")
+          + f", max {percentiles['100']:.2f}")
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--client", choices=CLIENTS, action="append",
+                        help="Repeat to load several clients at once; default rest.")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to run (default 60).")
+    parser.add_argument("--qps", type=float, help="Calls started per second, per client. Default: back to back.")
+    parser.add_argument("--concurrency", type=int, default=16,
+                        help="Threads (and pooled connections) per client (default 16).")
+    parser.add_argument("--interval", type=float, default=10.0, help="Seconds between report rows (default 10).")
+    parser.add_argument("--base-url", help="Scheme and host of the endpoints, e.g. http://127.0.0.1:8080. "
+                                           "Default: start local stand-ins.")
+    parser.add_argument("--backup-base-url", help="Scheme and host of the backup endpoints. Defaults to --base-url.")
+    parser.add_argument("--trial", action="store_true", help="Call the trial endpoint (--base-url) only.")
+    parser.add_argument("--license-key", default=os.environ.get("AVI_LICENSE_KEY", "KEY"),
+                        help="License key for inputs without one. Defaults to $AVI_LICENSE_KEY.")
+    parser.add_argument("--input", help="CSV or JSONL file of addresses (avi-bulk's format) to cycle through.")
+    parser.add_argument("--input-rows", type=int, default=10000, help="Addresses read from --input (default 10000).")
+    parser.add_argument("--retries", type=int, default=0, help="RetryPolicy max_retries for the clients (default 0).")
+    parser.add_argument("--no-keep-alive", action="store_true", help="Close every connection after its call.")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Local stand-ins' median latency (default 20).")
+    parser.add_argument("--distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Local primary's fraction of TypeCode 3 responses.")
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="Local primary's fraction of HTTP 500s.")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Local primary's fraction of dropped connections.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--hgrm", metavar="PREFIX",
+                        help="Write each client's latency distribution to PREFIX-<client>.hgrm (HdrHistogram format).")
+    parser.add_argument("--json", help="Also write the results and per-interval rows to this file.")
+    parser.add_argument("--max-p99-ms", type=float, help="Exit with status 1 if any client's p99 is above this.")
+    parser.add_argument("--max-fd-growth", type=int,
+                        help="Exit with status 1 if open file descriptors grew by more than this after the first interval.")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.qps is not None and args.qps <= 0:
+        raise SystemExit("--qps must be positive")
+    sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
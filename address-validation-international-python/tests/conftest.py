@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# The stand-in service lives with the benchmarks, which are not part of the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from avi_stand_in import StandInConfig, StandInServer  # noqa: E402
+
+
+@pytest.fixture
+def stand_in():
+    """A stand-in AVI service answering in about a millisecond."""
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1, seed=1)) as server:
+        yield server
@@ -0,0 +1,73 @@
+import csv
+import json
+
+import pytest
+
+from address_validation_international.avi_bulk import main
+from address_validation_international.avi_retry import Deadline
+
+
+def test_text_timeout_seconds_column(stand_in, tmp_path):
+    source = tmp_path / "in.csv"
+    source.write_text(
+        "Address1,Locality,AdministrativeArea,PostalCode,Country,TimeoutSeconds\n"
+        "27 E Cota St,Santa Barbara,CA,93101,USA,5\n"
+        "1 Main St,Santa Barbara,CA,93101,USA,\n"
+    )
+    output = tmp_path / "out.csv"
+
+    assert main([str(source), str(output), "--license-key", "key",
+                 "--primary-url", stand_in.rest_url, "--backup-url", stand_in.rest_url]) == 0
+
+    with open(output, newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["Status"] for row in rows] == ["Validated", "Validated"]
+    assert not any(row["Exception"] for row in rows)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_non_numeric_timeout_seconds_fails_only_its_row(stand_in, tmp_path, processes):
+    good = "27 E Cota St,93101,USA,5\n"
+    source = tmp_path / "in.csv"
+    source.write_text("Address1,PostalCode,Country,TimeoutSeconds\n" + good * 5 + "1 Main St,93101,USA,soon\n" + good * 5)
+    output = tmp_path / "out.csv"
+
+    assert main([str(source), str(output), "--license-key", "key", "--processes", str(processes), "--chunk-size", "3",
+                 "--primary-url", stand_in.rest_url, "--backup-url", stand_in.rest_url]) == 0
+
+    with open(output, newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["Row"] for row in rows] == [str(row) for row in range(1, 12)]
+    assert [row["Status"] for row in rows] == ["Validated"] * 5 + [""] + ["Validated"] * 5
+    assert "TimeoutSeconds 'soon'" in rows[5]["Exception"]
+    with open(str(output) + ".checkpoint") as handle:
+        assert json.load(handle)["rows_done"] == 11
+
+
+def test_deadline_rejects_non_numeric_budget():
+    with pytest.raises(ValueError):
+        Deadline("5")
+    with pytest.raises(ValueError):
+        Deadline(True)
+    assert Deadline(None).remaining() is None
+
+
+def test_unreadable_jsonl_lines_fail_only_their_rows(stand_in, tmp_path):
+    good = '{"Address1": "27 E Cota St", "PostalCode": "93101", "Country": "USA"}\n'
+    source = tmp_path / "in.jsonl"
+    source.write_text(good + '{"Address1": "1 Main St",\n' + "[1, 2]\n" + good)
+    output = tmp_path / "out.jsonl"
+
+    assert main([str(source), str(output), "--license-key", "key",
+                 "--primary-url", stand_in.rest_url, "--backup-url", stand_in.rest_url]) == 0
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["Status"] for row in rows] == ["Validated", None, None, "Validated"]
+    assert rows[1]["Exception"].startswith("ValueError: Invalid JSON on line 2")
+    assert rows[2]["Exception"] == "ValueError: Line 3 is not a JSON object"
+
+
+def test_checkpoint_every_must_be_positive(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), "--checkpoint-every", "0"])
+    assert "--checkpoint-every" in capsys.readouterr().err
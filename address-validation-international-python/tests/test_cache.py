@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from address_validation_international import AVIRestClient, ResponseCache, SQLiteCacheBackend
+from address_validation_international.avi_retry import RetryableError
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+VARIANT = ("27  e cota st", "", "", "", "", "SANTA BARBARA", "ca", "93101", "United States", "english", "key")
+
+
+def _client(server, cache):
+    return AVIRestClient(primary_url=server.rest_url, backup_url=server.rest_url, cache=cache)
+
+
+def test_repeated_and_canonical_variant_addresses_are_answered_from_cache(stand_in):
+    cache = ResponseCache(maxsize=10)
+    with _client(stand_in, cache) as client:
+        first = client.get_address_info(*ADDRESS)
+        again = client.get_address_info(*ADDRESS)
+        variant = client.get_address_info(*VARIANT)
+
+    assert first.AddressInfo.Status == "Validated"
+    assert again == first and variant == first
+    assert stand_in.stats().requests == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert str(stats) == "CacheStats: hits=2, misses=1, evictions=0, expirations=0, backend_hits=0"
+
+
+def test_error_payloads_are_not_cached():
+    cache = ResponseCache(maxsize=10)
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1, error_rate=1)) as server:
+        with _client(server, cache) as client:
+            with pytest.raises(RetryableError):
+                client.get_address_info(*ADDRESS)
+            requests = server.stats().requests
+            with pytest.raises(RetryableError):
+                client.get_address_info(*ADDRESS)
+
+        assert server.stats().requests > requests
+    assert len(cache) == 0
+
+
+def test_sqlite_tier_is_shared_between_caches(stand_in, tmp_path):
+    path = str(tmp_path / "c.db")
+    writer = SQLiteCacheBackend(path)
+    with _client(stand_in, ResponseCache(backend=writer)) as client:
+        first = client.get_address_info(*ADDRESS)
+    writer.close()
+
+    reader = SQLiteCacheBackend(path)
+    cache = ResponseCache(backend=reader)
+    with _client(stand_in, cache) as client:
+        assert client.get_address_info(*ADDRESS) == first
+    reader.close()
+
+    assert stand_in.stats().requests == 1
+    assert cache.stats().backend_hits == 1
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "c.db"))
+    cache = ResponseCache(maxsize=10, ttl=0.05, backend=backend)
+    cache.set("key", {"AddressInfo": {"Status": "Validated"}})
+    assert cache.get("key") is not None
+
+    time.sleep(0.1)
+    assert cache.get("key") is None
+    assert backend.purge_expired() == 1
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 1, 1)
+    backend.close()
+
+
+def test_lru_evicts_oldest_entry():
+    cache = ResponseCache(maxsize=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"key": key})
+
+    assert cache.get("a") is None
+    assert cache.get("c") == {"key": "c"}
+    assert len(cache) == 2
+    assert cache.stats().evictions == 1
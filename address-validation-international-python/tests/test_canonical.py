@@ -0,0 +1,57 @@
+from address_validation_international import AVIRestClient, canonical_key
+from address_validation_international.avi_canonical import batch_key
+from address_validation_international.avi_response import GetAddressInfoInput
+
+
+def _input(address1="27 E Cota St", country="USA", **fields):
+    return GetAddressInfoInput(Address1=address1, Locality="Santa Barbara", AdministrativeArea="CA",
+                               PostalCode="93101", Country=country, LicenseKey="key", **fields)
+
+
+def test_canonical_key_ignores_case_spacing_and_country_spelling():
+    key = canonical_key(_input())
+    assert canonical_key(_input("  27 e   COTA st ")) == key
+    assert canonical_key(_input(country="United States")) == key
+    assert canonical_key(_input(country="us")) == key
+    assert canonical_key(_input(OutputLanguage="")) == key
+    assert canonical_key(_input("28 E Cota St")) != key
+    assert canonical_key(_input(country="Canada")) != key
+
+
+def test_canonical_key_matches_unicode_forms():
+    composed = GetAddressInfoInput(Address1="Rue de l'\u00c9glise", Country="FR")
+    decomposed = GetAddressInfoInput(Address1="rue de l'E\u0301glise", Country="France")
+    assert canonical_key(composed) == canonical_key(decomposed)
+
+
+def test_batch_key_separates_license_keys_and_modes():
+    other_key = GetAddressInfoInput(Address1="27 E Cota St", Country="USA", LicenseKey="other")
+    trial = GetAddressInfoInput(Address1="27 E Cota St", Country="USA", LicenseKey="key", IsLive=False)
+    live = GetAddressInfoInput(Address1="27 E Cota St", Country="USA", LicenseKey="key")
+    assert len({batch_key(live), batch_key(other_key), batch_key(trial)}) == 3
+
+
+def test_validate_many_calls_once_per_distinct_address(stand_in):
+    inputs = [_input(), _input("27 e cota st"), _input("1 Main St"), _input(country="United States"),
+              _input("1  MAIN ST"), _input("2 Main St")]
+    with AVIRestClient(primary_url=stand_in.rest_url, backup_url=stand_in.rest_url) as client:
+        results = list(client.validate_many(inputs, max_workers=2))
+        stats = client.dedup_stats()
+
+    assert [result.index for result in results] == list(range(6))
+    assert all(result.exception is None for result in results)
+    assert results[1].response is results[0].response
+    assert results[3].response is results[0].response
+    assert results[4].response is results[2].response
+    assert stand_in.stats().requests == 3
+    assert (stats.rows, stats.duplicates) == (6, 3)
+    assert str(stats) == "DedupStats: rows=6, duplicates=3, ratio=0.500"
+
+
+def test_validate_many_without_dedup_calls_for_every_input(stand_in):
+    inputs = [_input(), _input("27 e cota st"), _input()]
+    with AVIRestClient(primary_url=stand_in.rest_url, backup_url=stand_in.rest_url) as client:
+        results = list(client.validate_many(inputs, max_workers=2, dedup=False))
+
+    assert all(result.response.AddressInfo.Status == "Validated" for result in results)
+    assert stand_in.stats().requests == 3
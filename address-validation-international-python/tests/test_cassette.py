@@ -0,0 +1,82 @@
+import csv
+import time
+
+import pytest
+
+from address_validation_international import AVIRestClient, CassetteMiss, CassettePlayer, CassetteRecorder
+from address_validation_international.avi_bulk import main
+from address_validation_international.avi_cassette import ReplayLatency
+from address_validation_international.avi_retry import DeadlineExceeded
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+OTHER = ("1 Main St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """A cassette holding the answer to ADDRESS, recorded from a stand-in that is stopped afterwards."""
+    path = str(tmp_path / "calls.avic")
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1, seed=1)) as server:
+        with CassetteRecorder(path) as recorder:
+            with AVIRestClient(primary_url=server.rest_url, backup_url=server.rest_url, cassette=recorder) as client:
+                response = client.get_address_info(*ADDRESS)
+                client.get_address_info(*ADDRESS)
+            assert len(recorder) == 1
+        url = server.rest_url
+    return path, url, response
+
+
+def test_replay_answers_without_the_service(recording):
+    path, url, recorded = recording
+    with CassettePlayer(path) as player:
+        with AVIRestClient(primary_url=url, backup_url=url, cassette=player) as client:
+            assert client.get_address_info(*ADDRESS) == recorded
+            # A canonical variant of a recorded address is a hit too
+            assert client.get_address_info("27 e cota st", *ADDRESS[1:8], "United States", *ADDRESS[9:]) == recorded
+            with pytest.raises(CassetteMiss):
+                client.get_address_info(*OTHER)
+        assert str(player.stats()) == "CassetteStats: entries=1, hits=2, misses=1"
+
+
+def test_replay_latency_is_added_and_bounded_by_the_deadline(recording):
+    path, url, _ = recording
+    with CassettePlayer(path, ReplayLatency(latency_ms=100)) as player:
+        with AVIRestClient(primary_url=url, backup_url=url, cassette=player) as client:
+            started = time.monotonic()
+            client.get_address_info(*ADDRESS)
+            assert time.monotonic() - started >= 0.1
+            with pytest.raises(DeadlineExceeded):
+                client.get_address_info(*ADDRESS, True, 0.05)
+
+
+def test_transient_errors_are_not_recorded(tmp_path):
+    with CassetteRecorder(str(tmp_path / "calls.avic")) as recorder:
+        assert not recorder.record("key", {"Error": {"TypeCode": "3"}})
+        assert recorder.record("key", {"Error": {"TypeCode": "1"}})
+        assert not recorder.record("key", {"AddressInfo": {}})
+
+
+def test_unfinished_recording_cannot_be_replayed(tmp_path):
+    recorder = CassetteRecorder(str(tmp_path / "calls.avic"))
+    recorder.record("key", {"AddressInfo": {}})
+    with pytest.raises(ValueError):
+        CassettePlayer(recorder.path + ".tmp")
+    recorder.close()
+
+
+def test_bulk_replays_a_recorded_run(stand_in, tmp_path):
+    source = tmp_path / "in.csv"
+    source.write_text("Address1,PostalCode,Country\n27 E Cota St,93101,USA\n1 Main St,93101,USA\n")
+    cassette = str(tmp_path / "calls.avic")
+    endpoints = ["--license-key", "key", "--primary-url", stand_in.rest_url, "--backup-url", stand_in.rest_url]
+
+    assert main([str(source), str(tmp_path / "recorded.csv"), "--record-cassette", cassette, *endpoints]) == 0
+    requests = stand_in.stats().requests
+    assert main([str(source), str(tmp_path / "replayed.csv"), "--replay-cassette", cassette,
+                 "--processes", "2", "--chunk-size", "1", *endpoints]) == 0
+
+    with open(tmp_path / "recorded.csv", newline="") as recorded, open(tmp_path / "replayed.csv", newline="") as replayed:
+        assert list(csv.DictReader(replayed)) == list(csv.DictReader(recorded))
+    assert stand_in.stats().requests == requests
@@ -0,0 +1,24 @@
+import pandas as pd
+import pyarrow as pa
+
+from address_validation_international import AVIRestClient, validate_frame
+
+
+def test_float_postal_codes_are_sent_without_a_fraction(stand_in):
+    # A numeric column with a gap is read by pandas as float64; the stand-in echoes the PostalCode it received
+    df = pd.DataFrame({
+        "Address1": ["27 E Cota St", "1 Main St", "2 Main St"],
+        "Locality": ["Santa Barbara"] * 3,
+        "AdministrativeArea": ["CA"] * 3,
+        "PostalCode": [93101.0, None, 93101.5],
+        "Country": ["USA"] * 3,
+    })
+    client = AVIRestClient(primary_url=stand_in.rest_url, backup_url=stand_in.rest_url)
+    try:
+        result = validate_frame(df, "key", client=client)
+        table = validate_frame(pa.Table.from_pandas(df), "key", client=client)
+    finally:
+        client.close()
+
+    assert list(result["PostalCode"]) == ["93101", "", "93101.5"]
+    assert table.column("PostalCode").to_pylist() == ["93101", "", "93101.5"]
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from address_validation_international import AVIRestClient, EndpointHealth
+from address_validation_international.avi_health import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+@pytest.fixture
+def failing_primary():
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1, http_error_rate=1)) as server:
+        yield server
+
+
+def test_open_circuit_sends_calls_straight_to_backup(failing_primary, stand_in):
+    health = EndpointHealth(failure_threshold=2, recovery_timeout=60)
+    transitions = []
+    health.add_listener(lambda endpoint, state: transitions.append((endpoint, state)))
+    primary = EndpointHealth.endpoint_for(failing_primary.rest_url)
+
+    with AVIRestClient(primary_url=failing_primary.rest_url, backup_url=stand_in.rest_url,
+                       health=health) as client:
+        for _ in range(2):
+            assert client.get_address_info(*ADDRESS).AddressInfo.Status == "Validated"
+        assert health.snapshot()[primary].state == OPEN
+        failed = failing_primary.stats().requests
+
+        for _ in range(5):
+            assert client.get_address_info(*ADDRESS).AddressInfo.Status == "Validated"
+
+    assert failing_primary.stats().requests == failed
+    assert stand_in.stats().requests == 7
+    assert transitions == [(primary, OPEN)]
+
+
+def test_open_circuit_probes_the_primary_after_recovery_timeout(failing_primary, stand_in):
+    health = EndpointHealth(failure_threshold=1, recovery_timeout=0.1)
+    primary = EndpointHealth.endpoint_for(failing_primary.rest_url)
+
+    with AVIRestClient(primary_url=failing_primary.rest_url, backup_url=stand_in.rest_url,
+                       health=health) as client:
+        client.get_address_info(*ADDRESS)
+        failed = failing_primary.stats().requests
+        time.sleep(0.15)
+        assert health.snapshot()[primary].state == HALF_OPEN
+
+        client.get_address_info(*ADDRESS)
+
+    # The probe reached the primary, failed, and opened the circuit again
+    assert failing_primary.stats().requests > failed
+    assert health.snapshot()[primary].state == OPEN
+
+
+def test_breaker_closes_after_successful_probe():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    assert breaker.record_success() == CLOSED
+    status = breaker.status("host")
+    assert (status.state, status.total_successes, status.total_failures) == (CLOSED, 1, 2)
@@ -0,0 +1,25 @@
+from address_validation_international import AVIRestClient
+from address_validation_international.avi_hedging import HedgePolicy
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+def test_percentile_only_hedging_turns_on():
+    # No fixed delay: hedging starts once min_samples primary latencies have been observed
+    slow = StandInConfig(latency_ms=1, tail_rate=0.3, tail_ms=300, seed=3)
+    policy = HedgePolicy(delay=None, percentile=50, min_samples=5, max_hedge_ratio=1.0, burst=100)
+    with StandInServer(host="127.0.0.1", port=0, config=slow) as primary, \
+            StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1)) as backup:
+        client = AVIRestClient(primary_url=primary.rest_url, backup_url=backup.rest_url, hedging=policy)
+        try:
+            for _ in range(30):
+                assert client.get_address_info(*ADDRESS).AddressInfo.Status == "Validated"
+            stats = client.hedge_stats()
+        finally:
+            client.close()
+
+    assert stats.calls == 30
+    assert stats.hedges_sent > 0
+    assert stats.hedges_won > 0
@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from address_validation_international import AdaptiveLimiter, AVIRestClient, LimiterPolicy, LimiterTimeout
+from address_validation_international.avi_limiter import OVERLOAD
+from address_validation_international.avi_retry import RetryableError
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+def _client(server, limiter):
+    return AVIRestClient(primary_url=server.rest_url, backup_url=server.rest_url, limiter=limiter)
+
+
+def test_rate_caps_calls_per_second(stand_in):
+    limiter = AdaptiveLimiter(LimiterPolicy(rate=20, burst=1))
+    with _client(stand_in, limiter) as client:
+        started = time.monotonic()
+        for _ in range(11):
+            client.get_address_info(*ADDRESS)
+        elapsed = time.monotonic() - started
+
+    # The first call spends the burst; the other ten wait for a token each
+    assert elapsed >= 0.45
+    assert limiter.stats().acquired == 11
+
+
+def test_limit_caps_concurrent_calls():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=2, max_limit=2))
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=100)) as server:
+        with _client(server, limiter) as client:
+            started = time.monotonic()
+            with ThreadPoolExecutor(6) as pool:
+                list(pool.map(lambda _: client.get_address_info(*ADDRESS), range(6)))
+            elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.3
+    stats = limiter.stats()
+    assert (stats.limit, stats.in_flight, stats.acquired) == (2, 0, 6)
+    assert stats.waited >= 4
+
+
+def test_overloaded_service_shrinks_the_limit():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=8))
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1, error_rate=1)) as server:
+        with _client(server, limiter) as client:
+            with pytest.raises(RetryableError):
+                client.get_address_info(*ADDRESS)
+
+    stats = limiter.stats()
+    assert stats.limit < 8
+    assert stats.decreases >= 1
+    assert stats.in_flight == 0
+
+
+def test_burst_of_failures_cuts_the_limit_once():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=10))
+    permits = [limiter.acquire() for _ in range(5)]
+    for permit in permits:
+        limiter.release(permit, OVERLOAD)
+
+    assert limiter.limit == 7
+    assert limiter.stats().decreases == 1
+
+
+def test_acquire_times_out_when_limit_is_in_use():
+    limiter = AdaptiveLimiter(LimiterPolicy(initial_limit=1, min_limit=1, max_wait=0.05))
+    limiter.acquire()
+    with pytest.raises(LimiterTimeout):
+        limiter.acquire()
+    assert limiter.stats().timeouts == 1
@@ -0,0 +1,37 @@
+import pytest
+
+from address_validation_international import AVIRestClient, MetricsCollector
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+def _in_flight(metrics: MetricsCollector) -> float:
+    return sum(value for name, _, value in metrics.snapshot()["gauges"] if name == "avi_attempts_in_flight")
+
+
+def test_calls_and_attempts_are_counted(stand_in):
+    metrics = MetricsCollector()
+    with AVIRestClient(primary_url=stand_in.rest_url, backup_url=stand_in.rest_url, observers=[metrics]) as client:
+        for _ in range(3):
+            client.get_address_info(*ADDRESS)
+
+    assert metrics.counter("avi_calls_total", client="rest", outcome="ok") == 3
+    assert metrics.counter("avi_attempts_total", role="primary", outcome="ok") == 3
+    assert metrics.histogram("avi_attempt_duration_seconds", role="primary").count == 3
+    assert _in_flight(metrics) == 0
+
+
+class _GarbledClient(AVIRestClient):
+    def _get(self, url, params, timeout):
+        raise ValueError("200 reply that is not JSON")
+
+
+def test_unexpected_attempt_errors_still_end_the_attempt(stand_in):
+    metrics = MetricsCollector()
+    with _GarbledClient(primary_url=stand_in.rest_url, backup_url=stand_in.rest_url, observers=[metrics]) as client:
+        with pytest.raises(ValueError):
+            client.get_address_info(*ADDRESS)
+
+    assert metrics.counter("avi_attempts_total", outcome="exception") == 1
+    assert metrics.histogram("avi_attempt_duration_seconds").count == 1
+    assert _in_flight(metrics) == 0
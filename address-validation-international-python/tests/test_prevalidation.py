@@ -0,0 +1,17 @@
+import math
+
+from address_validation_international.avi_prevalidation import prevalidate
+from address_validation_international.avi_response import GetAddressInfoInput
+
+
+def test_non_text_fields_are_checked_as_text():
+    item, error = prevalidate(GetAddressInfoInput(Address1="27 E Cota St", PostalCode=93101, Country="US",
+                                                  LicenseKey=12345))
+    assert error is None
+    assert item.Country == "USA"
+
+
+def test_nan_postal_code_is_blank():
+    _, error = prevalidate(GetAddressInfoInput(Address1="27 E Cota St", PostalCode=math.nan, Country="USA",
+                                               LicenseKey="key"))
+    assert error is not None
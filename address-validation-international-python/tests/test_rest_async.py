@@ -0,0 +1,33 @@
+import asyncio
+import subprocess
+import sys
+import warnings
+
+from address_validation_international import AVIAsyncRestClient
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+def test_client_survives_successive_event_loops(stand_in):
+    client = AVIAsyncRestClient(primary_url=stand_in.rest_url, backup_url=stand_in.rest_url)
+    sessions = []
+
+    async def call():
+        response = await client.get_address_info(*ADDRESS)
+        sessions.append(client._session)
+        return response.AddressInfo.Status
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        assert asyncio.run(call()) == "Validated"
+        assert asyncio.run(call()) == "Validated"
+        asyncio.run(client.close())
+
+    # Each loop got its own pool, and asyncio.run closed it on the way out
+    assert sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+
+
+def test_import_does_not_load_requests():
+    code = "import sys\nfrom address_validation_international import AVIAsyncRestClient\nprint('requests' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.strip() == "False"
@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from address_validation_international import AVIRestClient, DeadlineExceeded, RetryableError, RetryPolicy
+from address_validation_international.avi_retry import Deadline
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+def _client(server, **options):
+    return AVIRestClient(primary_url=server.rest_url, backup_url=server.rest_url, **options)
+
+
+@pytest.fixture
+def flaky_stand_in():
+    config = StandInConfig(latency_ms=1, error_rate=0.3, drop_rate=0.2, seed=1)
+    with StandInServer(host="127.0.0.1", port=0, config=config) as server:
+        yield server
+
+
+def test_transient_failures_are_retried_until_they_succeed(flaky_stand_in):
+    with _client(flaky_stand_in, retry=RetryPolicy(max_retries=20, base_delay=0.001, max_delay=0.01)) as client:
+        responses = [client.get_address_info(*ADDRESS) for _ in range(20)]
+
+    assert all(response.AddressInfo.Status == "Validated" for response in responses)
+    stats = flaky_stand_in.stats()
+    assert stats.errors_injected + stats.drops > 0
+
+
+def test_without_retries_transient_failures_surface(flaky_stand_in):
+    failures = 0
+    with _client(flaky_stand_in) as client:
+        for _ in range(20):
+            try:
+                client.get_address_info(*ADDRESS)
+            except RetryableError:
+                failures += 1
+
+    assert failures > 0
+
+
+def test_slow_service_raises_deadline_exceeded():
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=300)) as server:
+        with _client(server) as client:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                client.get_address_info(*ADDRESS, True, 0.1)
+            elapsed = time.monotonic() - started
+
+    assert elapsed < 0.25
+
+
+def test_retries_never_outlast_the_deadline():
+    retry = RetryPolicy(max_retries=1000, base_delay=0.02, max_delay=0.02, jitter=0)
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1, error_rate=1)) as server:
+        with _client(server, retry=retry) as client:
+            started = time.monotonic()
+            with pytest.raises((RetryableError, DeadlineExceeded)):
+                client.get_address_info(*ADDRESS, True, 0.3)
+            elapsed = time.monotonic() - started
+
+    assert elapsed < 0.4
+
+
+def test_retry_delay_grows_and_is_capped():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3, multiplier=2, jitter=0)
+    assert [policy.delay(retry) for retry in range(3)] == [0.1, 0.2, 0.3]
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
+
+
+def test_deadline_cuts_attempt_timeouts():
+    assert Deadline(None).timeouts(3, 10) == (3, 10, False)
+    connect, read, cut = Deadline(5).timeouts(3, 10)
+    assert connect == 3 and 4.9 < read <= 5 and cut
+    deadline = Deadline(0)
+    assert deadline.expired()
+    with pytest.raises(DeadlineExceeded):
+        deadline.timeouts(3, 10)
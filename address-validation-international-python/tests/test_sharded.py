@@ -0,0 +1,70 @@
+import csv
+import os
+
+from address_validation_international import ShardedRunner
+from address_validation_international.avi_bulk import main
+from address_validation_international.avi_response import GetAddressInfoInput
+from address_validation_international.avi_sharded import ShardConfig
+
+
+def _write_input(path, rows):
+    lines = [f"{number} Main St,93101,USA\n" for number in range(1, rows + 1)]
+    path.write_text("Address1,PostalCode,Country\n" + "".join(lines))
+
+
+def _read(path):
+    with open(path, newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def _bulk(server, *args):
+    return main([*map(str, args), "--license-key", "key",
+                 "--primary-url", server.rest_url, "--backup-url", server.rest_url])
+
+
+def test_sharded_output_matches_single_process(stand_in, tmp_path):
+    source = tmp_path / "in.csv"
+    _write_input(source, 10)
+
+    assert _bulk(stand_in, source, tmp_path / "single.csv") == 0
+    assert _bulk(stand_in, source, tmp_path / "sharded.csv", "--processes", 2, "--chunk-size", 3) == 0
+
+    single, sharded = _read(tmp_path / "single.csv"), _read(tmp_path / "sharded.csv")
+    assert [row["Row"] for row in sharded] == [str(row) for row in range(1, 11)]
+    assert sharded == single
+
+
+def test_per_shard_writes_one_part_per_chunk_and_resumes(stand_in, tmp_path):
+    source = tmp_path / "in.csv"
+    _write_input(source, 7)
+    parts = tmp_path / "parts"
+    args = (source, parts, "--processes", 2, "--chunk-size", 3, "--per-shard", "--output-format", "csv")
+
+    assert _bulk(stand_in, *args) == 0
+    names = sorted(os.listdir(parts))
+    assert names == ["part-0000000001-0000000003.csv", "part-0000000004-0000000006.csv",
+                     "part-0000000007-0000000007.csv"]
+    rows = [row for name in names for row in _read(parts / name)]
+    assert [row["Row"] for row in rows] == [str(row) for row in range(1, 8)]
+    assert {row["Status"] for row in rows} == {"Validated"}
+
+    # Every part exists, so a second run validates nothing
+    requests = stand_in.stats().requests
+    assert _bulk(stand_in, *args) == 0
+    assert stand_in.stats().requests == requests
+
+
+def test_runner_counts_rows_chunks_and_duplicates(stand_in):
+    endpoints = {"primary_url": stand_in.rest_url, "backup_url": stand_in.rest_url}
+    runner = ShardedRunner(ShardConfig(threads=2, endpoints=endpoints), processes=2, chunk_size=4)
+    inputs = [GetAddressInfoInput(Address1=f"{number % 3} Main St", PostalCode="93101", Country="USA",
+                                  LicenseKey="key") for number in range(8)]
+
+    chunks = list(runner.run(inputs))
+
+    assert [chunk.first_row for chunk in chunks] == [1, 5]
+    assert "".join(chunk.text for chunk in chunks).count("Validated") == 8
+    stats = runner.stats()
+    assert (stats.rows, stats.chunks, stats.failures, stats.chunks_abandoned) == (8, 2, 0, 0)
+    # Each chunk of four holds three distinct addresses
+    assert stats.duplicates == 2
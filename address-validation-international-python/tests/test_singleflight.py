@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from address_validation_international import AVIAsyncRestClient, AVIRestClient
+from address_validation_international.avi_retry import DeadlineExceeded
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+
+@pytest.fixture
+def slow_stand_in():
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=300)) as server:
+        yield server
+
+
+def test_concurrent_calls_share_one_upstream_call(slow_stand_in):
+    with AVIRestClient(primary_url=slow_stand_in.rest_url, backup_url=slow_stand_in.rest_url,
+                       single_flight=True) as client:
+        start = threading.Barrier(4)
+
+        def call():
+            start.wait()
+            return client.get_address_info(*ADDRESS)
+
+        with ThreadPoolExecutor(4) as pool:
+            responses = list(pool.map(lambda _: call(), range(4)))
+        stats = client.single_flight_stats()
+
+    assert all(response.AddressInfo.Status == "Validated" for response in responses)
+    assert slow_stand_in.stats().requests == 1
+    assert (stats.calls, stats.collapsed) == (1, 3)
+
+
+def test_waiter_gives_up_at_its_own_deadline(slow_stand_in):
+    with AVIRestClient(primary_url=slow_stand_in.rest_url, backup_url=slow_stand_in.rest_url,
+                       single_flight=True) as client:
+        with ThreadPoolExecutor(1) as pool:
+            leader = pool.submit(client.get_address_info, *ADDRESS, True, 5)
+            time.sleep(0.05)
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                client.get_address_info(*ADDRESS, True, 0.1)
+            waited = time.monotonic() - started
+            assert leader.result().AddressInfo.Status == "Validated"
+
+    assert waited < 0.25
+    assert slow_stand_in.stats().requests == 1
+
+
+def test_async_waiter_gives_up_at_its_own_deadline(slow_stand_in):
+    client = AVIAsyncRestClient(primary_url=slow_stand_in.rest_url, backup_url=slow_stand_in.rest_url,
+                                single_flight=True)
+
+    async def main():
+        async with client:
+            leader = asyncio.ensure_future(client.get_address_info(*ADDRESS, True, 5))
+            await asyncio.sleep(0.05)
+            with pytest.raises(DeadlineExceeded):
+                await client.get_address_info(*ADDRESS, True, 0.1)
+            return await leader
+
+    assert asyncio.run(main()).AddressInfo.Status == "Validated"
+    assert slow_stand_in.stats().requests == 1
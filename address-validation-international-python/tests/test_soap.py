@@ -0,0 +1,22 @@
+from address_validation_international import GetAddressInfoInput, GetAddressInfoSoap
+
+
+def test_validate_many_reuses_pooled_connections(stand_in, tmp_path):
+    inputs = [GetAddressInfoInput(Address1=f"{number} Main St", PostalCode="93101", Country="USA")
+              for number in range(60)]
+    with GetAddressInfoSoap("key", primary_wsdl=stand_in.wsdl_url, backup_wsdl=stand_in.wsdl_url,
+                            cache_location=str(tmp_path)) as service:
+        results = list(service.validate_many(inputs, max_workers=4, dedup=False))
+
+    assert [result.response.AddressInfo.Status for result in results] == ["Validated"] * 60
+    # One connection per worker, plus the WSDL download
+    assert stand_in.stats().connections <= 5
+
+
+def test_keep_alive_off_closes_every_connection(stand_in, tmp_path):
+    with GetAddressInfoSoap("key", primary_wsdl=stand_in.wsdl_url, backup_wsdl=stand_in.wsdl_url,
+                            cache_location=str(tmp_path), keep_alive=False) as service:
+        for _ in range(3):
+            service.get_address_info("27 E Cota St", "", "", "", "", "", "", "93101", "USA", "ENGLISH")
+
+    assert stand_in.stats().connections == 4
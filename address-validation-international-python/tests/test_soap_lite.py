@@ -0,0 +1,70 @@
+import pytest
+from xml.etree.ElementTree import ParseError
+
+from address_validation_international import AVIRestClient
+from address_validation_international.avi_retry import RetryableError
+from address_validation_international.soap.get_address_info_soap_lite import AVISoapLiteClient, parse_envelope
+
+from avi_stand_in import StandInConfig, StandInServer
+
+ADDRESS = ("27 E Cota St", "", "", "", "", "Santa Barbara", "CA", "93101", "USA", "ENGLISH", "key")
+
+REPLY = (
+    b'<?xml version="1.0" encoding="utf-8"?>'
+    b'<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/"><s:Body>'
+    b'<GetAddressInfoResponse xmlns="http://www.serviceobjects.com"><GetAddressInfoResult '
+    b'xmlns:i="http://www.w3.org/2001/XMLSchema-instance">'
+    b'<AddressInfo><Status>Validated</Status><Address1>27 E COTA ST</Address1><Address2 i:nil="true"/>'
+    b'<InformationComponents><InformationComponent><Name>DPV</Name><Value>1</Value></InformationComponent>'
+    b'<InformationComponent><Name>Note</Name><Value>a &amp; b</Value></InformationComponent></InformationComponents>'
+    b'</AddressInfo><Error i:nil="true"/><Debug><string>ignored</string></Debug>'
+    b'</GetAddressInfoResult></GetAddressInfoResponse></s:Body></s:Envelope>'
+)
+
+
+def test_parse_envelope_reads_the_rest_payload_shape():
+    assert parse_envelope(REPLY) == {
+        "AddressInfo": {
+            "Status": "Validated",
+            "Address1": "27 E COTA ST",
+            "Address2": None,
+            "InformationComponents": [{"Name": "DPV", "Value": "1"}, {"Name": "Note", "Value": "a & b"}],
+        }
+    }
+
+
+@pytest.mark.parametrize("size", [1, 5, 64])
+def test_parse_envelope_streams_chunks(size):
+    chunks = (REPLY[start:start + size] for start in range(0, len(REPLY), size))
+    assert parse_envelope(chunks) == parse_envelope(REPLY)
+
+
+def test_parse_envelope_rejects_malformed_xml():
+    with pytest.raises(ParseError):
+        parse_envelope([REPLY[:100], b"</nope>"])
+
+
+def test_soap_lite_matches_rest(stand_in):
+    soap = AVISoapLiteClient(primary_url=stand_in.soap_url, backup_url=stand_in.soap_url)
+    rest = AVIRestClient(primary_url=stand_in.rest_url, backup_url=stand_in.rest_url)
+    try:
+        assert soap.get_address_info(*ADDRESS) == rest.get_address_info(*ADDRESS)
+    finally:
+        soap.close()
+        rest.close()
+
+
+def test_soap_lite_fails_over_on_service_errors(stand_in):
+    with StandInServer(host="127.0.0.1", port=0, config=StandInConfig(latency_ms=1, error_rate=1.0)) as failing:
+        client = AVISoapLiteClient(primary_url=failing.soap_url, backup_url=stand_in.soap_url)
+        try:
+            assert client.get_address_info(*ADDRESS).AddressInfo.Status == "Validated"
+        finally:
+            client.close()
+
+        client = AVISoapLiteClient(primary_url=failing.soap_url, backup_url=failing.soap_url)
+        try:
+            with pytest.raises(RetryableError, match="TypeCode"):
+                client.get_address_info(*ADDRESS)
+        finally:
+            client.close()